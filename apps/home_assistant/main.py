@@ -3,6 +3,8 @@ import requests
 import threading
 import config
 from PIL import Image, ImageDraw
+from core.ui import ScrollAccelerator
+from core.glyph_atlas import draw_text
 
 class App:
     def __init__(self, display, input_manager):
@@ -17,6 +19,7 @@ class App:
         self.cols = 2
         self.rows = 3 # Visible rows
         self.scroll_row = 0
+        self.accel = ScrollAccelerator() # Fast spins move a page at a time
         
         # Start fetching in background
         threading.Thread(target=self.fetch_entities, daemon=True).start()
@@ -91,15 +94,15 @@ class App:
         draw.rectangle((0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), fill=config.COLOR_BG)
         
         if self.loading:
-            draw.text((80, 140), "Loading...", fill=config.COLOR_TEXT)
+            draw_text(draw, (80, 140), "Loading...", fill=config.COLOR_TEXT)
             return
         elif self.error:
-            draw.text((20, 140), self.error, fill=config.COLOR_WARNING)
-            draw.text((20, 160), "Check config.py", fill=config.COLOR_TEXT)
+            draw_text(draw, (20, 140), self.error, fill=config.COLOR_WARNING)
+            draw_text(draw, (20, 160), "Check config.py", fill=config.COLOR_TEXT)
             return
             
         if not self.entities:
-            draw.text((50, 140), "No Entities", fill="gray")
+            draw_text(draw, (50, 140), "No Entities", fill="gray")
             return
 
         # Draw Grid
@@ -121,9 +124,10 @@ class App:
             
         visible_start_idx = self.scroll_row * self.cols
         
-        for i, entity in enumerate(self.entities):
-            if i < visible_start_idx: continue
-            if i >= visible_start_idx + (self.rows * self.cols): break
+        visible_end_idx = min(len(self.entities), visible_start_idx + (self.rows * self.cols))
+        
+        for i in range(visible_start_idx, visible_end_idx):
+            entity = self.entities[i]
             
             # Grid Position
             grid_idx = i - visible_start_idx
@@ -162,17 +166,18 @@ class App:
             # Center text
             bbox = draw.textbbox((0, 0), name)
             tw = bbox[2] - bbox[0]
-            draw.text((cx - tw // 2, y + cell_h - 25), name, fill="white")
+            draw_text(draw, (cx - tw // 2, y + cell_h - 25), name, fill="white")
 
     def handle_input(self, event):
         if self.loading or self.error:
             if event == 'back': return False
             return True
             
-        if event == 'left':
-            self.selected_index = max(0, self.selected_index - 1)
-        elif event == 'right':
-            self.selected_index = min(len(self.entities) - 1, self.selected_index + 1)
+        if event in ('left', 'right'):
+            delta = -1 if event == 'left' else 1
+            if self.accel.feed(delta) != ScrollAccelerator.STEP:
+                delta *= self.rows * self.cols
+            self.selected_index = max(0, min(len(self.entities) - 1, self.selected_index + delta))
         elif event == 'select':
             if self.entities:
                 e = self.entities[self.selected_index]
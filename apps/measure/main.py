@@ -1,9 +1,12 @@
-import time
 from PIL import ImageDraw
 import config
+from core import clock
 from core.ui import Menu
+from core.glyph_atlas import draw_text
 
 class App:
+    target_fps = 10 # Stopwatch shows tenths of a second
+
     def __init__(self, display, input_manager):
         self.display = display
         self.input = input_manager
@@ -24,37 +27,43 @@ class App:
     def toggle_stopwatch(self):
         if self.stopwatch_running:
             self.stopwatch_running = False
-            self.stopwatch_elapsed += time.time() - self.stopwatch_start
+            self.stopwatch_elapsed += clock.monotonic() - self.stopwatch_start
         else:
             self.stopwatch_running = True
-            self.stopwatch_start = time.time()
+            self.stopwatch_start = clock.monotonic()
 
     def update(self):
         if self.mode == 'menu':
             self.menu.update()
 
+    def next_redraw(self):
+        # Only the running stopwatch animates
+        if self.mode == 'stopwatch' and self.stopwatch_running:
+            return 1.0 / self.target_fps
+        return None
+
     def draw(self):
         draw = self.display.get_draw()
         draw.rectangle((0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), fill=config.COLOR_BG)
         
         if self.mode == 'menu':
-            self.menu.draw(draw)
+            self.menu.draw(draw, self.display.get_image())
             
         elif self.mode == 'stopwatch':
             current = self.stopwatch_elapsed
             if self.stopwatch_running:
-                current += time.time() - self.stopwatch_start
+                current += clock.monotonic() - self.stopwatch_start
             
             text = f"{current:.1f}s"
             # Centering text
             bbox = draw.textbbox((0, 0), text, font=self.menu.title_font)
             w = bbox[2] - bbox[0]
-            draw.text(((config.DISPLAY_WIDTH - w)//2, 140), text, font=self.menu.title_font, fill=config.COLOR_TEXT)
+            draw_text(draw, ((config.DISPLAY_WIDTH - w)//2, 140), text, font=self.menu.title_font, fill=config.COLOR_TEXT)
             
             msg = "Press Select to Start/Stop"
             bbox2 = draw.textbbox((0, 0), msg)
             w2 = bbox2[2] - bbox2[0]
-            draw.text(((config.DISPLAY_WIDTH - w2)//2, 200), msg, fill=(100, 100, 100))
+            draw_text(draw, ((config.DISPLAY_WIDTH - w2)//2, 200), msg, fill=(100, 100, 100))
             
         elif self.mode == 'ruler':
             # Draw Ruler
@@ -71,7 +80,7 @@ class App:
                 draw.line((config.DISPLAY_WIDTH, y, config.DISPLAY_WIDTH - length, y), fill=config.COLOR_TEXT, width=2)
                 
                 if mm % 10 == 0:
-                    draw.text((30, y - 5), f"{mm/10:.0f}cm", fill=config.COLOR_TEXT)
+                    draw_text(draw, (30, y - 5), f"{mm/10:.0f}cm", fill=config.COLOR_TEXT)
 
     def handle_input(self, event):
         if self.mode == 'menu':
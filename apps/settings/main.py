@@ -4,6 +4,7 @@ import os
 import config
 from core.ui import Menu, Keyboard
 from core import highscore
+from core.glyph_atlas import draw_text
 
 class App:
     def __init__(self, display, input_manager):
@@ -118,6 +119,19 @@ class App:
 
         return False # Default: Not handled
 
+    def handle_rotate(self, event):
+        # Coalesced encoder burst. List menus accelerate on their own (raw
+        # detents); the keyboard has no accelerator and takes the scaled steps
+        if self.mode == 'menu':
+            self.main_menu.move_selection(event['raw_steps'])
+        elif self.mode == 'wifi_scan' and hasattr(self, 'wifi_menu'):
+            self.wifi_menu.move_selection(event['raw_steps'])
+        elif self.mode == 'wifi_password':
+            self.keyboard.move_selection(event['steps'])
+
+    def next_redraw(self):
+        return None # Menus, keyboard and text pages only change on input
+
     def update(self):
         if self.mode == 'menu':
             self.main_menu.update()
@@ -135,24 +149,26 @@ class App:
             if hasattr(self, 'wifi_menu'):
                 self.wifi_menu.draw(draw, self.display.get_image())
             else:
-                draw.text((80, 140), "Scanning...", fill=config.COLOR_TEXT)
+                draw_text(draw, (80, 140), "Scanning...", fill=config.COLOR_TEXT)
                 
         elif self.mode == 'wifi_password':
-            self.keyboard.draw(draw)
-            draw.text((20, 40), f"Pass for {self.selected_ssid}", fill=config.COLOR_TEXT)
-            draw.text((20, 280), "Hold Select to OK", fill=(100, 100, 100)) # Hint
+            rects = self.keyboard.draw(draw, self.display.get_image())
+            draw_text(draw, (20, 40), f"Pass for {self.selected_ssid}", fill=config.COLOR_TEXT)
+            draw_text(draw, (20, 280), "Hold Select to OK", fill=(100, 100, 100)) # Hint
+            # Only the keys/field that changed (the hint text never moves)
+            return rects
             
         elif self.mode == 'highscores':
             scores = highscore.load_highscores()
             y = 40
-            draw.text((80, 10), "HIGHSCORES", font=self.main_menu.title_font, fill=config.COLOR_ACCENT)
+            draw_text(draw, (80, 10), "HIGHSCORES", font=self.main_menu.title_font, fill=config.COLOR_ACCENT)
             for game, score in scores.items():
-                draw.text((40, y), f"{game.title()}: {score}", font=self.main_menu.font, fill=config.COLOR_TEXT)
+                draw_text(draw, (40, y), f"{game.title()}: {score}", font=self.main_menu.font, fill=config.COLOR_TEXT)
                 y += 30
-            draw.text((60, 280), "Back to Return", fill=(100, 100, 100))
+            draw_text(draw, (60, 280), "Back to Return", fill=(100, 100, 100))
 
         elif self.mode == 'about':
-            draw.text((80, 20), "ABOUT", font=self.main_menu.title_font, fill=config.COLOR_ACCENT)
-            draw.text((20, 60), "Pi Handheld OS v1.0", fill=config.COLOR_TEXT)
-            draw.text((20, 90), "Python Based OS", fill=config.COLOR_TEXT)
-            draw.text((20, 120), "Created by Gemini", fill=config.COLOR_TEXT)
+            draw_text(draw, (80, 20), "ABOUT", font=self.main_menu.title_font, fill=config.COLOR_ACCENT)
+            draw_text(draw, (20, 60), "Pi Handheld OS v1.0", fill=config.COLOR_TEXT)
+            draw_text(draw, (20, 90), "Python Based OS", fill=config.COLOR_TEXT)
+            draw_text(draw, (20, 120), "Created by Gemini", fill=config.COLOR_TEXT)
@@ -1,6 +1,7 @@
 import time
 from PIL import ImageDraw
 import config
+from core.glyph_atlas import draw_text
 
 class App:
     def __init__(self, display, input_manager):
@@ -16,8 +17,8 @@ class App:
         draw.rectangle((0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), fill=(255, 255, 255))
         
         # Add a small hint text
-        draw.text((10, 10), "Torch On", fill=(0, 0, 0))
-        draw.text((10, 30), "Hold Back to Exit", fill=(0, 0, 0))
+        draw_text(draw, (10, 10), "Torch On", fill=(0, 0, 0))
+        draw_text(draw, (10, 30), "Hold Back to Exit", fill=(0, 0, 0))
         
         self.display.show()
         
@@ -63,7 +64,10 @@ class App:
     def update(self):
         pass
 
+    def next_redraw(self):
+        return None # Static screen
+
     def draw(self):
         draw = self.display.get_draw()
         draw.rectangle((0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), fill=(255, 255, 255))
-        draw.text((60, 150), "TORCH", fill=(0, 0, 0))
+        draw_text(draw, (60, 150), "TORCH", fill=(0, 0, 0))
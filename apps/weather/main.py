@@ -3,6 +3,7 @@ import threading
 import requests
 import config
 from PIL import ImageDraw
+from core.glyph_atlas import draw_text
 
 class App:
     def __init__(self, display, input_manager):
@@ -60,15 +61,15 @@ class App:
         draw.rectangle((0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), fill=config.COLOR_BG)
         
         if self.loading:
-            draw.text((80, 140), "Loading...", fill=config.COLOR_TEXT)
+            draw_text(draw, (80, 140), "Loading...", fill=config.COLOR_TEXT)
             return
             
         if self.error:
-            draw.text((20, 100), "Weather Error", fill=config.COLOR_WARNING)
-            draw.text((20, 130), self.error, fill=config.COLOR_TEXT)
+            draw_text(draw, (20, 100), "Weather Error", fill=config.COLOR_WARNING)
+            draw_text(draw, (20, 130), self.error, fill=config.COLOR_TEXT)
             if "API Key" in self.error:
-                draw.text((20, 160), "Check config.py", fill="gray")
-            draw.text((50, 240), "Press Select to Retry", fill="gray")
+                draw_text(draw, (20, 160), "Check config.py", fill="gray")
+            draw_text(draw, (50, 240), "Press Select to Retry", fill="gray")
             return
 
         if self.weather_data:
@@ -81,7 +82,7 @@ class App:
             
             # Draw
             # City
-            draw.text((20, 20 + config.TOP_BAR_HEIGHT), city, fill=config.COLOR_ACCENT)
+            draw_text(draw, (20, 20 + config.TOP_BAR_HEIGHT), city, fill=config.COLOR_ACCENT)
             
             # Temp (Large)
             unit = "C" if config.OWM_UNITS == "metric" else "F"
@@ -90,7 +91,7 @@ class App:
             # We don't have a huge font loaded in UI, but we can try default large
             # Or draw it manually/pixelated?
             # Let's just use the standard large font for now.
-            draw.text((20, 60 + config.TOP_BAR_HEIGHT), temp_str, fill="white", font=None) # Default font is small
+            draw_text(draw, (20, 60 + config.TOP_BAR_HEIGHT), temp_str, fill="white", font=None) # Default font is small
             # To make it bigger without loading a new font file (which might fail), 
             # we can't easily do it with default PIL font.
             # But we have `core.ui.load_font`. We can't access it easily here without importing UI.
@@ -99,18 +100,18 @@ class App:
             font_huge = load_font(60, bold=True)
             font_large = load_font(24)
             
-            draw.text((20, 50 + config.TOP_BAR_HEIGHT), temp_str, font=font_huge, fill="white")
+            draw_text(draw, (20, 50 + config.TOP_BAR_HEIGHT), temp_str, font=font_huge, fill="white")
             
             # Condition
-            draw.text((20, 130 + config.TOP_BAR_HEIGHT), desc, font=font_large, fill=config.COLOR_ACCENT)
+            draw_text(draw, (20, 130 + config.TOP_BAR_HEIGHT), desc, font=font_large, fill=config.COLOR_ACCENT)
             
             # Details
-            draw.text((20, 180 + config.TOP_BAR_HEIGHT), f"Humidity: {humidity}%", fill="gray")
-            draw.text((20, 210 + config.TOP_BAR_HEIGHT), f"Wind: {wind} m/s", fill="gray")
+            draw_text(draw, (20, 180 + config.TOP_BAR_HEIGHT), f"Humidity: {humidity}%", fill="gray")
+            draw_text(draw, (20, 210 + config.TOP_BAR_HEIGHT), f"Wind: {wind} m/s", fill="gray")
             
             # Last Update
             t_str = time.strftime("%H:%M", time.localtime(self.last_update))
-            draw.text((20, 280 + config.TOP_BAR_HEIGHT), f"Updated: {t_str}", fill="gray")
+            draw_text(draw, (20, 280 + config.TOP_BAR_HEIGHT), f"Updated: {t_str}", fill="gray")
 
     def handle_input(self, event):
         if event == 'back':
@@ -0,0 +1,482 @@
+import sys
+import time
+import random
+import argparse
+from PIL import Image, ImageDraw
+import config
+from core import rgb565
+
+def make_test_image():
+    # Noise + UI-like shapes so every bit of every channel gets exercised
+    rng = random.Random(1234)
+    img = Image.frombytes(
+        "RGB",
+        (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT),
+        bytes(rng.getrandbits(8) for _ in range(config.DISPLAY_WIDTH * config.DISPLAY_HEIGHT * 3))
+    )
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((10, 40, 230, 310), fill=(30, 30, 30), outline=config.COLOR_ACCENT, width=3)
+    draw.text((60, 150), "BENCHMARK", fill=config.COLOR_TEXT)
+    return img
+
+def time_call(func, arg, repeat):
+    func(arg) # Warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(arg)
+    return (time.perf_counter() - start) / repeat
+
+def bench_encoder(args):
+    print("RGB888 -> RGB565 encoder benchmark")
+    img = make_test_image()
+
+    # Pixel-exact equivalence against the original per-pixel loop
+    reference = rgb565.encode_loop(img)
+    ok = True
+    for name, func in rgb565.ENCODERS.items():
+        if func(img) != reference:
+            print(f"  {name}: MISMATCH against reference loop")
+            ok = False
+
+    for name, func in rgb565.ENCODERS.items():
+        repeat = 1 if name == 'loop' else args.repeat
+        t = time_call(func, img, repeat)
+        print(f"  {name:6s} {t * 1000:8.2f} ms/frame  ({1 / t:7.1f} fps max)")
+
+    print("Equivalence: " + ("OK" if ok else "FAILED"))
+    return 0 if ok else 1
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def bench_apps(args):
+    # Frame cost of every app/game on the headless backend (no display needed)
+    from core.display import DisplayManager
+    from core.input import InputManager
+    from core.app_manager import AppManager
+
+    display = DisplayManager(headless=True)
+    input_manager = InputManager(simulate=True)
+    manager = AppManager(display, input_manager)
+    inputs = [e for e in args.inputs.split(',') if e]
+
+    print(f"{'app':18s} {'p50 ms':>8s} {'p95 ms':>8s} {'max ms':>8s} {'KB/frame':>9s}")
+    for info in manager.apps + manager.games:
+        if args.only and info['id'] not in args.only:
+            continue
+
+        manager.launch_app(info)
+        app = manager.current_app
+        if not app:
+            continue
+
+        # Get past mode/difficulty menus into the actual screen
+        for event_name in inputs:
+            manager._route_input(event_name)
+
+        display.force_full_refresh()
+        sent_before = display.get_stats()['bytes_sent']
+        times = []
+        try:
+            for _ in range(args.frames):
+                start = time.perf_counter()
+                app.update()
+                app.draw()
+                manager.status_bar.draw(display.get_draw(), display.get_image())
+                display.show()
+                times.append((time.perf_counter() - start) * 1000)
+        except Exception as e:
+            print(f"{info['id']:18s} crashed: {e}")
+            manager.close_current_app()
+            continue
+
+        sent = display.get_stats()['bytes_sent'] - sent_before
+        print(f"{info['id']:18s} {percentile(times, 50):8.2f} {percentile(times, 95):8.2f} "
+              f"{max(times):8.2f} {sent / 1024 / len(times):9.1f}")
+        if args.capture:
+            display.capture(f"{args.capture}/{info['id']}.png")
+        manager.close_current_app()
+
+    from core.ui import icon_cache, fonts
+    stats = icon_cache.get_stats()
+    print(f"Icon cache: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions, "
+          f"{stats['entries']} entries ({stats['bytes'] / 1024:.0f} KB)")
+    stats = fonts.get_stats()
+    print(f"Fonts: {stats['fonts']} loaded, text bbox cache {stats['bbox_hits']} hits, {stats['bbox_misses']} misses")
+    return 0
+
+def bench_panel(args):
+    # Drive a game through the real hardware path into the fake ST7789 and check
+    # that the panel GRAM matches the framebuffer after every frame.
+    from core.display import DisplayManager
+    from core.fake_panel import FakeST7789
+    from core.input import InputManager
+    from core.app_manager import AppManager
+
+    print(f"Fake ST7789 @ {config.DISPLAY_BAUDRATE / 1e6:.1f} MHz, {args.frames} frames of '{args.app}'")
+    print(f"{'mode':8s} {'KB/frame':>9s} {'cmds/frame':>11s} {'windows':>8s} {'SPI ms/frame':>13s}  pixel-exact")
+
+    ok = True
+    for mode in args.modes:
+        panel = FakeST7789()
+        display = DisplayManager(panel=panel, encoder=args.encoder)
+        display.refresh_mode = mode
+        input_manager = InputManager(simulate=True)
+        manager = AppManager(display, input_manager)
+
+        info = [a for a in manager.apps + manager.games if a['id'] == args.app][0]
+        manager.launch_app(info)
+        random.seed(args.seed) # Same game for every mode
+        panel.take_frame_stats()
+
+        totals = {'bytes': 0, 'commands': 0, 'windows': 0, 'modeled_s': 0.0}
+        exact = True
+        expected = rgb565.get_encoder(args.encoder)
+        for _ in range(args.frames):
+            manager.current_app.update()
+            manager.current_app.draw()
+            display.show()
+            display.flush()
+            frame = panel.take_frame_stats()
+            for key in totals:
+                totals[key] += frame[key]
+            if panel.get_gram() != expected(display.get_image()):
+                exact = False
+
+        display.cleanup()
+        manager.close_current_app()
+        ok = ok and exact
+        n = args.frames
+        print(f"{mode:8s} {totals['bytes'] / 1024 / n:9.1f} {totals['commands'] / n:11.1f} "
+              f"{totals['windows'] / n:8.1f} {totals['modeled_s'] * 1000 / n:13.2f}  {'OK' if exact else 'MISMATCH'}")
+
+    return 0 if ok else 1
+
+def bench_menus(args):
+    # Pixels repainted per frame by the retained widget layer while scrolling
+    # the menus, and whether partial repaints match a full repaint.
+    from PIL import ImageChops
+    from core.ui import CarouselMenu, ListMenu
+    
+    labels = [f"Item {i:04d}" for i in range(args.items)]
+    menus = [
+        ('carousel', CarouselMenu([{'label': l} for l in ['Games', 'Tools', 'Apps', 'Settings']])),
+        ('list', ListMenu([{'label': l} for l in labels], title="Entities"))
+    ]
+    full = config.DISPLAY_WIDTH * config.DISPLAY_HEIGHT
+    
+    print(f"{'menu':10s} {'frames':>7s} {'px/frame':>9s} {'% of full':>10s} {'ms/frame':>9s}  exact")
+    ok = True
+    for name, menu in menus:
+        image = Image.new("RGB", (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT))
+        draw = ImageDraw.Draw(image)
+        menu.draw(draw, image)
+        before = menu.screen.get_stats()
+        
+        exact = True
+        frames = 0
+        elapsed = 0.0
+        for step in range(args.steps):
+            if name == 'carousel':
+                menu.move_selection(2) # Carousel moves every second detent
+            else:
+                menu.accel.last_time = 0 # Slow turn: one row per detent
+                menu.move_selection(1)
+            # Frames until the carousel slide settles, at ~60 fps
+            while True:
+                start = time.perf_counter()
+                menu.update()
+                menu.draw(draw, image)
+                elapsed += time.perf_counter() - start
+                frames += 1
+                if getattr(menu, 'anim_start', None) is None:
+                    break
+                time.sleep(1 / 60)
+        
+        # A full repaint of the same state must give the same pixels
+        partial = menu.screen.canvas.copy()
+        menu.screen.invalidate()
+        menu.draw(draw, image)
+        if ImageChops.difference(partial, menu.screen.canvas).getbbox():
+            exact = False
+        ok = ok and exact
+        
+        stats = menu.screen.get_stats()
+        pixels = (stats['pixels_redrawn'] - before['pixels_redrawn'] - full) / frames
+        print(f"{name:10s} {frames:7d} {pixels:9.0f} {pixels / full * 100:9.1f}% {elapsed * 1000 / frames:9.2f}  {'OK' if exact else 'MISMATCH'}")
+        
+    return 0 if ok else 1
+
+def bench_text(args):
+    # Text-heavy screens (game HUD + game over page, a settings page) drawn
+    # with draw.text() vs the glyph atlas, checked pixel-exact
+    from PIL import ImageChops
+    from core.glyph_atlas import draw_text, atlases
+    from core.ui import load_font
+    
+    title = load_font(config.FONT_SIZE_TITLE - 4, bold=True)
+    normal = load_font(config.FONT_SIZE_NORMAL)
+    
+    def screen(frame):
+        # (xy, text, font, fill); numbers change every frame like a live HUD
+        return [
+            ((10, 10), f"SCORE: {frame * 10}", None, "white"),
+            ((10, 25), f"FUEL: {1000 - frame % 1000}", None, "white"),
+            ((config.DISPLAY_WIDTH - 60, 10), f"LEVEL: {frame // 100 + 1}", None, "yellow"),
+            ((config.DISPLAY_WIDTH - 60, 25), f"VY: {(frame % 50) / 10 - 2.5:.1f}", None, "white"),
+            ((60, 100), "GAME OVER", None, config.COLOR_WARNING),
+            ((70, 140), f"Score: {frame * 10}", None, config.COLOR_TEXT),
+            ((50, 240), "Press Select to Restart", None, (100, 100, 100)),
+            ((60, 260), "Hold Back to Exit", None, (100, 100, 100)),
+            ((80, 10 + config.TOP_BAR_HEIGHT), "HIGHSCORES", title, config.COLOR_ACCENT),
+            ((40, 80), f"Snake: {frame}", normal, config.COLOR_TEXT),
+            ((40, 110), f"Pong: {frame * 2}", normal, config.COLOR_TEXT),
+            ((40, 140), f"Breakout: {frame * 3}", normal, config.COLOR_TEXT),
+        ]
+    
+    images = {}
+    times = {}
+    for name in ['pil', 'atlas']:
+        image = Image.new("RGB", (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT))
+        draw = ImageDraw.Draw(image)
+        start = time.perf_counter()
+        for frame in range(args.frames):
+            draw.rectangle((0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), fill=config.COLOR_BG)
+            for xy, text, font, fill in screen(frame):
+                if name == 'pil':
+                    draw.text(xy, text, font=font, fill=fill)
+                else:
+                    draw_text(draw, xy, text, font=font, fill=fill)
+        times[name] = (time.perf_counter() - start) / args.frames
+        images[name] = image
+        
+    exact = not ImageChops.difference(images['pil'], images['atlas']).getbbox()
+    print(f"{len(screen(0))} strings/frame, {args.frames} frames")
+    for name in ['pil', 'atlas']:
+        print(f"  {name:6s} {times[name] * 1000:7.2f} ms/frame")
+    for font, atlas in atlases.items():
+        stats = atlas.get_stats()
+        print(f"  atlas {getattr(font, 'size', '?')}px: {stats['glyphs']} glyphs, "
+              f"{stats['hits']} string hits, {stats['misses']} misses")
+    print("Pixel-exact: " + ("OK" if exact else "MISMATCH"))
+    return 0 if exact else 1
+
+def bench_idle(args):
+    # CPU used by the main loop sitting on the main menu, per render mode
+    import threading
+    from core.display import DisplayManager
+    from core.input import InputManager
+    from core.app_manager import AppManager
+
+    print(f"Idle main menu for {args.seconds:.0f}s per render mode (headless)")
+    for mode in ['fixed', 'event']:
+        config.RENDER_MODE = mode
+        display = DisplayManager(headless=True)
+        manager = AppManager(display, InputManager(simulate=True))
+
+        thread = threading.Thread(target=manager.run, daemon=True)
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        thread.start()
+        time.sleep(args.seconds)
+        manager.stop()
+        thread.join()
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+
+        frames = display.get_stats()['show_calls']
+        print(f"  {mode:6s} CPU {cpu / wall * 100:5.1f}%  frames {frames:5d} ({frames / wall:5.1f}/s)")
+
+    return 0
+
+def bench_evdev(args):
+    # Kernel input backend on a fake event device: decoding, hold detection, cost
+    from core.input import InputManager
+    from core.evdev_input import EvdevReader, KEY_ENTER, KEY_ESC
+    from tests.fake_evdev import FakeEvdevDevice
+
+    manager = InputManager(simulate=True)
+    encoder = FakeEvdevDevice("rotary@11")
+    button = FakeEvdevDevice("button@16")
+    config.LONG_PRESS_TIME = 0.2
+    reader = EvdevReader(manager._trigger, [encoder, button], manager.gestures).start()
+
+    def settle(seconds=0.05):
+        time.sleep(seconds)
+        manager.dispatch_events()
+
+    received = []
+    manager.on('rotate', lambda event: received.append(('press', event['raw_steps']) if event['pressed'] else event['raw_steps']))
+    for name in ['select', 'back', 'double_click', 'repeat']:
+        manager.on(name, lambda name=name: received.append(name))
+
+    ok = True
+    def check(label, expected):
+        nonlocal ok
+        settle()
+        got, received[:] = list(received), []
+        passed = expected(got) if callable(expected) else got == expected
+        ok = ok and passed
+        print(f"  {label:28s} {'OK' if passed else f'FAILED: got {got}, expected {expected}'}")
+
+    print("evdev backend on a fake device")
+    encoder.rotate(1); settle(); encoder.rotate(1)
+    check("relative steps", [1, 1])
+    encoder.rotate(-3)
+    check("relative burst", [-3])
+    encoder.rotate(2, relative=False); settle() # First ABS report only sets the origin
+    encoder.rotate(1, relative=False); settle(); encoder.rotate(-2, relative=False)
+    check("absolute axis", [1, -2])
+    button.click()
+    check("short press", ['select'])
+    button.press(); time.sleep(0.3); button.release()
+    check("long press", ['back'])
+    button.click(KEY_ESC)
+    check("back key", ['back'])
+    time.sleep(config.DOUBLE_CLICK_TIME)
+    button.click(); button.click()
+    check("double click", ['select', 'double_click'])
+    button.press(); encoder.rotate(2); button.release()
+    check("press and turn", [('press', 2)])
+
+    # Auto-fire view: tap then hold must keep repeating, never turn into 'back'
+    config.HOLD_REPEAT_DELAY = 0.1
+    manager.set_hold_repeat(True)
+    time.sleep(config.DOUBLE_CLICK_TIME)
+    button.click(); button.press(); time.sleep(0.4); button.release()
+    check("tap then hold (auto-fire)", lambda got: got[:2] == ['select', 'repeat'] and set(got[1:]) == {'repeat'})
+    manager.set_hold_repeat(False)
+
+    # Throughput: detents decoded per second by the reader thread
+    count = args.events
+    before = reader.get_stats()['triggers']
+    start = time.perf_counter()
+    for i in range(count):
+        encoder.rotate(1 if i % 2 else -1)
+        if i % 64 == 63:
+            manager.dispatch_events()
+    while reader.get_stats()['triggers'] < before + count:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    manager.dispatch_events()
+    print(f"  {count} detents in {elapsed * 1000:.1f} ms ({count / elapsed:,.0f}/s), "
+          f"reads {reader.get_stats()['reads']}")
+
+    reader.stop()
+    encoder.close()
+    button.close()
+    print("Decoding: " + ("OK" if ok else "FAILED"))
+    return 0 if ok else 1
+
+class TimingMotor:
+    # Records how long the motor pin was on
+    def __init__(self):
+        self.on_since = None
+        self.on_time = 0.0
+        self.switches = 0
+
+    def on(self):
+        if self.on_since is None:
+            self.on_since = time.perf_counter()
+            self.switches += 1
+
+    def off(self):
+        if self.on_since is not None:
+            self.on_time += time.perf_counter() - self.on_since
+            self.on_since = None
+
+    def close(self):
+        pass
+
+def bench_haptic(args):
+    # One haptic worker vs a thread per vibration, on a timing stand-in for the motor
+    import threading
+    from core.haptic import HapticManager
+
+    print(f"Encoder spin: {args.ticks} ticks, {args.interval * 1000:.0f} ms apart")
+    motor = TimingMotor()
+    haptic = HapticManager(motor=motor)
+    threads_before = threading.active_count()
+    peak_threads = 0
+    for _ in range(args.ticks):
+        haptic.vibrate(config.HAPTIC_DURATION_SHORT, 0.3, tick=True)
+        peak_threads = max(peak_threads, threading.active_count() - threads_before)
+        time.sleep(args.interval)
+    time.sleep(config.HAPTIC_DURATION_SHORT * 3)
+    stats = haptic.get_stats()
+    print(f"  extra threads (peak): {peak_threads} (was one per tick: {args.ticks})")
+    print(f"  played {stats['played']}, merged {stats['merged']}, "
+          f"stale dropped {stats['dropped_stale']}, queue full {stats['dropped_full']}")
+
+    # Software PWM: measured duty cycle against the requested intensity
+    ok = True
+    for intensity in [0.25, 0.5, 0.75, 1.0]:
+        motor.on_time = 0.0
+        played = haptic.get_stats()['played']
+        haptic.vibrate(0.2, intensity)
+        while haptic.get_stats()['played'] == played:
+            time.sleep(0.005)
+        duty = motor.on_time / 0.2
+        close = abs(duty - intensity) < 0.1
+        ok = ok and close
+        print(f"  intensity {intensity:.2f}: duty {duty:.2f} {'OK' if close else 'OFF'}")
+    haptic.cleanup()
+    print("PWM duty: " + ("OK" if ok else "FAILED"))
+    return 0 if ok else 1
+
+def main():
+    parser = argparse.ArgumentParser(description='Pi Handheld OS micro-benchmarks')
+    sub = parser.add_subparsers(dest='bench')
+
+    p = sub.add_parser('encoder', help='RGB565 framebuffer encoders')
+    p.add_argument('--repeat', type=int, default=50)
+    p.set_defaults(func=bench_encoder)
+
+    p = sub.add_parser('apps', help='Per-app frame cost on the headless display')
+    p.add_argument('--frames', type=int, default=200)
+    p.add_argument('--inputs', default='select,select', help='Events sent after launch (comma separated)')
+    p.add_argument('--only', nargs='*', help='App/game ids to run (default: all)')
+    p.add_argument('--capture', help='Directory to save the last frame of each app as PNG')
+    p.set_defaults(func=bench_apps)
+
+    p = sub.add_parser('panel', help='Bandwidth and pixel-exactness on the fake ST7789')
+    p.add_argument('--app', default='breakout')
+    p.add_argument('--frames', type=int, default=100)
+    p.add_argument('--modes', nargs='*', default=['full', 'auto', 'tiles'])
+    p.add_argument('--encoder', default='auto')
+    p.add_argument('--seed', type=int, default=1)
+    p.set_defaults(func=bench_panel)
+
+    p = sub.add_parser('menus', help='Pixels repainted per frame by the widget layer')
+    p.add_argument('--items', type=int, default=500, help='Rows in the list menu')
+    p.add_argument('--steps', type=int, default=20, help='Selection moves per menu')
+    p.set_defaults(func=bench_menus)
+
+    p = sub.add_parser('text', help='Glyph-atlas text vs draw.text on text-heavy screens')
+    p.add_argument('--frames', type=int, default=300)
+    p.set_defaults(func=bench_text)
+
+    p = sub.add_parser('evdev', help='Kernel input backend decoding on a fake event device')
+    p.add_argument('--events', type=int, default=5000)
+    p.set_defaults(func=bench_evdev)
+
+    p = sub.add_parser('haptic', help='Haptic worker under an encoder spin, software PWM duty')
+    p.add_argument('--ticks', type=int, default=100)
+    p.add_argument('--interval', type=float, default=0.005)
+    p.set_defaults(func=bench_haptic)
+
+    p = sub.add_parser('idle', help='Idle CPU on the main menu, fixed vs event-driven loop')
+    p.add_argument('--seconds', type=float, default=5)
+    p.set_defaults(func=bench_idle)
+
+    args = parser.parse_args()
+    if not hasattr(args, 'func'):
+        parser.print_help()
+        return 1
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
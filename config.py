@@ -20,7 +20,12 @@ PIN_HAPTIC = 26
 DISPLAY_WIDTH = 240
 DISPLAY_HEIGHT = 320
 DISPLAY_ROTATION = 90
-DISPLAY_BAUDRATE = 24000000
+DISPLAY_BAUDRATE = 40000000 # Overridden by "display_baudrate" in config.json (see --calibrate-spi)
+DISPLAY_SPI_CHUNK = 0 # Bytes per SPI transfer, 0 = spidev bufsiz
+DISPLAY_ENCODER = "auto" # auto, numpy, pil, loop (see core/rgb565.py)
+DISPLAY_REFRESH_MODE = "auto" # auto, tiles, manual, full (see DisplayManager.invalidate)
+DISPLAY_TILE_SIZE = 16 # Tile edge (px) for the 'tiles' refresh mode
+DISPLAY_ASYNC = True # Send frames from a background presenter thread (hardware only)
 
 # ==========================================
 # UI THEME
@@ -40,9 +45,29 @@ FONT_SIZE_TITLE = 32
 # SYSTEM SETTINGS
 # ==========================================
 ANIMATION_SPEED = 0.1
+MENU_SLIDE_TIME = 0.2 # Seconds for the main menu to slide to the next card
+LIST_FAST_INTERVAL = 0.08 # Encoder detents closer than this count as a fast spin (lists page/jump)
+LIST_JUMP_OVERLAY_TIME = 0.6 # Seconds the letter stays on screen after a jump
+RENDER_MODE = "event" # event: redraw on input/timers only, fixed: redraw every 30 ms
+GAME_UPDATE_RATE = 30 # Logic steps per second for games (see core/timestep.py)
 LONG_PRESS_TIME = 1.0
+INPUT_BACKEND = "auto" # auto: kernel evdev devices if present, else gpiozero; or "evdev" / "gpiozero"
+EVDEV_DEVICE_NAMES = ["rotary", "button", "gpio-keys", "gpio_keys"] # Input device names to use (substring match)
+EVDEV_KEY_SELECT = 28 # KEY_ENTER: encoder push button (short press select, hold back)
+EVDEV_KEY_BACK = 1 # KEY_ESC: optional dedicated back button
+DOUBLE_CLICK_TIME = 0.3 # Max seconds between two clicks for a double click
+HOLD_REPEAT_DELAY = 0.4 # Hold this long before 'repeat' events start (views with hold_repeat = True)
+HOLD_REPEAT_RATE = 8 # 'repeat' events per second while held
+INPUT_QUEUE_SIZE = 64 # Pending input events kept while the main loop is busy (oldest dropped)
+ENCODER_IDLE_GAP = 0.25 # Seconds between detents after which a turn counts as a new, slow one
+ENCODER_ACCEL_CURVE = [(0, 1), (15, 2), (30, 4)] # (steps per second, step multiplier), ascending
+LATENCY_SAMPLES = 1000 # Input-to-photon samples kept per view for percentiles (core/latency.py)
+LATENCY_BUCKETS_MS = [10, 20, 33, 50, 75, 100, 150, 250, 500] # Histogram bucket upper bounds
 HAPTIC_DURATION_SHORT = 0.05 # 50ms for reliable tick
 HAPTIC_DURATION_LONG = 0.15   # 150ms for bump
+HAPTIC_PWM_HZ = 200 # Software PWM rate for vibration intensity
+HAPTIC_QUEUE_SIZE = 8 # Patterns waiting to play (more are dropped)
+HAPTIC_STALE_TIME = 0.1 # Ticks that waited longer than this are skipped
 TOP_BAR_HEIGHT = 30
 
 # ==========================================
@@ -87,6 +112,8 @@ OWM_UNITS = _config_data['owm_units']
 WIFI_SSID = _config_data['wifi_ssid']
 WIFI_PASSWORD = _config_data['wifi_password']
 
+DISPLAY_BAUDRATE = int(_config_data.get('display_baudrate', DISPLAY_BAUDRATE))
+
 SHORTCUT_APP = _config_data.get('shortcut_app', 'torch')
 ICONS = _config_data.get('icons', {})
 
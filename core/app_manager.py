@@ -2,9 +2,86 @@ import os
 import sys
 import importlib
 import time
+import threading
 from core.ui import CarouselMenu, ListMenu, StatusBar
+from core.latency import tracker as latency_tracker
+from core import clock
 import config
 
+FRAME_INTERVAL = 0.03 # Default continuous redraw period (~33 Hz), see App.target_fps
+MIN_FRAME_INTERVAL = 0.016 # Input-triggered redraws are capped at ~60 Hz
+SIM_POLL_INTERVAL = 0.03 # pygame events must be polled from the main thread
+
+class FramePacer:
+    # Paces frames against a monotonic deadline, so render time does not add to
+    # the frame period. When a frame starts more than one period late, the next
+    # update still runs but its draw is skipped (at most max_skipped in a row).
+    def __init__(self, max_skipped=2):
+        self.max_skipped = max_skipped
+        self.due = None # When the next frame is due (None = idle, waiting for input)
+        self.frame_due = None # When the current frame was due
+        self.period = FRAME_INTERVAL
+        self.skipped_in_row = 0
+        self.last_draw_start = None
+        self.stats = {
+            'fps': 0.0,
+            'jitter_ms': 0.0,
+            'frame_ms': 0.0,
+            'skipped_draws': 0,
+            'late_frames': 0
+        }
+
+    def begin_frame(self, now):
+        self.frame_due = self.due
+        # Over budget: behind by more than a whole frame
+        if self.frame_due is not None and now - self.frame_due > self.period:
+            self.stats['late_frames'] += 1
+            if self.skipped_in_row < self.max_skipped:
+                self.skipped_in_row += 1
+                self.stats['skipped_draws'] += 1
+                return False
+        self.skipped_in_row = 0
+        return True
+
+    def end_frame(self, start, drew):
+        end = clock.monotonic()
+        if not drew:
+            return
+        self.stats['frame_ms'] = self.stats['frame_ms'] * 0.9 + (end - start) * 1000 * 0.1
+        if self.last_draw_start is not None and self.due is not None:
+            # Achieved rate and deviation from the target period (smoothed)
+            interval = start - self.last_draw_start
+            if interval > 0:
+                self.stats['fps'] = self.stats['fps'] * 0.9 + (1.0 / interval) * 0.1
+                self.stats['jitter_ms'] = self.stats['jitter_ms'] * 0.9 + abs(interval - self.period) * 1000 * 0.1
+        self.last_draw_start = start
+
+    def schedule(self, frame_start, delay):
+        # Returns the deadline for the next frame (None = no deadline)
+        if delay is None:
+            self.due = None
+            self.last_draw_start = None
+            return None
+            
+        self.period = delay
+        if self.due is None:
+            self.due = frame_start + delay
+        elif frame_start >= self.due:
+            self.due += delay
+            # Hopelessly behind (e.g. app launch): resync instead of bursting
+            if self.due < frame_start - 4 * delay:
+                self.due = frame_start + delay
+        else:
+            # Early frame triggered by input: keep the cadence, unless the view
+            # now wants frames sooner (e.g. a game launched from an idle menu)
+            self.due = min(self.due, frame_start + delay)
+        return self.due
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['target_fps'] = 1.0 / self.period if self.period else 0.0
+        return stats
+
 class AppManager:
     def __init__(self, display_manager, input_manager):
         self.display = display_manager
@@ -12,12 +89,23 @@ class AppManager:
         self.apps = []
         self.games = []
         self.current_app = None
+        self.current_app_name = None # For per-app stats
         self.running = True
         
         self.main_menu = None
         self.sub_menu = None # For categories
         self.status_bar = StatusBar()
         
+        # Event-driven rendering (config.RENDER_MODE == "event")
+        self.redraw_needed = True
+        self.wakeup = threading.Event()
+        self.pacer = FramePacer()
+        self.last_drawn_view = None # For damage reporting (see _report_damage)
+        self.input.on_enqueue = self.wakeup.set # Input threads just wake us up
+        # Input-to-photon latency, reported by the display once a frame is sent
+        self.latency = latency_tracker
+        self.display.on_presented = self.latency.record_frame
+        
         self._load_apps()
         self._create_main_menu()
 
@@ -93,6 +181,9 @@ class AppManager:
                         'action': lambda a=app: self.launch_app(a)
                     })
                     
+        # Alphabetical, so fast scrolling can jump by letter
+        items.sort(key=lambda item: item['label'].lower())
+            
         if not items:
             items.append({'label': 'No Items', 'action': None})
             
@@ -110,6 +201,7 @@ class AppManager:
             if hasattr(module, 'App'):
                 app_instance = module.App(self.display, self.input)
                 self.current_app = app_instance
+                self.current_app_name = app_info['name']
             else:
                 print(f"Error: No 'App' class found in {app_info['name']}")
                 
@@ -122,31 +214,129 @@ class AppManager:
     def close_current_app(self):
         print("Closing app, returning to menu...")
         self.current_app = None
+        self.request_redraw()
+
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+
+    def request_redraw(self):
+        # Safe from any thread: wakes the main loop for a new frame
+        self.redraw_needed = True
+        self.wakeup.set()
+
+    def _active_view(self):
+        if self.current_app:
+            return self.current_app
+        elif self.sub_menu:
+            return self.sub_menu
+        return self.main_menu
+
+    def _frame_period(self, view):
+        # Apps may declare target_fps (attribute or property), default ~33 Hz
+        fps = getattr(view, 'target_fps', None)
+        if fps:
+            return 1.0 / fps
+        return FRAME_INTERVAL
+
+    def _next_redraw_delay(self, event_driven=True):
+        # Seconds until something on screen changes by itself, None = wait for input.
+        # Views opt in with next_redraw(); views without it redraw continuously.
+        view = self._active_view()
+        if not event_driven or not hasattr(view, 'next_redraw'):
+            return self._frame_period(view)
+            
+        delay = view.next_redraw()
+        if delay is not None:
+            delay = max(delay, MIN_FRAME_INTERVAL)
+            
+        if self._status_bar_hidden(view):
+            return delay
+        status_delay = self.status_bar.next_redraw()
+        if delay is None or status_delay < delay:
+            delay = status_delay
+        return delay
+
+    def _poll_inputs(self):
+        # Update Inputs (Simulation)
+        if self.input.simulate and self.display.simulate and not self.display.headless:
+            import pygame
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                self.input.handle_pygame_event(event)
+                
+        # Scripted Inputs (Headless)
+        self.input.pump()
+        
+        # Run queued input callbacks here, on the main thread, between frames
+        self.input.dispatch_events()
+
+    def get_frame_stats(self):
+        return self.pacer.get_stats()
 
-    def run(self):
+    def _wait_for_work(self, deadline, event_driven=True):
+        # Sleep until the deadline or until input / request_redraw() wakes us
+        while self.running and not (event_driven and self.redraw_needed):
+            now = clock.monotonic()
+            if deadline is not None and now >= deadline:
+                return
+                
+            timeout = None if deadline is None else deadline - now
+            # Inputs that have to be polled from this thread bound the sleep
+            if self.display.simulate and not self.display.headless:
+                timeout = SIM_POLL_INTERVAL if timeout is None else min(timeout, SIM_POLL_INTERVAL)
+            script_delay = self.input.next_script_delay()
+            if script_delay is not None:
+                timeout = script_delay if timeout is None else min(timeout, script_delay)
+                
+            if clock.is_virtual():
+                # Fast replay: nothing else can happen meanwhile, jump ahead
+                if timeout is None:
+                    print("Replay finished (idle, script done)")
+                    self.running = False
+                    return
+                clock.source.advance_to(now + timeout)
+            elif event_driven:
+                self.wakeup.wait(timeout)
+                self.wakeup.clear()
+            else:
+                time.sleep(timeout)
+            self._poll_inputs()
+
+    def run(self, max_frames=None):
         # Initial Control Setup
         self.input.clear_callbacks()
         
         # Global Input Handlers (routed manually)
-        self.input.on('left', lambda: self._route_input('left'))
-        self.input.on('right', lambda: self._route_input('right'))
+        # Encoder bursts arrive as one 'rotate' event (see InputManager._dispatch)
+        self.input.on('rotate', self._route_rotate)
         self.input.on('select', lambda: self._route_input('select'))
         self.input.on('back', lambda: self._route_input('back'))
+        self.input.on('double_click', lambda: self._route_gesture('double_click'))
+        self.input.on('repeat', lambda: self._route_gesture('repeat'))
 
+        event_driven = config.RENDER_MODE == "event"
+        frames = 0
         while self.running:
-            # Update Inputs (Simulation)
-            if self.input.simulate and self.display.simulate:
-                import pygame
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.running = False
-                    self.input.handle_pygame_event(event)
+            frame_start = clock.monotonic()
+            self.redraw_needed = False
+            self._poll_inputs()
+            
+            # Late frames still update, but skip the draw to catch up
+            do_draw = self.pacer.begin_frame(frame_start)
             
             # Logic & Draw
+            view = self._active_view()
+            # Views with hold_repeat = True get 'repeat' events while the button is held
+            self.input.set_hold_repeat(bool(getattr(view, 'hold_repeat', False)))
+            rects = None
             if self.current_app:
                 try:
                     self.current_app.update()
-                    self.current_app.draw() # App draws to buffer
+                    if do_draw:
+                        # App draws to buffer (may return repainted regions)
+                        rects = self.current_app.draw()
                 except Exception as e:
                     print(f"App Crashed: {e}")
                     import traceback
@@ -154,18 +344,113 @@ class AppManager:
                     self.close_current_app()
             elif self.sub_menu:
                 self.sub_menu.update()
-                self.sub_menu.draw(self.display.get_draw(), self.display.get_image())
+                if do_draw:
+                    rects = self.sub_menu.draw(self.display.get_draw(), self.display.get_image())
             else:
                 self.main_menu.update()
-                self.main_menu.draw(self.display.get_draw(), self.display.get_image())
+                if do_draw:
+                    rects = self.main_menu.draw(self.display.get_draw(), self.display.get_image())
+            
+            if do_draw:
+                # Status Bar (Overlay): cached layer, one paste per frame
+                status_changed = False
+                if not self._status_bar_hidden(view):
+                    status_changed = self.status_bar.draw(self.display.get_draw(), self.display.get_image())
+                self._report_damage(view, rects, status_changed)
+                # Inputs applied since the last drawn frame first show up in this one
+                name = self._view_name(view)
+                self.display.show([(name, stamp) for stamp in self.input.take_dispatched()])
+                
+            self.pacer.end_frame(frame_start, do_draw)
+            
+            frames += 1
+            if max_frames and frames >= max_frames:
+                break
+                
+            deadline = self.pacer.schedule(frame_start, self._next_redraw_delay(event_driven))
+            self._wait_for_work(deadline, event_driven)
             
-            # Draw Status Bar (Overlay)
-            self.status_bar.draw(self.display.get_draw(), self.display.get_image())
+            # Don't let a fast spin on the encoder redraw faster than ~60 Hz
+            spare = frame_start + MIN_FRAME_INTERVAL - clock.monotonic()
+            if clock.is_virtual():
+                clock.source.advance_to(frame_start + MIN_FRAME_INTERVAL)
+            elif spare > 0:
+                time.sleep(spare)
 
-            self.display.show()
-            time.sleep(0.03)
+    def _view_name(self, view):
+        # Label for per-view latency stats
+        if view is self.current_app:
+            return self.current_app_name or type(view).__module__
+        if view is self.sub_menu:
+            return f"Menu: {view.title}"
+        return "Main Menu"
+
+    def _status_bar_hidden(self, view):
+        # Fullscreen apps (fullscreen = True) own the whole display
+        return bool(getattr(view, 'fullscreen', False))
+
+    def _report_damage(self, view, rects, status_changed=False):
+        # Menus (retained widgets) return the regions they repainted; most
+        # apps draw immediate-mode and return nothing. The display's auto/tiles
+        # modes find changes by diffing anyway, 'manual' relies on this.
+        if view is not self.last_drawn_view:
+            self.last_drawn_view = view
+            self.display.invalidate()
+        elif rects is None:
+            if self.display.refresh_mode == 'manual':
+                self.display.invalidate()
+        else:
+            for rect in rects:
+                self.display.invalidate(rect)
+                
+        if status_changed:
+            self.display.invalidate(self.status_bar.get_rect())
 
     def _route_input(self, event_name):
+        self._dispatch_input(event_name)
+        # After the state change, so the next frame reflects it
+        self.request_redraw()
+
+    def _route_rotate(self, event):
+        self._dispatch_rotate(event)
+        self.request_redraw()
+
+    def _dispatch_rotate(self, event):
+        # Apps with handle_rotate() get the whole burst; other apps get one
+        # handle_input() per detent, as before. List menus take raw detents:
+        # their ScrollAccelerator already turns spin speed into pages/jumps
+        if self.current_app:
+            if hasattr(self.current_app, 'handle_rotate'):
+                self.current_app.handle_rotate(event)
+            else:
+                for _ in range(abs(event['raw_steps'])):
+                    self._dispatch_input(event['name'])
+        elif self.sub_menu:
+            if event['pressed']:
+                # Press-and-turn: fast scroll, a letter group (or page) per detent
+                direction = 1 if event['raw_steps'] > 0 else -1
+                for _ in range(abs(event['raw_steps'])):
+                    self.sub_menu.move_selection(direction, fast=True)
+            else:
+                self.sub_menu.move_selection(event['raw_steps'])
+        else:
+            # Four cards: acceleration would just spin past them
+            self.main_menu.move_selection(event['raw_steps'])
+
+    def _route_gesture(self, name):
+        self._dispatch_gesture(name)
+        self.request_redraw()
+
+    def _dispatch_gesture(self, name):
+        # Apps opt in with handle_gesture(name) (return True when consumed).
+        # A double click is a second click for everything else.
+        if self.current_app and hasattr(self.current_app, 'handle_gesture'):
+            if self.current_app.handle_gesture(name):
+                return
+        if name == 'double_click':
+            self._dispatch_input('select')
+
+    def _dispatch_input(self, event_name):
         if self.current_app:
             handled = False
             if hasattr(self.current_app, 'handle_input'):
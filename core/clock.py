@@ -0,0 +1,45 @@
+import time
+
+# Time source for everything that drives game state and frame pacing
+# (FixedTimestep, FramePacer, menu animations, scripted input).
+# Normally the real monotonic clock; fast replays (main.py --fast) switch to
+# a virtual clock that the main loop advances itself, so a recorded session
+# plays back frame-for-frame identically and as fast as the CPU allows.
+# Wall-clock time on screen (status bar clock) goes through wall_time() and
+# strftime(): under the virtual clock it is a fixed UTC date plus virtual
+# time, so neither the real time nor TZ end up in replayed frames.
+
+VIRTUAL_EPOCH = 1704067200.0 # 2024-01-01 00:00 UTC
+
+class VirtualClock:
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance_to(self, t):
+        self.now = max(self.now, t)
+
+source = time.monotonic
+
+def monotonic():
+    return source()
+
+def use_virtual(start=0.0):
+    global source
+    source = VirtualClock(start)
+    return source
+
+def is_virtual():
+    return isinstance(source, VirtualClock)
+
+def wall_time():
+    if is_virtual():
+        return VIRTUAL_EPOCH + source()
+    return time.time()
+
+def strftime(fmt):
+    if is_virtual():
+        return time.strftime(fmt, time.gmtime(wall_time()))
+    return time.strftime(fmt)
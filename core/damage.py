@@ -0,0 +1,110 @@
+# Damage rectangle helpers for partial display refresh.
+# Rects are (x0, y0, x1, y1) with exclusive x1/y1 (same as PIL's getbbox/crop).
+from PIL import ImageChops
+
+# Cost of opening an extra CASET/RASET/RAMWR window, expressed in pixels.
+# Two rects are merged when the union wastes fewer pixels than this.
+WINDOW_COST_PIXELS = 256
+
+# Largest tile diff_tiles() handles: one changed pixel must still average
+# to a nonzero value (255 / tile) in a tile-wide row
+MAX_TILE_SIZE = 255
+
+def rect_area(rect):
+    return max(0, rect[2] - rect[0]) * max(0, rect[3] - rect[1])
+
+def union_rect(a, b):
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+def rects_overlap(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+def clip_rect(rect, width, height):
+    x0, y0, x1, y1 = [int(v) for v in rect]
+    x0 = max(0, min(width, x0))
+    y0 = max(0, min(height, y0))
+    x1 = max(x0, min(width, x1))
+    y1 = max(y0, min(height, y1))
+    return (x0, y0, x1, y1)
+
+def coalesce_rects(rects, max_rects=8):
+    rects = [r for r in rects if rect_area(r) > 0]
+
+    # Greedily merge pairs until nothing cheap is left to merge
+    merged = True
+    while merged:
+        merged = False
+        out = []
+        for r in rects:
+            for i, o in enumerate(out):
+                u = union_rect(r, o)
+                if rect_area(u) <= rect_area(r) + rect_area(o) + WINDOW_COST_PIXELS:
+                    out[i] = u
+                    merged = True
+                    break
+            else:
+                out.append(r)
+        rects = out
+
+    # Too many bursts: a single bounding window is cheaper
+    if len(rects) > max_rects:
+        u = rects[0]
+        for r in rects[1:]:
+            u = union_rect(u, r)
+        return [u]
+
+    return rects
+
+def _any(mask):
+    return mask.point(lambda v: 255 if v else 0)
+
+def _changed_tiles(prev, cur, tile):
+    # Any changed pixel -> 255, then box-reduce so each tile becomes one pixel.
+    # All C-level PIL ops; measured faster than a NumPy compare on 240x320.
+    # reduce() averages, so a lone 255 would round to 0 in a big tile: reduce
+    # one axis at a time (averaging over at most MAX_TILE_SIZE pixels) and
+    # re-threshold in between.
+    dr, dg, db = ImageChops.difference(prev, cur).split()
+    diff = _any(ImageChops.lighter(ImageChops.lighter(dr, dg), db))
+    small = _any(_any(diff.reduce((tile, 1))).reduce((1, tile)))
+    cols, rows = small.size
+    data = list(small.getdata())
+    return [[data[r * cols + c] > 0 for c in range(cols)] for r in range(rows)]
+
+def diff_tiles(prev, cur, tile=16):
+    # Compare two same-sized RGB frames tile by tile and return the changed
+    # area as a short list of rects (horizontal runs, stacked vertically).
+    if not 1 <= tile <= MAX_TILE_SIZE:
+        raise ValueError(f"Tile size must be 1..{MAX_TILE_SIZE}, got {tile}")
+    grid = _changed_tiles(prev, cur, tile)
+    width, height = cur.size
+    rects = []
+    open_spans = {} # (c0, c1) -> index into rects of the span growing downwards
+    
+    for r, row in enumerate(grid):
+        spans = []
+        c = 0
+        while c < len(row):
+            if row[c]:
+                start = c
+                while c < len(row) and row[c]:
+                    c += 1
+                spans.append((start, c))
+            else:
+                c += 1
+                
+        next_open = {}
+        for c0, c1 in spans:
+            y1 = min(height, (r + 1) * tile)
+            if (c0, c1) in open_spans:
+                # Same columns as the row above: extend that rect down
+                idx = open_spans[(c0, c1)]
+                x0, y0, x1, _ = rects[idx]
+                rects[idx] = (x0, y0, x1, y1)
+            else:
+                idx = len(rects)
+                rects.append((c0 * tile, r * tile, min(width, c1 * tile), y1))
+            next_open[(c0, c1)] = idx
+        open_spans = next_open
+        
+    return rects
@@ -1,23 +1,75 @@
 import time
 import sys
-import spidev
-from PIL import Image, ImageDraw
-from gpiozero import OutputDevice
+from PIL import Image, ImageDraw, ImageChops
 import config
+from core.rgb565 import get_encoder
+from core.damage import clip_rect, coalesce_rects, rect_area, diff_tiles, MAX_TILE_SIZE
+from core.presenter import FramePresenter
+from core.spi_transport import SpiTransport
+
+try:
+    from gpiozero import OutputDevice
+    HARDWARE_AVAILABLE = True
+except ImportError:
+    HARDWARE_AVAILABLE = False
+
+# SPI clocks tried by calibrate_spi(), slowest first
+CALIBRATION_SPEEDS = [16000000, 24000000, 32000000, 40000000, 48000000, 62500000, 80000000]
 
 class DisplayManager:
-    def __init__(self, simulate=False):
+    def __init__(self, simulate=False, encoder=None, headless=False, panel=None):
         self.width = config.DISPLAY_WIDTH
         self.height = config.DISPLAY_HEIGHT
-        self.simulate = simulate
+        # Headless: offscreen framebuffer only (no panel, no window)
+        self.headless = headless
+        self.simulate = simulate or headless
+        # Fake device (core/fake_panel.py) standing in for spidev + gpiozero
+        self.panel = panel
+        if self.panel:
+            self.simulate = False
+        
+        # RGB888 -> RGB565 encoder stage (see core/rgb565.py)
+        self.encoder = get_encoder(encoder or config.DISPLAY_ENCODER)
+        
+        # Damage tracking (partial refresh)
+        # auto: diff bbox against last frame + invalidate()
+        # tiles: per-tile diff against last frame + invalidate()
+        # manual: invalidate() only, full: always full frame
+        self.refresh_mode = config.DISPLAY_REFRESH_MODE
+        self.tile_size = max(1, min(MAX_TILE_SIZE, config.DISPLAY_TILE_SIZE))
+        if self.tile_size != config.DISPLAY_TILE_SIZE:
+            print(f"DISPLAY_TILE_SIZE {config.DISPLAY_TILE_SIZE} out of range, using {self.tile_size}")
+        self.damage = []
+        self.full_refresh_pending = False
+        self.last_frame = None # Copy of what the panel currently shows
+        self.stats = {
+            'frames': 0,
+            'bytes_sent': 0,
+            'bytes_saved': 0,
+            'last_rects': 0,
+            'last_bytes_sent': 0,
+            'last_bytes_saved': 0,
+            'show_calls': 0,
+            'show_ms_last': 0.0,
+            'show_ms_total': 0.0
+        }
+        self.capture_path = None # Set by request_capture()
+        self.on_presented = None # callback(stamps) once a frame carrying input stamps is on the panel
         
         # Create a blank image for drawing
         self.image = Image.new("RGB", (self.width, self.height), config.COLOR_BG)
         self.draw = ImageDraw.Draw(self.image)
         
-        if not self.simulate:
+        # Async SPI presenter (hardware only; pygame must stay on the main thread)
+        self.presenter = None
+        
+        if self.headless:
+            print("Display running headless (offscreen framebuffer)")
+        elif not self.simulate:
             try:
                 self._init_hardware()
+                if config.DISPLAY_ASYNC:
+                    self.presenter = FramePresenter(self._present)
             except Exception as e:
                 print(f"Display Init Failed: {e}")
                 if "busy" in str(e).lower():
@@ -29,30 +81,43 @@ class DisplayManager:
             self._init_simulation()
 
     def _init_hardware(self):
-        print("Initializing Display (SPI via spidev)...")
+        if self.panel:
+            print("Initializing Display (fake ST7789 panel)...")
+            spi = self.panel.spi_device()
+            make_pin = self.panel.output_device
+        else:
+            print("Initializing Display (SPI via spidev)...")
+            if not HARDWARE_AVAILABLE:
+                raise RuntimeError("gpiozero not installed")
+            spi = None
+            make_pin = OutputDevice
         
         # SPI Setup
         self.bus = 0
         self.device = 0
-        self.spi = spidev.SpiDev()
-        self.spi.open(self.bus, self.device)
-        self.spi.max_speed_hz = 40000000
-        self.spi.mode = 0b00
+        self.transport = SpiTransport(
+            self.bus, self.device,
+            baudrate=config.DISPLAY_BAUDRATE,
+            mode=0b00,
+            chunk_size=config.DISPLAY_SPI_CHUNK,
+            spi=spi
+        )
+        self.spi = self.transport.spi
 
         # GPIO Setup (using gpiozero)
-        self.rst = OutputDevice(config.PIN_DISPLAY_RST, active_high=True, initial_value=False)
-        self.dc  = OutputDevice(config.PIN_DISPLAY_DC, active_high=True, initial_value=False)
-        self.bl  = OutputDevice(config.PIN_DISPLAY_BL, active_high=True, initial_value=True)
+        self.rst = make_pin(config.PIN_DISPLAY_RST, active_high=True, initial_value=False)
+        self.dc  = make_pin(config.PIN_DISPLAY_DC, active_high=True, initial_value=False)
+        self.bl  = make_pin(config.PIN_DISPLAY_BL, active_high=True, initial_value=True)
 
         self._init_display_sequence()
 
     def _command(self, cmd):
         self.dc.off() # Command
-        self.spi.writebytes([cmd])
+        self.transport.write(bytes([cmd]))
 
     def _data(self, val):
         self.dc.on() # Data
-        self.spi.writebytes([val])
+        self.transport.write(bytes([val]))
 
     def _init_display_sequence(self):
         # Reset
@@ -74,11 +139,11 @@ class DisplayManager:
     def _set_window(self, x_start, y_start, x_end, y_end):
         self._command(0x2A)
         self.dc.on() # Data Mode for parameters
-        self.spi.writebytes([x_start >> 8, x_start & 0xFF, x_end >> 8, x_end & 0xFF])
+        self.transport.write(bytes([x_start >> 8, x_start & 0xFF, x_end >> 8, x_end & 0xFF]))
         
         self._command(0x2B)
         self.dc.on() # Data Mode for parameters
-        self.spi.writebytes([y_start >> 8, y_start & 0xFF, y_end >> 8, y_end & 0xFF])
+        self.transport.write(bytes([y_start >> 8, y_start & 0xFF, y_end >> 8, y_end & 0xFF]))
         
         self._command(0x2C)
 
@@ -98,39 +163,205 @@ class DisplayManager:
     def clear(self, color=config.COLOR_BG):
         self.draw.rectangle((0, 0, self.width, self.height), fill=color)
 
-    def show(self):
-        if not self.simulate:
-            self._update_display()
+    def invalidate(self, rect=None):
+        # Mark a region as changed. None means the whole screen.
+        if rect is None:
+            rect = (0, 0, self.width, self.height)
+        self.damage.append(clip_rect(rect, self.width, self.height))
+
+    def force_full_refresh(self):
+        # Next show() pushes the whole frame regardless of refresh mode
+        self.full_refresh_pending = True
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        if self.presenter:
+            stats.update(self.presenter.get_stats())
+        return stats
+
+    def show(self, stamps=None):
+        # stamps: input timestamps this frame is the first to reflect (core/latency.py)
+        start = time.perf_counter()
+        
+        # Swap out the pending list (invalidate() may be called from other threads)
+        rects, self.damage = self.damage, []
+        
+        if self.presenter:
+            # Hand a snapshot to the presenter thread and carry on rendering
+            self.presenter.submit(self.image.copy(), rects, stamps)
         else:
+            self._present(self.image, rects, stamps)
+            
+        if self.capture_path:
+            path, self.capture_path = self.capture_path, None
+            self.capture(path)
+            
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.stats['show_calls'] += 1
+        self.stats['show_ms_last'] = elapsed_ms
+        self.stats['show_ms_total'] += elapsed_ms
+
+    def capture(self, path):
+        # Dump the current framebuffer: .png, or raw big-endian RGB565 for anything else
+        try:
+            if path.lower().endswith('.png'):
+                self.image.save(path)
+            else:
+                with open(path, 'wb') as f:
+                    f.write(self.encoder(self.image))
+            print(f"Captured frame to {path}")
+        except OSError as e:
+            print(f"Capture Failed: {e}")
+
+    def request_capture(self, path=None):
+        # Capture the next frame passed to show() (safe to call from signal handlers)
+        if path is None:
+            path = time.strftime("capture_%Y%m%d_%H%M%S.png")
+        self.capture_path = path
+
+    def flush(self, timeout=1.0):
+        # Wait for frames queued on the presenter to reach the panel
+        if self.presenter:
+            return self.presenter.flush(timeout)
+        return True
+
+    def cleanup(self):
+        if self.presenter:
+            self.presenter.stop()
+            self.presenter = None
+
+    def _present(self, frame, rects, stamps=None):
+        rects = self._collect_damage(frame, rects)
+        
+        if not self.simulate:
+            self._update_display(rects, frame)
+        elif not self.headless:
             self._update_simulation()
+            
+        self._record_frame(frame, rects)
+        
+        if stamps and self.on_presented:
+            self.on_presented(stamps)
+
+    def _collect_damage(self, frame, rects):
+        full = (0, 0, self.width, self.height)
+        
+        if self.last_frame is None or self.refresh_mode == 'full' or self.full_refresh_pending:
+            self.full_refresh_pending = False
+            return [full]
+            
+        if self.refresh_mode == 'auto':
+            bbox = ImageChops.difference(self.last_frame, frame).getbbox()
+            if bbox:
+                rects.append(bbox)
+        elif self.refresh_mode == 'tiles':
+            rects.extend(diff_tiles(self.last_frame, frame, self.tile_size))
+                
+        return coalesce_rects(rects)
 
-    def _update_display(self):
+    def _record_frame(self, frame, rects):
+        full_bytes = self.width * self.height * 2
+        # Pixel data + CASET/RASET/RAMWR (11 bytes) per window
+        sent = sum(rect_area(r) * 2 + 11 for r in rects)
+        saved = max(0, full_bytes - sent)
+        
+        self.stats['frames'] += 1
+        self.stats['bytes_sent'] += sent
+        self.stats['bytes_saved'] += saved
+        self.stats['last_rects'] = len(rects)
+        self.stats['last_bytes_sent'] = sent
+        self.stats['last_bytes_saved'] = saved
+        
+        if rects:
+            # Presenter snapshots are already private copies
+            self.last_frame = frame if self.presenter else frame.copy()
+
+    def _update_display(self, rects=None, img=None):
         # Resize if needed
-        img = self.image
+        if img is None:
+            img = self.image
         if img.width != self.width or img.height != self.height:
             img = img.resize((self.width, self.height))
+            
+        if rects is None:
+            rects = [(0, 0, self.width, self.height)]
+        
+        for x0, y0, x1, y1 in rects:
+            # RGB888 -> big-endian RGB565 bytes
+            buffer = self.encoder(img.crop((x0, y0, x1, y1)))
+
+            # Write to SPI (bulk, chunked at the spidev bufsiz)
+            self._set_window(x0, y0, x1-1, y1-1)
+            self.dc.on()
+            self.transport.write(buffer)
+
+    def _read_id(self):
+        # RDDID (0x04). Returns None when MISO is not wired (all 0x00 / 0xFF).
+        # Command and read must share one CS-low transfer (the panel drops the
+        # read once CS goes high); the 24 ID bits follow one dummy clock.
+        self.dc.off()
+        rx = self.transport.transfer([0x04, 0, 0, 0, 0])
+        bits = (int.from_bytes(bytes(rx[1:5]), 'big') >> 7) & 0xFFFFFF
+        data = list(bits.to_bytes(3, 'big'))
+        if all(b == 0x00 for b in data) or all(b == 0xFF for b in data):
+            return None
+        return data
+
+    def _draw_calibration_pattern(self, hz, step):
+        # Colour bars + fine checkerboard: bit errors show up as wrong colours
+        bars = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255), (255, 255, 0), (0, 255, 255)]
+        bar_w = self.width // len(bars)
+        for i, color in enumerate(bars):
+            self.draw.rectangle((i * bar_w, 0, (i + 1) * bar_w, self.height // 2), fill=color)
+        for y in range(self.height // 2, self.height, 4):
+            for x in range(0, self.width, 4):
+                on = ((x + y) // 4 + step) % 2 == 0
+                self.draw.rectangle((x, y, x + 3, y + 3), fill=(255, 255, 255) if on else (0, 0, 0))
+        self.draw.rectangle((0, self.height // 2 - 20, self.width, self.height // 2), fill=(0, 0, 0))
+        self.draw.text((10, self.height // 2 - 16), f"SPI {hz / 1e6:.1f} MHz", fill=(255, 255, 255))
+
+    def calibrate_spi(self, speeds=None, confirm=None, frames=10):
+        # Step the SPI clock up until output stops being stable.
+        # Stability = RDDID readback matches the slowest speed (if MISO is wired)
+        # and, if given, confirm(hz) returns True (e.g. the user presses select).
+        if self.simulate:
+            print("SPI calibration needs the display hardware.")
+            return None
+            
+        speeds = sorted(speeds or CALIBRATION_SPEEDS)
+        self.flush()
+        previous = self.transport.speed_hz # Kept if no speed passes
         
-        # Fast PIL to Bytes conversion (RGB888)
-        image_bytes = img.convert("RGB").tobytes()
-        buffer = []
-        
-        # Manual RGB888 -> RGB565 conversion (Slow but proven working)
-        for i in range(0, len(image_bytes), 3):
-            r = image_bytes[i]
-            g = image_bytes[i+1]
-            b = image_bytes[i+2]
-            rgb = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-            buffer.append(rgb >> 8)
-            buffer.append(rgb & 0xFF)
-
-        # Write to SPI
-        self._set_window(0, 0, self.width-1, self.height-1)
-        self.dc.on()
-        
-        # Chunked write
-        chunk_size = 4096
-        for i in range(0, len(buffer), chunk_size):
-            self.spi.writebytes(buffer[i:i+chunk_size])
+        self.transport.set_speed(speeds[0])
+        baseline = self._read_id()
+        if baseline is None and confirm is None:
+            print("SPI calibration: no readback (MISO not wired?) and no confirm callback.")
+            self.transport.set_speed(previous)
+            return None
+            
+        best = None
+        for hz in speeds:
+            self.transport.set_speed(hz)
+            
+            ok = True
+            for step in range(frames):
+                self._draw_calibration_pattern(hz, step)
+                self._update_display(None, self.image)
+                if baseline is not None and self._read_id() != baseline:
+                    ok = False
+                    break
+                    
+            if ok and confirm is not None:
+                ok = confirm(hz)
+                
+            print(f"SPI calibration: {hz / 1e6:.1f} MHz {'OK' if ok else 'FAILED'}")
+            if not ok:
+                break
+            best = hz
+            
+        self.transport.set_speed(best or previous)
+        self.force_full_refresh()
+        return best
 
     def _update_simulation(self):
         import pygame
@@ -0,0 +1,211 @@
+import os
+import time
+import fcntl
+import struct
+import selectors
+import threading
+import config
+from core.gestures import GestureRecognizer
+
+# Kernel input backend: the rotary-encoder and gpio-keys device tree overlays
+# decode and debounce the GPIOs in the kernel and report the result on
+# /dev/input/event*. One thread waits on all devices with epoll and turns the
+# events into the usual left/right/select/back triggers.
+#
+#   dtoverlay=rotary-encoder,pin_a=5,pin_b=6,relative_axis=1
+#   dtoverlay=gpio-key,gpio=13,keycode=28,label="select"
+
+# struct input_event: timeval (long, long), type, code, value
+EVENT_FORMAT = 'llHHi'
+EVENT_SIZE = struct.calcsize(EVENT_FORMAT)
+
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_REL = 0x02
+EV_ABS = 0x03
+
+KEY_ESC = 1
+KEY_ENTER = 28
+KEY_MAX = 0x2ff
+
+# ioctl(EVIOCSCLOCKID): have the kernel stamp events with CLOCK_MONOTONIC,
+# the clock our input queue and latency stats use
+EVIOCSCLOCKID = 0x400445a0
+CLOCK_MONOTONIC = 1
+
+def eviocgbit(ev_type, length):
+    # ioctl(EVIOCGBIT(ev_type, length)): bitmask of the codes a device reports
+    return (2 << 30) | (length << 16) | (ord('E') << 8) | (0x20 + ev_type)
+
+def capabilities(fd):
+    # Which of 'encoder' / 'select' / 'back' a device reports;
+    # None when it cannot be asked (not an evdev node, e.g. a fake device)
+    def has(ev_type, code, max_code):
+        bits = bytearray(max_code // 8 + 1)
+        fcntl.ioctl(fd, eviocgbit(ev_type, len(bits)), bits)
+        return bool(bits[code // 8] & (1 << (code % 8)))
+
+    try:
+        caps = set()
+        if has(EV_REL, 0, 0x0f) or has(EV_ABS, 0, 0x3f):
+            caps.add('encoder')
+        if has(EV_KEY, config.EVDEV_KEY_SELECT, KEY_MAX):
+            caps.add('select')
+        if has(EV_KEY, config.EVDEV_KEY_BACK, KEY_MAX):
+            caps.add('back')
+        return caps
+    except OSError:
+        return None
+
+def find_devices(names=None, proc_path='/proc/bus/input/devices'):
+    # /dev/input/event* paths of devices whose name contains one of names
+    names = [n.lower() for n in (names or config.EVDEV_DEVICE_NAMES)]
+    paths = []
+    try:
+        with open(proc_path, 'r') as f:
+            blocks = f.read().split('\n\n')
+    except OSError:
+        return paths
+
+    for block in blocks:
+        name = ''
+        handlers = []
+        for line in block.splitlines():
+            if line.startswith('N: Name='):
+                name = line[len('N: Name='):].strip('"').lower()
+            elif line.startswith('H: Handlers='):
+                handlers = line[len('H: Handlers='):].split()
+        if any(n in name for n in names):
+            paths.extend('/dev/input/' + h for h in handlers if h.startswith('event'))
+    return paths
+
+class EvdevReader:
+    def __init__(self, trigger, devices, gestures=None):
+        # trigger(event_name, stamp, pressed): InputManager._trigger
+        # devices: /dev/input/event* paths or objects with fileno() (tests/fake_evdev.py)
+        # gestures: GestureRecognizer the select key's press/release edges go to
+        self.trigger = trigger
+        self.gestures = gestures or GestureRecognizer(trigger)
+        self.fds = []
+        self.owned = [] # fds we opened and must close
+        self.monotonic = True # Kernel timestamps comparable to time.monotonic()
+        self.pending = {} # fd -> partial event bytes
+        self.last_abs = {} # fd -> last ABS_X position
+        self.capabilities = set() # What the devices cover together (see capabilities())
+        self.running = False
+        self.thread = None
+        self.stats = {
+            'events': 0,
+            'triggers': 0,
+            'reads': 0
+        }
+
+        for device in devices:
+            if isinstance(device, str):
+                fd = os.open(device, os.O_RDONLY | os.O_NONBLOCK)
+                self.owned.append(fd)
+                try:
+                    fcntl.ioctl(fd, EVIOCSCLOCKID, struct.pack('i', CLOCK_MONOTONIC))
+                except OSError:
+                    self.monotonic = False # Older kernel: stamp on arrival instead
+            else:
+                fd = device.fileno()
+                os.set_blocking(fd, False)
+            self.fds.append(fd)
+            caps = capabilities(fd)
+            self.capabilities |= caps if caps is not None else {'encoder', 'select', 'back'}
+
+        # Self-pipe so stop() can wake the selector
+        self.wake_r, self.wake_w = os.pipe()
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._worker, name="evdev-input", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.running = False
+        os.write(self.wake_w, b'x')
+        if self.thread:
+            self.thread.join(timeout=1.0)
+        for fd in self.owned:
+            os.close(fd)
+        self.owned = []
+        os.close(self.wake_r)
+        os.close(self.wake_w)
+
+    def get_stats(self):
+        return dict(self.stats)
+
+    def _worker(self):
+        selector = selectors.DefaultSelector() # epoll on Linux
+        for fd in self.fds:
+            selector.register(fd, selectors.EVENT_READ)
+        selector.register(self.wake_r, selectors.EVENT_READ)
+
+        while self.running:
+            self.process([key.fd for key, _ in selector.select() if key.fd != self.wake_r])
+        selector.close()
+
+    def process(self, fds):
+        # Read and handle whatever the given (readable) devices have queued
+        events = []
+        for fd in fds:
+            events.extend(self._read(fd))
+        # Encoder and button are separate devices: replay in kernel time
+        # order so a turn during a press is seen as press-and-turn
+        events.sort(key=lambda event: event[0])
+        for event in events:
+            self._handle(*event)
+
+    def _read(self, fd):
+        # Decoded events: [(stamp, fd, type, code, value)]
+        try:
+            data = os.read(fd, EVENT_SIZE * 64)
+        except BlockingIOError:
+            return []
+        except OSError as e:
+            print(f"Evdev Read Error: {e}")
+            return []
+        self.stats['reads'] += 1
+
+        data = self.pending.pop(fd, b'') + data
+        usable = len(data) - len(data) % EVENT_SIZE
+        if usable < len(data):
+            self.pending[fd] = data[usable:]
+        events = []
+        for sec, usec, ev_type, code, value in struct.iter_unpack(EVENT_FORMAT, data[:usable]):
+            self.stats['events'] += 1
+            stamp = sec + usec / 1e6 if self.monotonic else time.monotonic()
+            events.append((stamp, fd, ev_type, code, value))
+        return events
+
+    def _handle(self, stamp, fd, ev_type, code, value):
+        if ev_type == EV_REL:
+            # rotary-encoder with relative_axis=1: value is the signed step count
+            self._rotate(value, stamp)
+        elif ev_type == EV_ABS:
+            # Absolute mode: steps are the change in position
+            last = self.last_abs.get(fd)
+            self.last_abs[fd] = value
+            if last is not None:
+                self._rotate(value - last, stamp)
+        elif ev_type == EV_KEY:
+            if code == config.EVDEV_KEY_BACK:
+                if value == 1:
+                    self._emit('back', stamp)
+            elif code == config.EVDEV_KEY_SELECT and value in (0, 1):
+                # Click/hold timing is up to the gesture recognizer
+                # (value 2, kernel autorepeat, is ignored)
+                self.gestures.button(value == 1, stamp)
+
+    def _rotate(self, steps, stamp):
+        event_name = 'right' if steps > 0 else 'left'
+        pressed = self.gestures.rotate()
+        for _ in range(abs(steps)):
+            self._emit(event_name, stamp, pressed)
+
+    def _emit(self, event_name, stamp, pressed=False):
+        self.stats['triggers'] += 1
+        self.trigger(event_name, stamp, pressed)
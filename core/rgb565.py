@@ -0,0 +1,63 @@
+from PIL import Image, ImageChops
+
+# NumPy is optional (fast path). PIL channel ops are used when it is missing.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Lookup tables for the PIL path (one entry per 8-bit channel value)
+_LUT_R_HI = [v & 0xF8 for v in range(256)]
+_LUT_G_HI = [v >> 5 for v in range(256)]
+_LUT_G_LO = [(v & 0x1C) << 3 for v in range(256)]
+_LUT_B_LO = [v >> 3 for v in range(256)]
+
+def encode_loop(img):
+    # Reference implementation (the original per-pixel loop)
+    image_bytes = img.convert("RGB").tobytes()
+    buffer = bytearray()
+
+    for i in range(0, len(image_bytes), 3):
+        r = image_bytes[i]
+        g = image_bytes[i+1]
+        b = image_bytes[i+2]
+        rgb = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        buffer.append(rgb >> 8)
+        buffer.append(rgb & 0xFF)
+
+    return bytes(buffer)
+
+def encode_numpy(img):
+    arr = np.asarray(img.convert("RGB"), dtype=np.uint16)
+    r = arr[:, :, 0]
+    g = arr[:, :, 1]
+    b = arr[:, :, 2]
+    rgb = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+    # Big-endian 16-bit words, as the ST7789 expects
+    return rgb.astype('>u2').tobytes()
+
+def encode_pil(img):
+    r, g, b = img.convert("RGB").split()
+    # High and low bytes never share bits, so add == bitwise or (no clipping)
+    hi = ImageChops.add(r.point(_LUT_R_HI), g.point(_LUT_G_HI))
+    lo = ImageChops.add(g.point(_LUT_G_LO), b.point(_LUT_B_LO))
+    # "LA" stores two bytes per pixel (L, A) which interleaves hi/lo for us
+    return Image.merge("LA", (hi, lo)).tobytes()
+
+ENCODERS = {
+    'loop': encode_loop,
+    'pil': encode_pil,
+}
+if NUMPY_AVAILABLE:
+    ENCODERS['numpy'] = encode_numpy
+
+def get_encoder(name="auto"):
+    if name in (None, "auto"):
+        name = 'numpy' if NUMPY_AVAILABLE else 'pil'
+
+    if name not in ENCODERS:
+        print(f"Warning: RGB565 encoder '{name}' unavailable. Using 'pil'.")
+        name = 'pil'
+
+    return ENCODERS[name]
@@ -0,0 +1,58 @@
+try:
+    import spidev
+except ImportError:
+    spidev = None
+
+# spidev rejects single transfers larger than this kernel module parameter
+BUFSIZ_PATH = "/sys/module/spidev/parameters/bufsiz"
+DEFAULT_BUFSIZ = 4096
+
+def read_bufsiz():
+    try:
+        with open(BUFSIZ_PATH, 'r') as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return DEFAULT_BUFSIZ
+
+class SpiTransport:
+    # Bulk SPI writes straight from bytes/memoryview buffers.
+    # Uses writebytes2 (buffer protocol, no Python list) when spidev has it.
+    def __init__(self, bus=0, device=0, baudrate=24000000, mode=0, chunk_size=0, spi=None):
+        if spi is None:
+            if spidev is None:
+                raise RuntimeError("spidev not installed")
+            spi = spidev.SpiDev()
+            spi.open(bus, device)
+        self.spi = spi
+        self.spi.mode = mode
+        self.set_speed(baudrate)
+
+        # Largest transfer the kernel accepts, unless overridden
+        self.chunk_size = chunk_size or read_bufsiz()
+        self.has_writebytes2 = hasattr(self.spi, 'writebytes2')
+        print(f"SPI: {self.speed_hz / 1e6:.1f} MHz, chunk {self.chunk_size} bytes, "
+              f"{'writebytes2' if self.has_writebytes2 else 'writebytes'}")
+
+    def set_speed(self, hz):
+        self.speed_hz = int(hz)
+        self.spi.max_speed_hz = self.speed_hz
+
+    def write(self, data):
+        view = memoryview(data).cast('B')
+        chunk = self.chunk_size
+
+        if self.has_writebytes2:
+            # Slicing a memoryview does not copy
+            for i in range(0, len(view), chunk):
+                self.spi.writebytes2(view[i:i+chunk])
+        else:
+            # Old spidev: only accepts sequences of ints
+            for i in range(0, len(view), chunk):
+                self.spi.writebytes(view[i:i+chunk].tolist())
+
+    def transfer(self, data):
+        # Full duplex, one CS-low transaction: returns what came back on MISO
+        return self.spi.xfer2(list(data))
+
+    def close(self):
+        self.spi.close()
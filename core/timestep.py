@@ -0,0 +1,43 @@
+import config
+from core import clock as core_clock
+
+class FixedTimestep:
+    # Runs game logic at a fixed logical rate, independent of the frame rate.
+    # Each App.update() asks advance() how many logic steps are due; a slow
+    # Pi then drops rendered frames instead of slowing the game down.
+    def __init__(self, rate=None, max_steps=5, clock=None):
+        self.dt = 1.0 / (rate or config.GAME_UPDATE_RATE)
+        self.max_steps = max_steps
+        self.clock = clock or core_clock.monotonic
+        self.reset()
+
+    def reset(self):
+        # Call when (re)starting play so time spent in menus is not simulated
+        self.last = None
+        self.accumulator = 0.0
+
+    def set_rate(self, rate):
+        self.dt = 1.0 / rate
+
+    def advance(self):
+        now = self.clock()
+        if self.last is None:
+            self.last = now
+            return 0
+
+        self.accumulator += now - self.last
+        self.last = now
+
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # Too far behind (stall, app switch): drop the backlog
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        # How far we are into the next step (0..1), for interpolated drawing
+        return self.accumulator / self.dt
@@ -1,25 +1,652 @@
+import os
 import time
+import bisect
+from collections import OrderedDict
 from PIL import Image, ImageDraw, ImageFont
 import config
 import math
+from core import clock
+from core.damage import clip_rect, coalesce_rects, rect_area, rects_overlap
+from core.glyph_atlas import draw_text
 
-def load_font(size, bold=False):
-    fonts = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if bold else "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf" if bold else "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-        "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf" if bold else "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
+ICON_DIR = "assets/icons"
+
+# Candidate files per (family, bold), tried in order until one loads
+FONT_FAMILIES = {
+    ("sans", False): [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+        "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
         "arial.ttf"
-    ]
-    
-    for font_path in fonts:
+    ],
+    ("sans", True): [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+        "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf",
+        "arial.ttf"
+    ],
+}
+
+class FontRegistry:
+    # Process-wide font store: each font file is resolved once per
+    # (family, bold) and FreeTypeFont objects are shared per size. Text
+    # bounding boxes for repeated strings (labels, HUD text, key caps) are
+    # cached too, since textbbox re-shapes the string every call.
+    def __init__(self, max_bboxes=2048):
+        self.paths = {} # (family, bold) -> font file, or None for the default font
+        self.fonts = {} # (family, size, bold) -> font
+        self.bboxes = OrderedDict() # (font, text) -> bbox
+        self.max_bboxes = max_bboxes
+        self.bbox_hits = 0
+        self.bbox_misses = 0
+
+    def get(self, size, bold=False, family="sans"):
+        key = (family, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self._load(size, bold, family)
+            self.fonts[key] = font
+        return font
+
+    def bbox(self, text, font):
+        # Same result as draw.textbbox((0, 0), text, font=font)
+        key = (font, text)
+        bbox = self.bboxes.get(key)
+        if bbox is not None:
+            self.bboxes.move_to_end(key)
+            self.bbox_hits += 1
+            return bbox
+
+        self.bbox_misses += 1
+        bbox = font.getbbox(text)
+        self.bboxes[key] = bbox
+        if len(self.bboxes) > self.max_bboxes:
+            self.bboxes.popitem(last=False)
+        return bbox
+
+    def get_stats(self):
+        return {
+            'fonts': len(self.fonts),
+            'bboxes': len(self.bboxes),
+            'bbox_hits': self.bbox_hits,
+            'bbox_misses': self.bbox_misses
+        }
+
+    def _load(self, size, bold, family):
+        path_key = (family, bold)
+        if path_key not in self.paths:
+            self.paths[path_key] = self._resolve(FONT_FAMILIES.get(path_key, []), size)
+            if self.paths[path_key] is None:
+                print(f"Warning: No fonts found. Using default.")
+
+        path = self.paths[path_key]
+        if path is None:
+            return ImageFont.load_default()
+        return ImageFont.truetype(path, size)
+
+    def _resolve(self, candidates, size):
+        for font_path in candidates:
+            try:
+                ImageFont.truetype(font_path, size)
+                return font_path
+            except OSError:
+                continue
+        return None
+
+fonts = FontRegistry()
+
+def load_font(size, bold=False, family="sans"):
+    return fonts.get(size, bold, family)
+
+def text_bbox(text, font):
+    return fonts.bbox(text, font)
+
+class IconCache:
+    # Pre-scaled RGBA icon sprites shared by every menu and the status bar.
+    # LRU-evicted under a byte budget; cleared when config.ICONS or the
+    # contents of assets/icons change (newest mtime of the directory and its
+    # files, so icons overwritten in place count too; checked once a second).
+    def __init__(self, max_bytes=2 * 1024 * 1024, check_interval=1.0):
+        self.max_bytes = max_bytes
+        self.check_interval = check_interval
+        self.entries = OrderedDict() # (filename, size) -> Image or None (missing)
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.last_check = 0
+        self.dir_mtime = None
+        self.icon_mapping = dict(config.ICONS)
+        self.generation = 0 # Bumped on every clear, so sprite caches can follow
+
+    def get(self, icon_filename, size):
+        self.check()
+        key = (icon_filename, size)
+        
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+            
+        self.misses += 1
+        icon = None
+        icon_path = os.path.join(ICON_DIR, icon_filename)
+        if os.path.exists(icon_path):
+            try:
+                icon = Image.open(icon_path).convert("RGBA")
+                icon.thumbnail((size, size))
+            except Exception as e:
+                print(f"Error loading icon {icon_path}: {e}")
+                icon = None
+                
+        # Missing icons are cached too, so fallbacks don't hit the disk every frame
+        self.entries[key] = icon
+        if icon:
+            self.bytes_used += icon.width * icon.height * 4
+        self._evict()
+        return icon
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes_used = 0
+        self.generation += 1
+
+    def get_stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.bytes_used
+        }
+
+    def _evict(self):
+        while self.bytes_used > self.max_bytes and len(self.entries) > 1:
+            _, icon = self.entries.popitem(last=False)
+            if icon:
+                self.bytes_used -= icon.width * icon.height * 4
+            self.evictions += 1
+
+    def check(self):
+        # Drop stale icons; returns the current generation
+        if config.ICONS != self.icon_mapping:
+            self.icon_mapping = dict(config.ICONS)
+            self.clear()
+            
+        now = time.monotonic()
+        if now - self.last_check < self.check_interval:
+            return self.generation
+        self.last_check = now
+        mtime = self._dir_mtime()
+        if mtime != self.dir_mtime:
+            self.dir_mtime = mtime
+            self.clear()
+        return self.generation
+
+    def _dir_mtime(self):
+        # Adding/removing files changes the directory; rewriting one only the file
         try:
-            return ImageFont.truetype(font_path, size)
+            mtime = os.stat(ICON_DIR).st_mtime
+            with os.scandir(ICON_DIR) as entries:
+                for entry in entries:
+                    mtime = max(mtime, entry.stat().st_mtime)
+            return mtime
         except OSError:
-            continue
+            return None
+
+# Shared by all menus and the status bar
+icon_cache = IconCache()
+
+def draw_icon(draw, name, cx, cy, size=60, target_image=None):
+    # Check for custom icon first
+    # Check Config Mapping first
+    key = name.lower().replace(" ", "_")
+    if "]" in key: key = key.split("]")[-1].strip()
+    
+    icon_filename = config.ICONS.get(key, None)
     
-    # Fallback to default
-    print(f"Warning: No fonts found. Using default.")
-    return ImageFont.load_default()
+    if not icon_filename:
+        # Default lookup
+        icon_filename = f"{key}.png"
+        
+    if not icon_filename.endswith('.png'):
+        icon_filename += ".png"
+        
+    icon = icon_cache.get(icon_filename, size) if target_image else None
+    if icon:
+        w, h = icon.size
+        target_image.paste(icon, (int(cx - w/2), int(cy - h/2)), icon)
+        return
+
+    # Fallback to procedural icons
+    name = name.lower()
+    color = config.COLOR_ACCENT
+    
+    # Scale drawing based on size (assuming 60 is base)
+    s = size / 60.0
+    
+    if "setting" in name:
+        draw.ellipse((cx-30*s, cy-30*s, cx+30*s, cy+30*s), outline=color, width=int(5*s))
+        draw.ellipse((cx-10*s, cy-10*s, cx+10*s, cy+10*s), fill=color)
+    elif "torch" in name:
+        draw.ellipse((cx-25*s, cy-35*s, cx+25*s, cy+15*s), fill="yellow")
+        draw.rectangle((cx-10*s, cy+15*s, cx+10*s, cy+35*s), fill="gray")
+    elif "snake" in name:
+        draw.arc((cx-20*s, cy-30*s, cx+20*s, cy), 180, 0, fill="green", width=int(5*s))
+        draw.arc((cx-20*s, cy, cx+20*s, cy+30*s), 0, 180, fill="green", width=int(5*s))
+    elif "pong" in name:
+        draw.rectangle((cx-30*s, cy-20*s, cx-25*s, cy+20*s), fill="white")
+        draw.rectangle((cx+25*s, cy-20*s, cx+30*s, cy+20*s), fill="white")
+        draw.ellipse((cx-5*s, cy-5*s, cx+5*s, cy+5*s), fill="white")
+    elif "racing" in name:
+        draw.rectangle((cx-20*s, cy-10*s, cx+20*s, cy+10*s), fill="red")
+        draw.ellipse((cx-15*s, cy+5*s, cx-5*s, cy+15*s), fill="white")
+        draw.ellipse((cx+5*s, cy+5*s, cx+15*s, cy+15*s), fill="white")
+    elif "breakout" in name:
+        draw.rectangle((cx-30*s, cy-30*s, cx+30*s, cy-10*s), fill="orange")
+        draw.rectangle((cx-10*s, cy+20*s, cx+10*s, cy+25*s), fill="white")
+        draw.ellipse((cx-3*s, cy, cx+3*s, cy+6*s), fill="white")
+    elif "lander" in name:
+        draw.polygon([(cx, cy-20*s), (cx-20*s, cy+20*s), (cx+20*s, cy+20*s)], outline="white", width=int(3*s))
+    elif "space" in name:
+        draw.rectangle((cx-20*s, cy-10*s, cx+20*s, cy+10*s), fill="green")
+        draw.rectangle((cx-10*s, cy-20*s, cx+10*s, cy-10*s), fill="green")
+        draw.rectangle((cx-25*s, cy+10*s, cx-15*s, cy+20*s), fill="green")
+        draw.rectangle((cx+15*s, cy+10*s, cx+25*s, cy+20*s), fill="green")
+    elif "tools" in name:
+        draw.rectangle((cx-5*s, cy-20*s, cx+5*s, cy+10*s), fill="gray")
+        draw.rectangle((cx-15*s, cy-30*s, cx+15*s, cy-20*s), fill="gray")
+    elif "games" in name:
+        draw.rectangle((cx-25*s, cy-15*s, cx+25*s, cy+15*s), fill="purple")
+        draw.ellipse((cx-15*s, cy, cx-5*s, cy+10*s), fill="black")
+        draw.ellipse((cx+5*s, cy-5*s, cx+15*s, cy+5*s), fill="black")
+    elif "apps" in name:
+        draw.rectangle((cx-20*s, cy-20*s, cx-5*s, cy-5*s), fill="blue")
+        draw.rectangle((cx+5*s, cy-20*s, cx+20*s, cy-5*s), fill="blue")
+        draw.rectangle((cx-20*s, cy+5*s, cx-5*s, cy+20*s), fill="blue")
+        draw.rectangle((cx+5*s, cy+5*s, cx+20*s, cy+20*s), fill="blue")
+    else:
+        draw.rectangle((cx-20*s, cy-20*s, cx+20*s, cy+20*s), outline=color, width=int(2*s))
+
+# ==========================================
+# Retained widgets
+# ==========================================
+# Widgets keep their own rectangle (x0, y0, x1, y1, exclusive ends, same as
+# core/damage.py). Changing a property through set() marks only that area
+# dirty; Screen.render() then repaints just the dirty regions and returns
+# them so they can be fed to DisplayManager.invalidate().
+
+class Widget:
+    def __init__(self, rect, visible=True):
+        self.rect = tuple(rect)
+        self.visible = visible
+        self.parent = None # Screen or Card that receives our damage
+
+    def set(self, **props):
+        changed = {k: v for k, v in props.items() if getattr(self, k) != v}
+        if not changed:
+            return False
+        # Old and new area (the rect or visibility may be what changed)
+        self.mark_dirty()
+        for k, v in changed.items():
+            setattr(self, k, tuple(v) if k == 'rect' else v)
+        self.mark_dirty()
+        return True
+
+    def mark_dirty(self, rect=None):
+        if self.parent:
+            self.parent.damage(rect or self.rect)
+
+    def drop_cache(self):
+        # Cached renders are stale (e.g. icons changed on disk)
+        pass
+
+    def paint(self, draw, image, dx, dy):
+        # Draw at rect shifted by (dx, dy); the caller clips to the dirty region
+        pass
+
+class Label(Widget):
+    def __init__(self, rect, text="", font=None, color=None, bg=None, align="left", padding=(0, 0), scroll=0, visible=True):
+        super().__init__(rect, visible)
+        self.text = text
+        self.font = font or load_font(config.FONT_SIZE_NORMAL)
+        self.color = color or config.COLOR_TEXT
+        self.bg = bg
+        self.align = align
+        self.padding = padding
+        self.scroll = scroll # Horizontal text offset (marquee)
+
+    def paint(self, draw, image, dx, dy):
+        x0, y0, x1, y1 = self.rect
+        if self.bg is not None:
+            draw.rectangle((x0 + dx, y0 + dy, x1 - 1 + dx, y1 - 1 + dy), fill=self.bg)
+        if not self.text:
+            return
+            
+        bbox = text_bbox(self.text, self.font)
+        text_w = bbox[2] - bbox[0]
+        if self.align == "center":
+            tx = x0 + (x1 - x0) // 2 - text_w // 2
+        else:
+            tx = x0 + self.padding[0]
+        tx -= self.scroll
+        ty = y0 + self.padding[1]
+        
+        if self.scroll or text_w > x1 - x0:
+            # Text sticks out of the label: draw through a strip so it is clipped
+            box = (x0 + dx, y0 + dy, x1 + dx, y1 + dy)
+            strip = image.crop(box)
+            draw_text(ImageDraw.Draw(strip), (tx - x0, ty - y0), self.text, font=self.font, fill=self.color)
+            image.paste(strip, box[:2])
+        else:
+            draw_text(draw, (tx + dx, ty + dy), self.text, font=self.font, fill=self.color)
+
+class Icon(Widget):
+    def __init__(self, cx, cy, name, size=60, visible=True):
+        half = size // 2
+        super().__init__((cx - half - 1, cy - half - 1, cx + half + 2, cy + half + 2), visible)
+        self.cx = cx
+        self.cy = cy
+        self.name = name
+        self.size = size
+
+    def paint(self, draw, image, dx, dy):
+        draw_icon(draw, self.name, self.cx + dx, self.cy + dy, self.size, image)
+
+class Card(Widget):
+    # Framed panel whose children (positioned relative to the card) are
+    # rendered once into a sprite per style; moving the card just pastes it.
+    def __init__(self, rect, fill=(30, 30, 30), outline=(100, 100, 100), width=3, visible=True):
+        super().__init__(rect, visible)
+        self.fill = fill
+        self.outline = outline
+        self.width = width
+        self.children = []
+        self.sprites = {} # (fill, outline, width) -> Image
+
+    def add(self, widget):
+        widget.parent = self
+        self.children.append(widget)
+        self.damage(widget.rect)
+        return widget
+
+    def damage(self, rect):
+        # A child changed: every cached style is stale
+        self.sprites = {}
+        self.mark_dirty()
+
+    def drop_cache(self):
+        self.sprites = {}
+        for child in self.children:
+            child.drop_cache()
+
+    def paint(self, draw, image, dx, dy):
+        key = (self.fill, self.outline, self.width)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self._render()
+            self.sprites[key] = sprite
+        image.paste(sprite, (self.rect[0] + dx, self.rect[1] + dy))
+
+    def _render(self):
+        w = self.rect[2] - self.rect[0]
+        h = self.rect[3] - self.rect[1]
+        sprite = Image.new("RGB", (w, h), self.fill)
+        draw = ImageDraw.Draw(sprite)
+        draw.rectangle((0, 0, w - 1, h - 1), fill=self.fill, outline=self.outline, width=self.width)
+        for child in self.children:
+            if child.visible:
+                child.paint(draw, sprite, 0, 0)
+        return sprite
+
+class List(Widget):
+    # Scrolling list that only paints the visible rows. Each row is drawn
+    # once by row_painter(draw, image, index, selected) at y=0 into a cached
+    # sprite; moving the selection without scrolling repaints just two rows.
+    def __init__(self, rect, items, row_h, row_painter, max_sprites=64, visible=True):
+        super().__init__(rect, visible)
+        self.items = items
+        self.row_h = row_h
+        self.row_painter = row_painter
+        self.visible_rows = (self.rect[3] - self.rect[1]) // row_h
+        self.selected = 0
+        self.top = 0
+        self.sprites = OrderedDict() # (index, label, selected) -> Image
+        self.max_sprites = max_sprites
+
+    def set_items(self, items):
+        self.items = items
+        self.sprites.clear()
+        self.mark_dirty()
+
+    def select(self, index, top):
+        if top != self.top:
+            self.selected = index
+            self.top = top
+            self.mark_dirty()
+        elif index != self.selected:
+            self.mark_dirty(self.row_rect(self.selected))
+            self.selected = index
+            self.mark_dirty(self.row_rect(index))
+
+    def row_rect(self, index):
+        y = self.rect[1] + (index - self.top) * self.row_h
+        return (self.rect[0], y, self.rect[2], y + self.row_h)
+
+    def drop_cache(self):
+        self.sprites.clear()
+
+    def paint(self, draw, image, dx, dy):
+        x0, y0, x1, y1 = self.rect
+        for i in range(self.visible_rows):
+            idx = self.top + i
+            if idx >= len(self.items): break
+            image.paste(self._get_row_sprite(idx), (x0 + dx, y0 + i * self.row_h + dy))
+            
+        # Scroll position for lists longer than a screen
+        if len(self.items) > self.visible_rows:
+            track_h = self.visible_rows * self.row_h - 5
+            thumb_h = max(10, track_h * self.visible_rows // len(self.items))
+            max_top = len(self.items) - self.visible_rows
+            thumb_y = y0 + (track_h - thumb_h) * self.top // max_top
+            draw.rectangle((x1 - 4 + dx, thumb_y + dy, x1 - 2 + dx, thumb_y + thumb_h + dy), fill=(100, 100, 100))
+
+    def _get_row_sprite(self, idx):
+        is_selected = (idx == self.selected)
+        key = (idx, self.items[idx]['label'], is_selected)
+        sprite = self.sprites.get(key)
+        if sprite:
+            self.sprites.move_to_end(key)
+            return sprite
+            
+        sprite = Image.new("RGB", (self.rect[2] - self.rect[0], self.row_h), config.COLOR_BG)
+        self.row_painter(ImageDraw.Draw(sprite), sprite, idx, is_selected)
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+        return sprite
+
+class Overlay(Widget):
+    # Framed box with centered text, drawn above everything added before it
+    def __init__(self, rect, text="", font=None, fill=(30, 30, 30), outline=None, color="white", visible=False):
+        super().__init__(rect, visible)
+        self.text = text
+        self.font = font or load_font(config.FONT_SIZE_LARGE, bold=True)
+        self.fill = fill
+        self.outline = outline or config.COLOR_ACCENT
+        self.color = color
+
+    def paint(self, draw, image, dx, dy):
+        x0, y0, x1, y1 = self.rect
+        draw.rectangle((x0 + dx, y0 + dy, x1 - 1 + dx, y1 - 1 + dy), fill=self.fill, outline=self.outline, width=2)
+        if self.text:
+            bbox = text_bbox(self.text, self.font)
+            cx = (x0 + x1) // 2 + dx
+            cy = (y0 + y1) // 2 + dy
+            draw_text(draw, (cx - (bbox[2] + bbox[0]) // 2, cy - (bbox[3] + bbox[1]) // 2), self.text, font=self.font, fill=self.color)
+
+class KeyGrid(Widget):
+    # On-screen keyboard keys. Each layout is pre-rendered once in two
+    # bitmaps (all keys normal / all keys highlighted) with a key-rect
+    # table; the selected key is a crop of the highlighted bitmap, so moving
+    # the selection repaints just two keys.
+    def __init__(self, rect, layout, font, font_small, key_height=30, visible=True):
+        super().__init__(rect, visible)
+        self.layout = layout
+        self.font = font
+        self.font_small = font_small
+        self.key_height = key_height
+        self.selected = 0
+        self.bitmaps = {} # id(layout) -> (normal, highlighted, key rects)
+
+    def select(self, index):
+        if index != self.selected:
+            rects = self._get_bitmaps()[2]
+            self.mark_dirty(self._screen_rect(rects[self.selected]))
+            self.selected = index
+            self.mark_dirty(self._screen_rect(rects[index]))
+
+    def key_rects(self):
+        # Key rects in grid coordinates, in flat (row by row) order
+        return self._get_bitmaps()[2]
+
+    def drop_cache(self):
+        self.bitmaps = {}
+
+    def paint(self, draw, image, dx, dy):
+        normal, highlighted, rects = self._get_bitmaps()
+        x0, y0 = self.rect[0] + dx, self.rect[1] + dy
+        image.paste(normal, (x0, y0))
+        if self.selected < len(rects):
+            key_rect = rects[self.selected]
+            image.paste(highlighted.crop(key_rect), (x0 + key_rect[0], y0 + key_rect[1]))
+
+    def _screen_rect(self, key_rect):
+        return (key_rect[0] + self.rect[0], key_rect[1] + self.rect[1], key_rect[2] + self.rect[0], key_rect[3] + self.rect[1])
+
+    def _get_bitmaps(self):
+        entry = self.bitmaps.get(id(self.layout))
+        if entry is None:
+            entry = self._render(self.layout)
+            self.bitmaps[id(self.layout)] = entry
+        return entry
+
+    def _render(self, layout):
+        size = (self.rect[2] - self.rect[0], self.rect[3] - self.rect[1])
+        normal = Image.new("RGB", size, (20, 20, 20))
+        highlighted = Image.new("RGB", size, (20, 20, 20))
+        normal_draw = ImageDraw.Draw(normal)
+        highlighted_draw = ImageDraw.Draw(highlighted)
+        
+        key_width = size[0] // 10
+        key_height = self.key_height
+        rects = []
+        
+        for r, row in enumerate(layout):
+            # Calculate Position
+            row_width = len(row) * key_width
+            start_x = (size[0] - row_width) // 2
+            
+            for c, key in enumerate(row):
+                if r == len(layout) - 1: # Bottom row
+                    key_width_special = size[0] // 4
+                    x = c * key_width_special
+                    w = key_width_special
+                else:
+                    x = start_x + c * key_width
+                    w = key_width
+                y = r * key_height
+                rects.append((x, y, x + w, y + key_height))
+                
+                font = self.font
+                if len(key) > 1: font = self.font_small
+                bbox = text_bbox(key, font)
+                text_w = bbox[2] - bbox[0]
+                text_h = bbox[3] - bbox[1]
+                text_pos = (x + (w - text_w) // 2, y + (key_height - text_h) // 2 - 2)
+                
+                normal_draw.rectangle((x + 2, y + 2, x + w - 2, y + key_height - 2), outline=(100, 100, 100))
+                draw_text(normal_draw, text_pos, key, font=font, fill=(200, 200, 200))
+                highlighted_draw.rectangle((x + 2, y + 2, x + w - 2, y + key_height - 2), fill=config.COLOR_ACCENT)
+                draw_text(highlighted_draw, text_pos, key, font=font, fill="white")
+                
+        return normal, highlighted, rects
+
+class Screen:
+    # Root of a widget tree. Keeps a private canvas, repaints only the dirty
+    # regions (widgets in the order they were added, clipped to each region)
+    # and pastes the canvas into the target framebuffer.
+    def __init__(self, background=None):
+        self.width = config.DISPLAY_WIDTH
+        self.height = config.DISPLAY_HEIGHT
+        self.background = background or config.COLOR_BG
+        self.canvas = Image.new("RGB", (self.width, self.height), self.background)
+        self.widgets = []
+        self.dirty = []
+        self.icon_generation = icon_cache.generation
+        self.stats = {
+            'renders': 0,
+            'pixels_redrawn': 0,
+            'last_pixels': 0,
+            'last_rects': 0
+        }
+        self.invalidate()
+
+    def add(self, widget):
+        widget.parent = self
+        self.widgets.append(widget)
+        self.damage(widget.rect)
+        return widget
+
+    def remove(self, widget):
+        self.widgets.remove(widget)
+        widget.parent = None
+        self.damage(widget.rect)
+
+    def clear(self):
+        self.widgets = []
+        self.invalidate()
+
+    def damage(self, rect):
+        rect = clip_rect(rect, self.width, self.height)
+        if rect_area(rect):
+            self.dirty.append(rect)
+
+    def invalidate(self):
+        self.dirty = [(0, 0, self.width, self.height)]
+
+    def get_stats(self):
+        return dict(self.stats)
+
+    def render(self, target_image=None):
+        if icon_cache.check() != self.icon_generation:
+            self.icon_generation = icon_cache.generation
+            for widget in self.widgets:
+                widget.drop_cache()
+            self.invalidate()
+            
+        rects, self.dirty = coalesce_rects(self.dirty), []
+        pixels = 0
+        for rect in rects:
+            x0, y0, x1, y1 = rect
+            region = Image.new("RGB", (x1 - x0, y1 - y0), self.background)
+            draw = ImageDraw.Draw(region)
+            for widget in self.widgets:
+                if widget.visible and rects_overlap(widget.rect, rect):
+                    widget.paint(draw, region, -x0, -y0)
+            self.canvas.paste(region, (x0, y0))
+            pixels += rect_area(rect)
+            
+        self.stats['renders'] += 1
+        self.stats['pixels_redrawn'] += pixels
+        self.stats['last_pixels'] = pixels
+        self.stats['last_rects'] = len(rects)
+        
+        if target_image:
+            # Someone else may have drawn over the framebuffer since last frame
+            target_image.paste(self.canvas, (0, 0))
+        return rects
+
 
 class BaseMenu:
     def __init__(self, items, title="Menu"):
@@ -40,87 +667,15 @@ class BaseMenu:
     def update(self):
         pass
 
+    def next_redraw(self):
+        # Menus are static between inputs (see AppManager event-driven loop)
+        return None
+
     def draw(self, draw, target_image=None):
         pass
 
     def _draw_icon(self, draw, name, cx, cy, size=60, target_image=None):
-        # Check for custom icon first
-        import os
-        
-        # Check Config Mapping first
-        key = name.lower().replace(" ", "_")
-        if "]" in key: key = key.split("]")[-1].strip()
-        
-        icon_filename = config.ICONS.get(key, None)
-        
-        if not icon_filename:
-            # Default lookup
-            icon_filename = f"{key}.png"
-            
-        if not icon_filename.endswith('.png'):
-            icon_filename += ".png"
-            
-        icon_path = f"assets/icons/{icon_filename}"
-        
-        if os.path.exists(icon_path) and target_image:
-            try:
-                icon = Image.open(icon_path).convert("RGBA")
-                icon.thumbnail((size, size))
-                w, h = icon.size
-                target_image.paste(icon, (int(cx - w/2), int(cy - h/2)), icon)
-                return
-            except Exception as e:
-                print(f"Error loading icon {icon_path}: {e}")
-
-        # Fallback to procedural icons
-        name = name.lower()
-        color = config.COLOR_ACCENT
-        
-        # Scale drawing based on size (assuming 60 is base)
-        s = size / 60.0
-        
-        if "setting" in name:
-            draw.ellipse((cx-30*s, cy-30*s, cx+30*s, cy+30*s), outline=color, width=int(5*s))
-            draw.ellipse((cx-10*s, cy-10*s, cx+10*s, cy+10*s), fill=color)
-        elif "torch" in name:
-            draw.ellipse((cx-25*s, cy-35*s, cx+25*s, cy+15*s), fill="yellow")
-            draw.rectangle((cx-10*s, cy+15*s, cx+10*s, cy+35*s), fill="gray")
-        elif "snake" in name:
-            draw.arc((cx-20*s, cy-30*s, cx+20*s, cy), 180, 0, fill="green", width=int(5*s))
-            draw.arc((cx-20*s, cy, cx+20*s, cy+30*s), 0, 180, fill="green", width=int(5*s))
-        elif "pong" in name:
-            draw.rectangle((cx-30*s, cy-20*s, cx-25*s, cy+20*s), fill="white")
-            draw.rectangle((cx+25*s, cy-20*s, cx+30*s, cy+20*s), fill="white")
-            draw.ellipse((cx-5*s, cy-5*s, cx+5*s, cy+5*s), fill="white")
-        elif "racing" in name:
-            draw.rectangle((cx-20*s, cy-10*s, cx+20*s, cy+10*s), fill="red")
-            draw.ellipse((cx-15*s, cy+5*s, cx-5*s, cy+15*s), fill="white")
-            draw.ellipse((cx+5*s, cy+5*s, cx+15*s, cy+15*s), fill="white")
-        elif "breakout" in name:
-            draw.rectangle((cx-30*s, cy-30*s, cx+30*s, cy-10*s), fill="orange")
-            draw.rectangle((cx-10*s, cy+20*s, cx+10*s, cy+25*s), fill="white")
-            draw.ellipse((cx-3*s, cy, cx+3*s, cy+6*s), fill="white")
-        elif "lander" in name:
-            draw.polygon([(cx, cy-20*s), (cx-20*s, cy+20*s), (cx+20*s, cy+20*s)], outline="white", width=int(3*s))
-        elif "space" in name:
-            draw.rectangle((cx-20*s, cy-10*s, cx+20*s, cy+10*s), fill="green")
-            draw.rectangle((cx-10*s, cy-20*s, cx+10*s, cy-10*s), fill="green")
-            draw.rectangle((cx-25*s, cy+10*s, cx-15*s, cy+20*s), fill="green")
-            draw.rectangle((cx+15*s, cy+10*s, cx+25*s, cy+20*s), fill="green")
-        elif "tools" in name:
-            draw.rectangle((cx-5*s, cy-20*s, cx+5*s, cy+10*s), fill="gray")
-            draw.rectangle((cx-15*s, cy-30*s, cx+15*s, cy-20*s), fill="gray")
-        elif "games" in name:
-            draw.rectangle((cx-25*s, cy-15*s, cx+25*s, cy+15*s), fill="purple")
-            draw.ellipse((cx-15*s, cy, cx-5*s, cy+10*s), fill="black")
-            draw.ellipse((cx+5*s, cy-5*s, cx+15*s, cy+5*s), fill="black")
-        elif "apps" in name:
-            draw.rectangle((cx-20*s, cy-20*s, cx-5*s, cy-5*s), fill="blue")
-            draw.rectangle((cx+5*s, cy-20*s, cx+20*s, cy-5*s), fill="blue")
-            draw.rectangle((cx-20*s, cy+5*s, cx-5*s, cy+20*s), fill="blue")
-            draw.rectangle((cx+5*s, cy+5*s, cx+20*s, cy+20*s), fill="blue")
-        else:
-            draw.rectangle((cx-20*s, cy-20*s, cx+20*s, cy+20*s), outline=color, width=int(2*s))
+        draw_icon(draw, name, cx, cy, size, target_image)
 
 class CarouselMenu(BaseMenu):
     def __init__(self, items, title="Menu"):
@@ -128,153 +683,332 @@ class CarouselMenu(BaseMenu):
         self.scroll_offset = 0
         self.target_scroll_offset = 0
         self.scroll_accumulator = 0
+        self.marquee_active = False # Selected label is scrolling
+        
+        # Eased slide between cards (time based, so it runs at any frame rate)
+        self.anim_start = None
+        self.anim_from = 0
+        
+        margin = 10
+        self.card_x = margin
+        self.card_y = margin + config.TOP_BAR_HEIGHT
+        self.card_w = config.DISPLAY_WIDTH - 2 * margin
+        self.card_h = config.DISPLAY_HEIGHT - 2 * margin - config.TOP_BAR_HEIGHT
+        
+        self.screen = Screen()
+        self._build()
 
     def move_selection(self, delta):
         # Accumulate steps to prevent too fast scrolling
         self.scroll_accumulator += delta
         
-        # Only move every 2 steps
-        if abs(self.scroll_accumulator) >= 2:
-            move_dir = 1 if self.scroll_accumulator > 0 else -1
+        # Only move every 2 steps (a coalesced burst may move several cards)
+        moves = int(self.scroll_accumulator / 2)
+        if moves:
+            move_dir = 1 if moves > 0 else -1
             self.scroll_accumulator = 0 
             
-            self.selected_index = (self.selected_index + move_dir) % len(self.items)
+            old_index = self.selected_index
+            self.selected_index = (self.selected_index + moves) % len(self.items)
             self.target_scroll_offset = self.selected_index * config.DISPLAY_WIDTH
+            
+            # Slide from where we are now; on wrap-around or a multi-card move,
+            # slide in from the neighbouring position instead of sweeping past every card
+            if self.selected_index - old_index == move_dir:
+                self.anim_from = self.scroll_offset
+            else:
+                self.anim_from = self.target_scroll_offset - move_dir * config.DISPLAY_WIDTH
+            self.anim_start = clock.monotonic()
+
+    def invalidate(self):
+        # Call after changing items/labels
+        self._build()
 
     def update(self):
-        # Snap to target (No animation for performance)
-        self.scroll_offset = self.target_scroll_offset
+        if self.anim_start is None:
+            self.scroll_offset = self.target_scroll_offset
+            return
+            
+        t = (clock.monotonic() - self.anim_start) / config.MENU_SLIDE_TIME
+        if t >= 1:
+            self.anim_start = None
+            self.scroll_offset = self.target_scroll_offset
+        else:
+            ease = 1 - (1 - t) ** 3 # Ease-out cubic
+            self.scroll_offset = self.anim_from + (self.target_scroll_offset - self.anim_from) * ease
+
+    def next_redraw(self):
+        if self.anim_start is not None:
+            return 0 # Every frame while sliding
+        return 0.05 if self.marquee_active else None
 
     def draw(self, draw, target_image=None):
-        draw.rectangle((0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), fill=config.COLOR_BG)
+        # Returns the regions that were repainted
+        self._layout()
+        return self.screen.render(target_image)
+
+    def _build(self):
+        # One card per item; the card caches its own rendering per style
+        self.screen.clear()
+        self.cards = []
+        card_w, card_h = self.card_w, self.card_h
         
-        # Draw Carousel Items
-        for i, item in enumerate(self.items):
-            x = (i * config.DISPLAY_WIDTH) - self.scroll_offset
-            
-            # Optimization: Only draw if visible
-            if x < -config.DISPLAY_WIDTH or x > config.DISPLAY_WIDTH:
-                continue
-                
-            margin = 10
-            card_x = x + margin
-            card_y = margin + config.TOP_BAR_HEIGHT
-            card_w = config.DISPLAY_WIDTH - 2 * margin
-            card_h = config.DISPLAY_HEIGHT - 2 * margin - config.TOP_BAR_HEIGHT
-            
-            is_selected = (i == self.selected_index)
-            bg_color = (30, 30, 30) if not is_selected else (50, 50, 50)
-            outline_color = config.COLOR_ACCENT if is_selected else (100, 100, 100)
+        for item in self.items:
+            label = item['label']
+            card = Card((0, 0, card_w + 1, card_h + 1))
+            card.add(Icon(card_w // 2, card_h // 2 - 20, label, size=60))
             
-            draw.rectangle((card_x, card_y, card_x + card_w, card_y + card_h), fill=bg_color, outline=outline_color, width=3)
+            # Long labels are truncated; the selected one scrolls (marquee)
+            bbox = text_bbox(label, self.title_font)
+            text_w = bbox[2] - bbox[0]
+            while text_w > card_w - 40 and len(label) > 3:
+                label = label[:-4] + "..."
+                bbox = text_bbox(label, self.title_font)
+                text_w = bbox[2] - bbox[0]
+            card.add(Label((0, card_h - 40, card_w, card_h - 40 + bbox[3] + 4), label, self.title_font, align="center"))
             
-            # Draw Icon
-            icon_center_x = card_x + card_w // 2
-            icon_center_y = card_y + card_h // 2 - 20
-            self._draw_icon(draw, item['label'], icon_center_x, icon_center_y, size=60, target_image=target_image)
+            self.cards.append(self.screen.add(card))
             
-            # Draw Label
-            label = item['label']
-            bbox = draw.textbbox((0, 0), label, font=self.title_font)
-            text_w = bbox[2] - bbox[0]
+        # Above the cards, covering the truncated label of the selected card
+        self.marquee = self.screen.add(Label((0, 0, 0, 0), font=self.title_font, bg=(50, 50, 50), visible=False))
+        self._layout()
+
+    def _layout(self):
+        width = config.DISPLAY_WIDTH
+        count = len(self.cards)
+        self.marquee_active = False
+        
+        for i, card in enumerate(self.cards):
+            # Nearest copy of the card to the viewport, so wrap-around slides
+            # show the neighbour on the other end of the list
+            pos = i + round((self.scroll_offset / width - i) / count) * count
+            x = round(pos * width - self.scroll_offset) + self.card_x
             
-            text_x = icon_center_x - text_w // 2
-            text_y = card_y + card_h - 40
+            is_selected = (i == self.selected_index)
+            card.set(
+                rect=(x, self.card_y, x + self.card_w + 1, self.card_y + self.card_h + 1),
+                fill=(50, 50, 50) if is_selected else (30, 30, 30),
+                outline=config.COLOR_ACCENT if is_selected else (100, 100, 100)
+            )
             
             # Marquee if selected and too long
-            if is_selected and text_w > card_w - 20:
-                t = time.time()
-                scroll_speed = 50
-                scroll_dist = text_w - (card_w - 20) + 50
-                period = scroll_dist / scroll_speed + 2
-                phase = t % period
-                
-                if phase < 1: offset = 0
-                elif phase < period - 1: offset = (phase - 1) * scroll_speed
-                else: offset = scroll_dist - 50
-                
-                offset = min(offset, text_w - (card_w - 20))
-                text_x = icon_center_x - (card_w - 20) // 2 - offset
+            label = self.items[i]['label']
+            bbox = text_bbox(label, self.title_font)
+            text_w = bbox[2] - bbox[0]
+            if is_selected and text_w > self.card_w - 20:
+                self.marquee_active = True
+                visible_w = self.card_w - 20
+                y = self.card_y + self.card_h - 40
+                self.marquee.set(
+                    rect=(x + 10, y, x + 10 + visible_w, y + bbox[3] + 4),
+                    text=label,
+                    scroll=round(self._marquee_offset(text_w, visible_w)),
+                    visible=True
+                )
                 
-            elif not is_selected and text_w > card_w - 20:
-                 # Truncate
-                 while text_w > card_w - 40 and len(label) > 3:
-                     label = label[:-4] + "..."
-                     bbox = draw.textbbox((0, 0), label, font=self.title_font)
-                     text_w = bbox[2] - bbox[0]
-                 text_x = icon_center_x - text_w // 2
+        if not self.marquee_active:
+            self.marquee.set(visible=False)
 
-            draw.text((text_x, text_y), label, font=self.title_font, fill=config.COLOR_TEXT)
+    def _marquee_offset(self, text_w, visible_w):
+        t = clock.monotonic()
+        scroll_speed = 50
+        scroll_dist = text_w - visible_w + 50
+        period = scroll_dist / scroll_speed + 2
+        phase = t % period
+        
+        if phase < 1: offset = 0
+        elif phase < period - 1: offset = (phase - 1) * scroll_speed
+        else: offset = scroll_dist - 50
+        return min(offset, text_w - visible_w)
+
+class ScrollAccelerator:
+    # Turns detent timing into a step size: turning slowly moves one row,
+    # a fast spin moves a page, and a long fast spin jumps whole letter groups.
+    STEP, PAGE, JUMP = 0, 1, 2
+    
+    def __init__(self, fast_interval=None, page_after=3, jump_after=10):
+        self.fast_interval = fast_interval or config.LIST_FAST_INTERVAL
+        self.page_after = page_after
+        self.jump_after = jump_after
+        self.last_time = 0
+        self.last_dir = 0
+        self.burst = 0 # Consecutive fast detents in the same direction
+        
+    def feed(self, delta, now=None):
+        now = now if now is not None else clock.monotonic()
+        direction = 1 if delta > 0 else -1
+        
+        # A coalesced burst (|delta| > 1) is a fast spin by definition
+        if direction == self.last_dir and (now - self.last_time < self.fast_interval or abs(delta) > 1):
+            self.burst += abs(delta)
+        else:
+            self.burst = abs(delta) - 1
+        self.last_time = now
+        self.last_dir = direction
+        
+        if self.burst >= self.jump_after:
+            return self.JUMP
+        if self.burst >= self.page_after:
+            return self.PAGE
+        return self.STEP
 
 class ListMenu(BaseMenu):
+    # Only the visible rows are ever touched: rows are rendered once into
+    # cached sprites and selection moves are O(1) (letter jumps O(log n)),
+    # so lists with thousands of items stay responsive.
     def __init__(self, items, title="Menu"):
         super().__init__(items, title)
         self.visible_items = 5
         self.scroll_top = 0
+        self.item_h = 40
+        self.accel = ScrollAccelerator()
+        self.jump_label = None # Letter shown while jumping
+        self.jump_time = 0
+        
+        self.screen = Screen()
+        top = config.TOP_BAR_HEIGHT
+        self.title_label = self.screen.add(Label((0, top, config.DISPLAY_WIDTH, top + 41), title, self.title_font,
+                                                 color=config.COLOR_ACCENT, bg=(30, 30, 30), padding=(10, 5)))
+        start_y = top + 50
+        self.list = self.screen.add(List((0, start_y, config.DISPLAY_WIDTH, start_y + self.visible_items * self.item_h),
+                                         items, self.item_h, self._draw_row))
+        cx, cy = config.DISPLAY_WIDTH // 2, config.DISPLAY_HEIGHT // 2
+        self.overlay = self.screen.add(Overlay((cx - 30, cy - 30, cx + 31, cy + 31), font=self.title_font))
+        self.set_items(items)
 
-    def move_selection(self, delta):
-        self.selected_index = (self.selected_index + delta) % len(self.items)
+    def set_items(self, items):
+        self.items = items
+        self.selected_index = min(self.selected_index, max(0, len(items) - 1))
+        self.list.set_items(items)
+        
+        # First index of every letter group, for jumping through sorted lists
+        keys = [item['label'][:1].upper() for item in items]
+        self.letter_starts = None
+        if keys == sorted(keys):
+            self.letter_starts = [i for i, k in enumerate(keys) if i == 0 or k != keys[i - 1]]
+        self._scroll_to_selection()
+
+    def move_selection(self, delta, fast=False):
+        # fast: press-and-turn, jump straight to the next letter group (or page)
+        if not self.items:
+            return
+        if len(self.items) <= self.visible_items:
+            speed = ScrollAccelerator.STEP # Fits on screen: nothing to page through, keep wrapping
+        else:
+            speed = ScrollAccelerator.JUMP if fast else self.accel.feed(delta)
+        last = len(self.items) - 1
         
-        # Adjust scroll
+        if speed == ScrollAccelerator.JUMP and self.letter_starts and len(self.letter_starts) > 1:
+            self.selected_index = self._letter_jump(delta)
+            self.jump_label = self.items[self.selected_index]['label'][:1].upper()
+            self.jump_time = clock.monotonic()
+        elif speed != ScrollAccelerator.STEP:
+            # Page at a time; stop at the ends instead of wrapping mid-spin
+            step = self.visible_items if delta > 0 else -self.visible_items
+            self.selected_index = max(0, min(last, self.selected_index + step))
+        else:
+            self.selected_index = (self.selected_index + delta) % len(self.items)
+            
+        self._scroll_to_selection()
+
+    def next_redraw(self):
+        if self.jump_label:
+            return max(0, config.LIST_JUMP_OVERLAY_TIME - (clock.monotonic() - self.jump_time))
+        return None
+
+    def _letter_jump(self, delta):
+        starts = self.letter_starts
+        if delta > 0:
+            i = bisect.bisect_right(starts, self.selected_index)
+            return starts[i] if i < len(starts) else len(self.items) - 1
+        # Start of the current group, or of the previous one if already there
+        i = bisect.bisect_left(starts, self.selected_index)
+        return starts[max(0, i - 1)]
+
+    def _scroll_to_selection(self):
         if self.selected_index < self.scroll_top:
             self.scroll_top = self.selected_index
         elif self.selected_index >= self.scroll_top + self.visible_items:
             self.scroll_top = self.selected_index - self.visible_items + 1
 
     def draw(self, draw, target_image=None):
-        draw.rectangle((0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), fill=config.COLOR_BG)
+        # Returns the regions that were repainted
+        self.title_label.set(text=self.title)
+        self.list.select(self.selected_index, self.scroll_top)
         
-        # Title
-        draw.rectangle((0, config.TOP_BAR_HEIGHT, config.DISPLAY_WIDTH, config.TOP_BAR_HEIGHT + 40), fill=(30, 30, 30))
-        draw.text((10, config.TOP_BAR_HEIGHT + 5), self.title, font=self.title_font, fill=config.COLOR_ACCENT)
+        # Letter overlay while jumping
+        if self.jump_label and clock.monotonic() - self.jump_time >= config.LIST_JUMP_OVERLAY_TIME:
+            self.jump_label = None
+        self.overlay.set(text=self.jump_label or "", visible=bool(self.jump_label))
         
-        # Items
-        start_y = config.TOP_BAR_HEIGHT + 50
-        item_h = 40
+        return self.screen.render(target_image)
+
+    def _draw_row(self, draw, target_image, idx, is_selected):
+        item = self.items[idx]
+        item_h = self.item_h
+        y = 0
         
-        for i in range(self.visible_items):
-            idx = self.scroll_top + i
-            if idx >= len(self.items): break
-            
-            item = self.items[idx]
-            y = start_y + i * item_h
-            
-            is_selected = (idx == self.selected_index)
-            
-            if is_selected:
-                draw.rectangle((5, y, config.DISPLAY_WIDTH - 5, y + item_h - 5), fill=config.COLOR_ACCENT)
-                text_color = "white"
-            else:
-                text_color = config.COLOR_TEXT
-                
-            # Draw Icon
-            icon_size = 30
-            icon_x = 25 # Center of icon area
-            icon_y = y + item_h // 2
-            
-            self._draw_icon(draw, item['label'], icon_x, icon_y, size=icon_size, target_image=target_image)
+        if is_selected:
+            draw.rectangle((5, y, config.DISPLAY_WIDTH - 5, y + item_h - 5), fill=config.COLOR_ACCENT)
+            text_color = "white"
+        else:
+            text_color = config.COLOR_TEXT
             
-            # Draw Text
-            draw.text((50, y + 5), item['label'], font=self.font, fill=text_color)
+        # Draw Icon
+        icon_size = 30
+        icon_x = 25 # Center of icon area
+        icon_y = y + item_h // 2
+        
+        self._draw_icon(draw, item['label'], icon_x, icon_y, size=icon_size, target_image=target_image)
+        
+        # Draw Text
+        draw_text(draw, (50, y + 5), item['label'], font=self.font, fill=text_color)
 
 # Alias for backward compatibility
 Menu = ListMenu
 
 class StatusBar:
+    # Rendered into its own layer, re-rendered only when what it shows
+    # changes (minute, WiFi, weather temp, icons) and pasted on every frame.
     def __init__(self):
         self.height = config.TOP_BAR_HEIGHT
         self.font = load_font(12, bold=True)
         self.last_update = 0
+        self.layer = Image.new("RGB", (config.DISPLAY_WIDTH, self.height + 1), "black")
+        self.layer_state = None
+        self.renders = 0
+        
+    def next_redraw(self):
+        # Clock changes on the minute; poll WiFi/weather state every few seconds
+        return min(60 - clock.wall_time() % 60, 5)
+        
+    def get_rect(self):
+        return (0, 0, config.DISPLAY_WIDTH, self.height + 1)
         
     def draw(self, draw, target_image=None):
+        # Returns True when the content changed since the last call
+        state = (clock.strftime("%H:%M"), config.WIFI_CONNECTED, config.WEATHER_TEMP, icon_cache.check())
+        changed = state != self.layer_state
+        
+        if target_image is None:
+            self._render(draw, None, state[0])
+            return changed
+            
+        if changed:
+            self.layer_state = state
+            self.renders += 1
+            self._render(ImageDraw.Draw(self.layer), self.layer, state[0])
+        target_image.paste(self.layer, (0, 0))
+        return changed
+        
+    def _render(self, draw, target_image, t_str):
         # Draw Background
         draw.rectangle((0, 0, config.DISPLAY_WIDTH, self.height), fill="black")
         
         # Draw Time (Right)
-        t_str = time.strftime("%H:%M")
-        bbox = draw.textbbox((0, 0), t_str, font=self.font)
+        bbox = text_bbox(t_str, self.font)
         w = bbox[2] - bbox[0]
-        draw.text((config.DISPLAY_WIDTH - w - 5, 5), t_str, font=self.font, fill="white")
+        draw_text(draw, (config.DISPLAY_WIDTH - w - 5, 5), t_str, font=self.font, fill="white")
         
         # Draw WiFi (Left)
         # We can check config.WIFI_CONNECTED
@@ -286,7 +1020,7 @@ class StatusBar:
         if config.WEATHER_TEMP:
             # Draw Temp
             temp_str = f"{config.WEATHER_TEMP}"
-            draw.text((35, 5), temp_str, font=self.font, fill="white")
+            draw_text(draw, (35, 5), temp_str, font=self.font, fill="white")
             
             # Draw Icon if available
             # We might need a mapping from OWM icon to our local icons
@@ -294,8 +1028,6 @@ class StatusBar:
             pass
 
     def _draw_icon(self, draw, name, cx, cy, size=16, target_image=None):
-        import os
-        
         # Check Config Mapping first
         icon_name = config.ICONS.get(name.lower().replace(" ", "_"), None)
         
@@ -310,16 +1042,10 @@ class StatusBar:
         if not icon_name.endswith('.png'):
             icon_name += ".png"
             
-        icon_path = f"assets/icons/{icon_name}"
-        
-        if os.path.exists(icon_path) and target_image:
-            try:
-                icon = Image.open(icon_path).convert("RGBA")
-                icon.thumbnail((size, size))
-                w, h = icon.size
-                target_image.paste(icon, (int(cx - w/2), int(cy - h/2)), icon)
-            except:
-                pass
+        icon = icon_cache.get(icon_name, size) if target_image else None
+        if icon:
+            w, h = icon.size
+            target_image.paste(icon, (int(cx - w/2), int(cy - h/2)), icon)
         else:
             # Fallback
             if "wifi" in name:
@@ -336,6 +1062,7 @@ class Keyboard:
         
         self.font = load_font(config.FONT_SIZE_NORMAL)
         self.font_large = load_font(config.FONT_SIZE_LARGE, bold=True)
+        self.font_small = load_font(12)
         
         self.layout_lower = [
             list("1234567890"),
@@ -355,6 +1082,13 @@ class Keyboard:
         
         self.current_layout = self.layout_lower
         self._flatten_layout()
+        
+        top = config.TOP_BAR_HEIGHT
+        self.screen = Screen(background=(20, 20, 20))
+        self.field = self.screen.add(Label((10, top + 10, config.DISPLAY_WIDTH - 9, top + 51), "|", self.font,
+                                           color="black", bg="white", padding=(5, 5)))
+        self.grid = self.screen.add(KeyGrid((0, top + 60, config.DISPLAY_WIDTH, top + 60 + 5 * 30),
+                                            self.current_layout, self.font, self.font_small))
 
     def _flatten_layout(self):
         self.flat_keys = []
@@ -366,17 +1100,21 @@ class Keyboard:
         self.active = True
         self.text = ""
         self.selected_index = 0
+        self.screen.invalidate() # Something else was on screen meanwhile
 
     def move_selection(self, delta):
         self.selected_index = (self.selected_index + delta) % len(self.flat_keys)
 
+    def backspace(self):
+        self.text = self.text[:-1]
+
     def select_current(self):
         key = self.flat_keys[self.selected_index]['key']
         
         if key == "SPACE":
             self.text += " "
         elif key == "DEL":
-            self.text = self.text[:-1]
+            self.backspace()
         elif key == "DONE":
             self.active = False
             self.on_done(self.text)
@@ -387,50 +1125,9 @@ class Keyboard:
         else:
             self.text += key
 
-    def draw(self, draw):
-        draw.rectangle((0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), fill=(20, 20, 20))
-        draw.rectangle((10, config.TOP_BAR_HEIGHT + 10, config.DISPLAY_WIDTH - 10, config.TOP_BAR_HEIGHT + 50), fill="white")
-        draw.text((15, config.TOP_BAR_HEIGHT + 15), self.text + "|", font=self.font, fill="black")
-        
-        start_y = config.TOP_BAR_HEIGHT + 60
-        key_width = config.DISPLAY_WIDTH // 10
-        key_height = 30
-        
-        # Draw all keys
-        for i, item in enumerate(self.flat_keys):
-            r = item['r']
-            c = item['c']
-            key = item['key']
-            
-            # Calculate Position
-            row_len = len(self.current_layout[r])
-            row_width = row_len * key_width
-            start_x = (config.DISPLAY_WIDTH - row_width) // 2
-            
-            if r == len(self.current_layout) - 1: # Bottom row
-                key_width_special = config.DISPLAY_WIDTH // 4
-                start_x = 0
-                x = c * key_width_special
-                w = key_width_special
-            else:
-                x = start_x + c * key_width
-                w = key_width
-            
-            y = start_y + r * key_height
-            
-            # Highlight
-            if i == self.selected_index:
-                draw.rectangle((x + 2, y + 2, x + w - 2, y + key_height - 2), fill=config.COLOR_ACCENT)
-                color = "white"
-            else:
-                draw.rectangle((x + 2, y + 2, x + w - 2, y + key_height - 2), outline=(100, 100, 100))
-                color = (200, 200, 200)
-            
-            font = self.font
-            if len(key) > 1: font = load_font(12)
-            
-            bbox = draw.textbbox((0, 0), key, font=font)
-            text_w = bbox[2] - bbox[0]
-            text_h = bbox[3] - bbox[1]
-            
-            draw.text((x + (w - text_w) // 2, y + (key_height - text_h) // 2 - 2), key, font=font, fill=color)
+    def draw(self, draw, target_image=None):
+        # Returns the regions that were repainted (see Screen.render)
+        self.field.set(text=self.text + "|")
+        self.grid.set(layout=self.current_layout)
+        self.grid.select(self.selected_index)
+        return self.screen.render(target_image)
@@ -4,6 +4,8 @@ import math
 from PIL import ImageDraw
 import config
 from core import highscore
+from core.timestep import FixedTimestep
+from core.glyph_atlas import draw_text
 
 class App:
     def __init__(self, display, input_manager):
@@ -18,12 +20,14 @@ class App:
         self.ball_size = 8
         
         self.level = 1
+        self.timestep = FixedTimestep()
         self.reset_game()
 
     def reset_game(self):
         self.level = 1
         self.score = 0
         self.reset_level()
+        self.timestep.reset()
 
     def reset_level(self):
         self.paddle_w = 60 # Reset width
@@ -80,6 +84,10 @@ class App:
         self.paddle_x = max(0, min(config.DISPLAY_WIDTH - self.paddle_w, self.paddle_x))
 
     def update(self):
+        for _ in range(self.timestep.advance()):
+            self.step()
+
+    def step(self):
         if self.game_over: return
 
         # Update Balls
@@ -196,16 +204,16 @@ class App:
                 elif p['type'] == 'MULTI': color = "red"
                 
                 draw.ellipse((p['x']-5, p['y']-5, p['x']+5, p['y']+5), fill=color)
-                draw.text((p['x']-3, p['y']-6), p['type'][0], fill="white", font=None) # Simple letter
+                draw_text(draw, (p['x']-3, p['y']-6), p['type'][0], fill="white", font=None) # Simple letter
                     
             # Score
-            draw.text((10, 10), f"Score: {self.score}", fill="white")
-            draw.text((config.DISPLAY_WIDTH - 60, 10), f"Level: {self.level}", fill="white")
+            draw_text(draw, (10, 10), f"Score: {self.score}", fill="white")
+            draw_text(draw, (config.DISPLAY_WIDTH - 60, 10), f"Level: {self.level}", fill="white")
         else:
-            draw.text((60, 100), "GAME OVER", fill=config.COLOR_WARNING)
-            draw.text((70, 140), f"Score: {self.score}", fill=config.COLOR_TEXT)
-            draw.text((50, 240), "Press Select to Restart", fill=(100, 100, 100))
-            draw.text((60, 260), "Hold Back to Exit", fill=(100, 100, 100))
+            draw_text(draw, (60, 100), "GAME OVER", fill=config.COLOR_WARNING)
+            draw_text(draw, (70, 140), f"Score: {self.score}", fill=config.COLOR_TEXT)
+            draw_text(draw, (50, 240), "Press Select to Restart", fill=(100, 100, 100))
+            draw_text(draw, (60, 260), "Hold Back to Exit", fill=(100, 100, 100))
 
     def handle_input(self, event):
         if self.game_over:
@@ -223,3 +231,8 @@ class App:
             return False
             
         return True
+
+    def handle_rotate(self, event):
+        # Paddle moves in proportion to the whole burst
+        if not self.game_over:
+            self.move_paddle(20 * event['steps'])
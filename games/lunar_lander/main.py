@@ -1,9 +1,11 @@
-import time
 import math
 import random
 from PIL import ImageDraw
 import config
 from core import highscore
+from core import clock
+from core.timestep import FixedTimestep
+from core.glyph_atlas import draw_text
 
 class App:
     def __init__(self, display, input_manager):
@@ -14,6 +16,7 @@ class App:
         self.score = 0
         
         self.level = 1
+        self.timestep = FixedTimestep()
         self.reset_game()
 
     def reset_game(self):
@@ -44,8 +47,13 @@ class App:
         
         self.last_input = None
         self.last_input_time = 0
+        self.timestep.reset()
 
     def update(self):
+        for _ in range(self.timestep.advance()):
+            self.step()
+
+    def step(self):
         if self.game_over: return
 
         # Physics
@@ -98,26 +106,26 @@ class App:
             draw.polygon([(tip_x, tip_y), (left_x, left_y), (right_x, right_y)], fill="white", outline="white")
             
             # HUD
-            draw.text((10, 10), f"FUEL: {int(self.fuel)}", fill="white")
-            draw.text((10, 25), f"ALT: {int(self.pad_y - self.y)}", fill="white")
-            draw.text((config.DISPLAY_WIDTH - 60, 10), f"LVL: {self.level}", fill="white")
-            draw.text((config.DISPLAY_WIDTH - 60, 25), f"VY: {self.vy:.1f}", fill="white")
+            draw_text(draw, (10, 10), f"FUEL: {int(self.fuel)}", fill="white")
+            draw_text(draw, (10, 25), f"ALT: {int(self.pad_y - self.y)}", fill="white")
+            draw_text(draw, (config.DISPLAY_WIDTH - 60, 10), f"LVL: {self.level}", fill="white")
+            draw_text(draw, (config.DISPLAY_WIDTH - 60, 25), f"VY: {self.vy:.1f}", fill="white")
             
             # Debug Input
-            if self.last_input and time.time() - self.last_input_time < 0.5:
-                draw.text((config.DISPLAY_WIDTH // 2, 50), self.last_input, fill="yellow")
+            if self.last_input and clock.monotonic() - self.last_input_time < 0.5:
+                draw_text(draw, (config.DISPLAY_WIDTH // 2, 50), self.last_input, fill="yellow")
             
         else:
             if self.landed:
-                draw.text((60, 100), "SUCCESS!", fill="green")
-                draw.text((70, 140), f"Score: {self.score}", fill="white")
-                draw.text((50, 240), "Press Select for Next Level", fill=(100, 100, 100))
+                draw_text(draw, (60, 100), "SUCCESS!", fill="green")
+                draw_text(draw, (70, 140), f"Score: {self.score}", fill="white")
+                draw_text(draw, (50, 240), "Press Select for Next Level", fill=(100, 100, 100))
             else:
-                draw.text((60, 100), "CRASHED!", fill="red")
-                draw.text((70, 140), f"Score: {self.score}", fill="white")
-                draw.text((50, 240), "Press Select to Restart", fill=(100, 100, 100))
+                draw_text(draw, (60, 100), "CRASHED!", fill="red")
+                draw_text(draw, (70, 140), f"Score: {self.score}", fill="white")
+                draw_text(draw, (50, 240), "Press Select to Restart", fill=(100, 100, 100))
                 
-            draw.text((60, 260), "Hold Back to Exit", fill=(100, 100, 100))
+            draw_text(draw, (60, 260), "Hold Back to Exit", fill=(100, 100, 100))
 
     def handle_input(self, event):
         if self.game_over:
@@ -134,12 +142,12 @@ class App:
         if event == 'left':
             self.angle -= 10
             self.last_input = "LEFT"
-            self.last_input_time = time.time()
+            self.last_input_time = clock.monotonic()
             print(f"DEBUG: Lander Left. Angle: {self.angle}")
         elif event == 'right':
             self.angle += 10
             self.last_input = "RIGHT"
-            self.last_input_time = time.time()
+            self.last_input_time = clock.monotonic()
             print(f"DEBUG: Lander Right. Angle: {self.angle}")
         elif event == 'select':
             # Thrust Burst
@@ -149,7 +157,7 @@ class App:
                 self.vx += self.thrust_power * math.cos(rad) * 5 # Burst multiplier
                 self.vy += self.thrust_power * math.sin(rad) * 5
                 self.last_input = "THRUST"
-                self.last_input_time = time.time()
+                self.last_input_time = clock.monotonic()
         elif event == 'back':
             return False
             
@@ -3,7 +3,9 @@ import random
 from PIL import ImageDraw
 import config
 from core import highscore
+from core.timestep import FixedTimestep
 from core.ui import Menu
+from core.glyph_atlas import draw_text
 
 class App:
     def __init__(self, display, input_manager):
@@ -29,6 +31,7 @@ class App:
         ], title="Points")
         
         self.win_score = 5
+        self.timestep = FixedTimestep()
         self.reset_game()
 
     def set_difficulty(self, name, factor):
@@ -64,6 +67,7 @@ class App:
         self.score_player = 0
         self.score_ai = 0
         self.game_over = False
+        self.timestep.reset()
 
     def move_player(self, dx):
         if self.game_over: return
@@ -78,6 +82,10 @@ class App:
             self.menu_points.update()
             return
 
+        for _ in range(self.timestep.advance()):
+            self.step()
+
+    def step(self):
         if self.game_over:
             return
 
@@ -158,14 +166,14 @@ class App:
             draw.ellipse((self.ball_pos[0], self.ball_pos[1], self.ball_pos[0]+self.ball_size, self.ball_pos[1]+self.ball_size), fill=config.COLOR_TEXT)
             
             # Draw Scores
-            draw.text((10, config.DISPLAY_HEIGHT // 2), str(self.score_player), fill=config.COLOR_ACCENT)
-            draw.text((config.DISPLAY_WIDTH - 20, config.DISPLAY_HEIGHT // 2), str(self.score_ai), fill=config.COLOR_WARNING)
+            draw_text(draw, (10, config.DISPLAY_HEIGHT // 2), str(self.score_player), fill=config.COLOR_ACCENT)
+            draw_text(draw, (config.DISPLAY_WIDTH - 20, config.DISPLAY_HEIGHT // 2), str(self.score_ai), fill=config.COLOR_WARNING)
         else:
             res = "YOU WIN" if self.score_player > self.score_ai else "YOU LOSE"
-            draw.text((80, 100), res, fill=config.COLOR_TEXT)
-            draw.text((70, 140), f"{self.score_player} - {self.score_ai}", fill=config.COLOR_TEXT)
-            draw.text((50, 240), "Press Select to Menu", fill=(100, 100, 100))
-            draw.text((60, 260), "Hold Back to Exit", fill=(100, 100, 100))
+            draw_text(draw, (80, 100), res, fill=config.COLOR_TEXT)
+            draw_text(draw, (70, 140), f"{self.score_player} - {self.score_ai}", fill=config.COLOR_TEXT)
+            draw_text(draw, (50, 240), "Press Select to Menu", fill=(100, 100, 100))
+            draw_text(draw, (60, 260), "Hold Back to Exit", fill=(100, 100, 100))
 
     def handle_input(self, event):
         if self.state == "menu_difficulty":
@@ -193,5 +201,12 @@ class App:
         
         return True # Default consumed
 
+    def handle_rotate(self, event):
+        if self.state == "game":
+            self.move_player(20 * event['steps']) # Proportional to the whole burst
+        else:
+            for _ in range(abs(event['raw_steps'])):
+                self.handle_input(event['name'])
+
     def stop(self):
         self.running = False
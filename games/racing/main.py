@@ -4,8 +4,12 @@ import math
 from PIL import ImageDraw
 import config
 from core import highscore
+from core.timestep import FixedTimestep
+from core.glyph_atlas import draw_text
 
 class App:
+    target_fps = 30
+
     def __init__(self, display, input_manager):
         self.display = display
         self.input = input_manager
@@ -32,6 +36,7 @@ class App:
         self.next_level_score = 50
         self.level_up_timer = 0
         
+        self.timestep = FixedTimestep()
         self.reset_game()
 
     def reset_game(self):
@@ -50,8 +55,13 @@ class App:
         self.next_level_score = 50
         self.max_speed = 100
         self.level_up_timer = 0
+        self.timestep.reset()
 
     def update(self):
+        for _ in range(self.timestep.advance()):
+            self.step()
+
+    def step(self):
         if self.game_over: return
 
         # Auto-accelerate
@@ -67,7 +77,7 @@ class App:
             self.level += 1
             self.next_level_score += 50
             self.max_speed += 20
-            self.level_up_timer = 60 # Show message for 60 frames
+            self.level_up_timer = 60 # Show message for 60 steps
             
         if self.level_up_timer > 0:
             self.level_up_timer -= 1
@@ -221,19 +231,19 @@ class App:
             draw.rectangle((player_screen_x + car_w/2 - 2, car_y - 8, player_screen_x + car_w/2 + 2, car_y), fill="black")
             
             # HUD
-            draw.text((10, 10), f"SCORE: {self.score}", fill="white")
-            draw.text((10, 30), f"SPEED: {int(self.speed)}", fill="white")
-            draw.text((config.DISPLAY_WIDTH - 80, 10), f"LEVEL: {self.level}", fill="yellow")
+            draw_text(draw, (10, 10), f"SCORE: {self.score}", fill="white")
+            draw_text(draw, (10, 30), f"SPEED: {int(self.speed)}", fill="white")
+            draw_text(draw, (config.DISPLAY_WIDTH - 80, 10), f"LEVEL: {self.level}", fill="yellow")
             
             if self.level_up_timer > 0:
                 if (self.level_up_timer // 5) % 2 == 0: # Blink
-                    draw.text((config.DISPLAY_WIDTH // 2 - 40, 100), "LEVEL UP!", fill="yellow", font=None) # Need large font but don't have access to Menu font easily. Default is fine.
+                    draw_text(draw, (config.DISPLAY_WIDTH // 2 - 40, 100), "LEVEL UP!", fill="yellow", font=None) # Need large font but don't have access to Menu font easily. Default is fine.
 
         else:
-            draw.text((60, 100), "GAME OVER", fill=config.COLOR_WARNING)
-            draw.text((70, 140), f"Score: {self.score}", fill=config.COLOR_TEXT)
-            draw.text((50, 240), "Press Select to Restart", fill=(100, 100, 100))
-            draw.text((60, 260), "Hold Back to Exit", fill=(100, 100, 100))
+            draw_text(draw, (60, 100), "GAME OVER", fill=config.COLOR_WARNING)
+            draw_text(draw, (70, 140), f"Score: {self.score}", fill=config.COLOR_TEXT)
+            draw_text(draw, (50, 240), "Press Select to Restart", fill=(100, 100, 100))
+            draw_text(draw, (60, 260), "Hold Back to Exit", fill=(100, 100, 100))
 
     def handle_input(self, event):
         if self.game_over:
@@ -251,3 +261,10 @@ class App:
             return False
             
         return True
+
+    def handle_rotate(self, event):
+        # Whole burst at once; turning with the button held steers twice as hard
+        if self.game_over:
+            return
+        per_step = 0.4 if event['pressed'] else 0.2
+        self.player_x += per_step * event['raw_steps']
@@ -3,7 +3,9 @@ import random
 from PIL import ImageDraw
 import config
 from core import highscore
+from core.timestep import FixedTimestep
 from core.ui import Menu
+from core.glyph_atlas import draw_text
 
 class App:
     def __init__(self, display, input_manager):
@@ -28,6 +30,15 @@ class App:
         self.food = (0, 0)
         self.direction = (0, -1)
         self.last_move_dir = (0, -1) # Direction of the last frame
+        self.speed = 0.15 # Seconds per move
+        self.timestep = FixedTimestep(1.0 / self.speed)
+
+    @property
+    def target_fps(self):
+        # The snake moves one cell per update, so the frame rate is its speed
+        if self.state == "game":
+            return 1.0 / self.speed
+        return 30
 
     def start_game(self, wall_mode):
         self.wall_mode = wall_mode
@@ -42,6 +53,8 @@ class App:
         self.food = self._spawn_food()
         self.score = 0
         self.speed = 0.15
+        self.timestep.set_rate(1.0 / self.speed)
+        self.timestep.reset()
 
     def _spawn_food(self):
         while True:
@@ -66,6 +79,11 @@ class App:
         self.direction = new_dir
 
     def update(self):
+        # One move every self.speed seconds, however fast frames are drawn
+        for _ in range(self.timestep.advance()):
+            self.step()
+
+    def step(self):
         if self.state != "game":
             return
 
@@ -96,6 +114,7 @@ class App:
             self.score += 1
             self.food = self._spawn_food()
             self.speed = max(0.05, self.speed * 0.98)
+            self.timestep.set_rate(1.0 / self.speed)
         else:
             self.snake.pop(0)
 
@@ -112,7 +131,7 @@ class App:
         
         if self.state == "menu":
             self.menu.update()
-            self.menu.draw(draw)
+            self.menu.draw(draw, self.display.get_image())
             
         elif self.state == "game":
             # Draw Snake
@@ -131,14 +150,14 @@ class App:
             )
             
             # Draw Score
-            draw.text((5, 5), f"Score: {self.score}", fill=config.COLOR_TEXT)
+            draw_text(draw, (5, 5), f"Score: {self.score}", fill=config.COLOR_TEXT)
             
         elif self.state == "game_over":
-            draw.text((60, 100), "GAME OVER", font=self.display.draw.font, fill=config.COLOR_WARNING)
-            draw.text((70, 140), f"Score: {self.score}", fill=config.COLOR_TEXT)
-            draw.text((40, 180), f"High: {highscore.get_highscore('snake')}", fill=config.COLOR_ACCENT)
-            draw.text((50, 240), "Press Select to Menu", fill=(100, 100, 100))
-            draw.text((60, 260), "Hold Back to Exit", fill=(100, 100, 100))
+            draw_text(draw, (60, 100), "GAME OVER", font=self.display.draw.font, fill=config.COLOR_WARNING)
+            draw_text(draw, (70, 140), f"Score: {self.score}", fill=config.COLOR_TEXT)
+            draw_text(draw, (40, 180), f"High: {highscore.get_highscore('snake')}", fill=config.COLOR_ACCENT)
+            draw_text(draw, (50, 240), "Press Select to Menu", fill=(100, 100, 100))
+            draw_text(draw, (60, 260), "Hold Back to Exit", fill=(100, 100, 100))
 
     def stop(self):
         self.running = False
@@ -3,6 +3,8 @@ import random
 from PIL import ImageDraw
 import config
 from core import highscore
+from core.timestep import FixedTimestep
+from core.glyph_atlas import draw_text
 
 class App:
     def __init__(self, display, input_manager):
@@ -10,15 +12,18 @@ class App:
         self.input = input_manager
         self.running = True
         self.game_over = False
+        self.paused = False # Double click pauses; a long press there exits
         self.score = 0
         
         self.wave = 1
+        self.timestep = FixedTimestep()
         self.reset_game()
 
     def reset_game(self):
         self.wave = 1
         self.score = 0
         self.reset_wave()
+        self.timestep.reset()
 
     def reset_wave(self):
         self.player_x = config.DISPLAY_WIDTH // 2
@@ -54,7 +59,18 @@ class App:
         self.game_over = False
         self.win = False
 
+    @property
+    def hold_repeat(self):
+        # Hold the button for auto-fire during play (see core/gestures.py).
+        # Paused or game over, a long press is 'back' again.
+        return not (self.paused or self.game_over)
+
     def update(self):
+        if self.paused: return
+        for _ in range(self.timestep.advance()):
+            self.step()
+
+    def step(self):
         if self.game_over: return
 
         # Move Bullets
@@ -123,13 +139,18 @@ class App:
                 draw.rectangle((b['x'] - 1, b['y'], b['x'] + 1, b['y'] + 5), fill="yellow")
                 
             # Score
-            draw.text((10, 10), f"SCORE: {self.score}", fill="white")
-            draw.text((config.DISPLAY_WIDTH - 60, 10), f"WAVE: {self.wave}", fill="white")
+            draw_text(draw, (10, 10), f"SCORE: {self.score}", fill="white")
+            draw_text(draw, (config.DISPLAY_WIDTH - 60, 10), f"WAVE: {self.wave}", fill="white")
+            
+            if self.paused:
+                draw_text(draw, (85, 120), "PAUSED", fill=config.COLOR_WARNING)
+                draw_text(draw, (50, 240), "Press Select to Resume", fill=(100, 100, 100))
+                draw_text(draw, (60, 260), "Hold Back to Exit", fill=(100, 100, 100))
         else:
-            draw.text((60, 100), "GAME OVER", fill=config.COLOR_WARNING)
-            draw.text((70, 140), f"Score: {self.score}", fill=config.COLOR_TEXT)
-            draw.text((50, 240), "Press Select to Restart", fill=(100, 100, 100))
-            draw.text((60, 260), "Hold Back to Exit", fill=(100, 100, 100))
+            draw_text(draw, (60, 100), "GAME OVER", fill=config.COLOR_WARNING)
+            draw_text(draw, (70, 140), f"Score: {self.score}", fill=config.COLOR_TEXT)
+            draw_text(draw, (50, 240), "Press Select to Restart", fill=(100, 100, 100))
+            draw_text(draw, (60, 260), "Hold Back to Exit", fill=(100, 100, 100))
 
     def handle_input(self, event):
         if self.game_over:
@@ -139,6 +160,14 @@ class App:
                 return False
             return True
 
+        if self.paused:
+            if event == 'select':
+                self.paused = False
+                self.timestep.reset() # Don't simulate the time spent paused
+            elif event == 'back':
+                return False
+            return True
+
         if event == 'left':
             self.player_x -= 10
             self.player_x = max(self.player_w//2, self.player_x)
@@ -146,9 +175,22 @@ class App:
             self.player_x += 10
             self.player_x = min(config.DISPLAY_WIDTH - self.player_w//2, self.player_x)
         elif event == 'select':
-            # Shoot
-            self.bullets.append({'x': self.player_x, 'y': self.player_y - 5})
+            self.shoot()
         elif event == 'back':
             return False
             
         return True
+
+    def handle_gesture(self, name):
+        if self.game_over or self.paused:
+            return False
+        if name == 'repeat':
+            self.shoot() # Auto-fire while held
+            return True
+        if name == 'double_click':
+            self.paused = True # Holding can't exit during play: pause first
+            return True
+        return False
+
+    def shoot(self):
+        self.bullets.append({'x': self.player_x, 'y': self.player_y - 5})
@@ -5,10 +5,12 @@ import logging
 from core.display import DisplayManager
 from core.input import InputManager
 from core.app_manager import AppManager
-from core.haptic import HapticManager
+from core.haptic import HapticManager, double_pulse, ramp
 import threading
-from webui.app import app as web_app
+import random
+import hashlib
 import config
+from core import clock
 
 # Setup Logging
 try:
@@ -46,6 +48,15 @@ logger = logging.getLogger(__name__)
 def main():
     parser = argparse.ArgumentParser(description='Raspberry Pi Handheld OS')
     parser.add_argument('--sim', action='store_true', help='Run in simulation mode on PC')
+    parser.add_argument('--headless', action='store_true', help='Run without display or window (offscreen framebuffer)')
+    parser.add_argument('--input-script', help='Scripted input file: "<seconds> <event>" per line')
+    parser.add_argument('--record', help='Record the input session (and RNG seed) to this script file')
+    parser.add_argument('--seed', type=int, help='Seed the RNG (default: the seed stored in --input-script)')
+    parser.add_argument('--fast', action='store_true', help='Replay --input-script headless on a virtual clock, as fast as possible')
+    parser.add_argument('--frames', type=int, default=0, help='Exit after this many frames (0 = run forever)')
+    parser.add_argument('--fake-panel', action='store_true', help='Drive a simulated ST7789 instead of the SPI hardware')
+    parser.add_argument('--latency-out', help='Write input-to-photon latency stats (JSON) here on exit')
+    parser.add_argument('--calibrate-spi', action='store_true', help='Find the fastest stable SPI clock and save it')
     args = parser.parse_args()
 
     logger.info(f"Python: {sys.executable}")
@@ -56,8 +67,22 @@ def main():
     except Exception as e:
         logger.info(f"GPIOZero Factory Error: {e}")
 
+    if args.fast:
+        if not args.input_script:
+            parser.error('--fast needs --input-script')
+        args.headless = True
+        
+    # No real display or window: no pygame, Web UI or boot delays either
+    offscreen = args.headless or args.fake_panel
+    if offscreen:
+        args.sim = True
+
     # Initialize Core Systems
-    display = DisplayManager(simulate=args.sim)
+    panel = None
+    if args.fake_panel:
+        from core.fake_panel import FakeST7789
+        panel = FakeST7789(realtime=True)
+    display = DisplayManager(simulate=args.sim, headless=args.headless, panel=panel)
     
     # If Display failed to load hardware, force simulation for everything else
     if display.simulate and not args.sim:
@@ -71,7 +96,27 @@ def main():
     haptic.vibrate(0.5)
     
     input_manager = InputManager(simulate=args.sim)
+    if args.input_script:
+        input_manager.load_script(args.input_script)
+        
+    # Games use the random module: a fixed seed makes replays reproducible
+    seed = args.seed if args.seed is not None else input_manager.script_seed
+    if seed is None and args.record:
+        seed = random.randrange(2 ** 31)
+    if seed is not None:
+        print(f"RNG seed: {seed}")
+        random.seed(seed)
+        
+    if offscreen:
+        # kill -USR1 <pid> dumps the next frame to a PNG
+        import signal
+        signal.signal(signal.SIGUSR1, lambda signum, frame: display.request_capture())
     
+    if args.calibrate_spi:
+        calibrate_spi(display, input_manager)
+        display.cleanup()
+        return
+
     # Bind Haptics to Input Events
     # We want subtle clicks on rotation and bumps on selection
     input_manager.on_any_event = lambda event_type: haptic_feedback(haptic, event_type)
@@ -85,27 +130,42 @@ def main():
         draw.text((80, 140), "BOOTING...", fill=(0, 255, 213))
         draw.rectangle((70, 170, 70 + (i * 10), 180), fill=(0, 255, 213))
         display.show()
-        time.sleep(0.1)
+        if not offscreen:
+            time.sleep(0.1)
     
-    # Start Web UI
-    print("Starting Web UI...")
-    def run_web():
-        try:
-            # Try port 80 first (requires root)
-            web_app.run(host='0.0.0.0', port=80, debug=False, use_reloader=False)
-        except:
-            print("Port 80 failed, trying 5000")
-            web_app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False)
-            
-    web_thread = threading.Thread(target=run_web, daemon=True)
-    web_thread.start()
+    # Start Web UI (not on offscreen build boxes)
+    if not offscreen:
+        print("Starting Web UI...")
+        def run_web():
+            from webui.app import app as web_app
+            try:
+                # Try port 80 first (requires root)
+                web_app.run(host='0.0.0.0', port=80, debug=False, use_reloader=False)
+            except:
+                print("Port 80 failed, trying 5000")
+                web_app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False)
+                
+        web_thread = threading.Thread(target=run_web, daemon=True)
+        web_thread.start()
 
+    if args.fast:
+        # Frame-for-frame deterministic: the main loop advances time itself
+        clock.use_virtual()
+        
     # Initialize App Manager
     app_manager = AppManager(display, input_manager)
     
+    # kill -USR2 <pid> prints input-to-photon latency per app (also at /latency on the Web UI)
+    import signal
+    signal.signal(signal.SIGUSR2, lambda signum, frame: print(app_manager.latency.report()))
+    
+    if args.record:
+        input_manager.start_recording(seed)
+        
     # Start Main Loop
+    wall_start = time.perf_counter()
     try:
-        app_manager.run()
+        app_manager.run(max_frames=args.frames)
     except KeyboardInterrupt:
         print("Shutting down...")
     except Exception as e:
@@ -114,16 +174,78 @@ def main():
         traceback.print_exc()
     finally:
         # Cleanup
+        display.cleanup()
+        if offscreen:
+            print_frame_stats(display, app_manager)
+        if args.fast:
+            wall = time.perf_counter() - wall_start
+            frames = display.get_stats()['show_calls']
+            print(f"Replay: {frames} frames in {wall:.2f} s ({wall * 1000 / max(1, frames):.2f} ms/frame), "
+                  f"{clock.monotonic():.1f} s of session time")
+        if args.record:
+            input_manager.save_recording(args.record)
+        if args.latency_out:
+            app_manager.latency.export(args.latency_out)
         if not args.sim:
             haptic.cleanup()
 
+def calibrate_spi(display, input_manager):
+    # User confirms each speed: Select = pattern looks clean, Back (hold) = glitches
+    answer = {}
+    done = threading.Event()
+    
+    def respond(ok):
+        answer['ok'] = ok
+        done.set()
+    
+    input_manager.clear_callbacks()
+    input_manager.on('select', lambda: respond(True))
+    input_manager.on('back', lambda: respond(False))
+    
+    def confirm(hz):
+        answer.clear()
+        done.clear()
+        print(f"{hz / 1e6:.1f} MHz: Select if the pattern is clean, hold Back if not")
+        # No answer within 15s counts as a failure
+        deadline = time.monotonic() + 15
+        while not done.is_set() and time.monotonic() < deadline:
+            input_manager.dispatch_events()
+            done.wait(0.02)
+        return answer.get('ok', False)
+    
+    best = display.calibrate_spi(confirm=confirm)
+    if best:
+        print(f"Fastest stable SPI clock: {best / 1e6:.1f} MHz (saved to config.json)")
+        config.save_config({'display_baudrate': best})
+    else:
+        print("SPI calibration did not find a stable speed. Config unchanged.")
+
+def print_frame_stats(display, app_manager):
+    stats = display.get_stats()
+    calls = max(1, stats['show_calls'])
+    print(f"Frames: {stats['show_calls']}, "
+          f"avg show(): {stats['show_ms_total'] / calls:.2f} ms, "
+          f"bytes sent: {stats['bytes_sent']}, saved: {stats['bytes_saved']}")
+    pacing = app_manager.get_frame_stats()
+    print(f"Pacing: {pacing['fps']:.1f} fps (target {pacing['target_fps']:.1f}), "
+          f"jitter {pacing['jitter_ms']:.1f} ms, skipped draws {pacing['skipped_draws']}")
+    queue = app_manager.input.get_queue_stats()
+    print(f"Input: {queue['dispatched']} events, max queue depth {queue['max_depth']}, "
+          f"age avg {queue['avg_age_ms']:.1f} ms / max {queue['max_age_ms']:.1f} ms, dropped {queue['dropped']}")
+    # Same replay + seed must give the same final frame
+    print(f"Final frame: {hashlib.md5(display.get_image().tobytes()).hexdigest()}")
+    print("Input-to-photon latency:")
+    print(app_manager.latency.report())
+
 def haptic_feedback(haptic, event_type):
     if event_type in ['left', 'right']:
-        haptic.vibrate(config.HAPTIC_DURATION_SHORT, 0.3) # Very subtle tick
+        haptic.vibrate(config.HAPTIC_DURATION_SHORT, 0.3, tick=True) # Very subtle tick
     elif event_type == 'select':
         haptic.vibrate(config.HAPTIC_DURATION_SHORT, 0.6) # Distinct click
+    elif event_type == 'double_click':
+        haptic.play(double_pulse(config.HAPTIC_DURATION_SHORT, 0.6))
     elif event_type == 'back':
-        haptic.vibrate(config.HAPTIC_DURATION_LONG, 0.8) # Strong bump
+        haptic.play(ramp(config.HAPTIC_DURATION_LONG, 0.4, 1.0)) # Strong, rising bump
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,50 @@
+import os
+import time
+import struct
+from core.evdev_input import EVENT_FORMAT, EV_SYN, EV_KEY, EV_REL, EV_ABS, KEY_ENTER
+
+# Simulated /dev/input/event* device for exercising core/evdev_input.py without
+# the overlays: a pipe carrying struct input_event records, written the way the
+# rotary-encoder and gpio-keys drivers report them (value + SYN_REPORT).
+
+class FakeEvdevDevice:
+    def __init__(self, name="rotary@11"):
+        self.name = name
+        self.read_fd, self.write_fd = os.pipe()
+        self.position = 0 # For absolute-axis mode
+
+    def fileno(self):
+        return self.read_fd
+
+    def write_event(self, ev_type, code, value, stamp=None):
+        stamp = stamp if stamp is not None else time.monotonic()
+        sec = int(stamp)
+        usec = int(round((stamp - sec) * 1e6))
+        os.write(self.write_fd, struct.pack(EVENT_FORMAT, sec, usec, ev_type, code, value))
+
+    def report(self, ev_type, code, value, stamp=None):
+        # One event followed by SYN_REPORT, like the kernel drivers
+        self.write_event(ev_type, code, value, stamp)
+        self.write_event(EV_SYN, 0, 0, stamp)
+
+    def rotate(self, steps, relative=True, stamp=None):
+        # rotary-encoder: REL_X with relative_axis=1, ABS_X position otherwise
+        if relative:
+            self.report(EV_REL, 0, steps, stamp)
+        else:
+            self.position += steps
+            self.report(EV_ABS, 0, self.position, stamp)
+
+    def press(self, code=KEY_ENTER, stamp=None):
+        self.report(EV_KEY, code, 1, stamp)
+
+    def release(self, code=KEY_ENTER, stamp=None):
+        self.report(EV_KEY, code, 0, stamp)
+
+    def click(self, code=KEY_ENTER):
+        self.press(code)
+        self.release(code)
+
+    def close(self):
+        os.close(self.write_fd)
+        os.close(self.read_fd)
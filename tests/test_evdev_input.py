@@ -0,0 +1,126 @@
+import os
+import time
+import struct
+import tempfile
+import unittest
+import config
+from core import evdev_input
+from core.evdev_input import EvdevReader, EVENT_FORMAT, EV_KEY, KEY_ENTER, KEY_ESC
+from tests.fake_evdev import FakeEvdevDevice
+
+# Decoding paths of the kernel input backend, driven through fake event
+# devices. reader.process() does what the epoll thread does for readable fds.
+
+PROC_DEVICES = """I: Bus=0019 Vendor=0000 Product=0000 Version=0000
+N: Name="rotary@11"
+H: Handlers=event0
+B: EV=5
+
+I: Bus=0019 Vendor=0001 Product=0001 Version=0100
+N: Name="button@16"
+H: Handlers=kbd event1
+B: EV=3
+
+I: Bus=0003 Vendor=046d Product=c52b Version=0111
+N: Name="Logitech USB Receiver"
+H: Handlers=sysrq kbd event2 leds
+B: EV=120013
+"""
+
+class EvdevReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.triggers = []
+        self.encoder = FakeEvdevDevice("rotary@11")
+        self.button = FakeEvdevDevice("button@16")
+        self.reader = EvdevReader(self._trigger, [self.encoder, self.button])
+
+    def tearDown(self):
+        self.reader.stop()
+        self.encoder.close()
+        self.button.close()
+
+    def _trigger(self, event_name, stamp=None, pressed=False):
+        self.triggers.append((event_name, pressed))
+
+    def process(self):
+        self.reader.process(self.reader.fds)
+        got, self.triggers = self.triggers, []
+        return got
+
+    def test_relative_steps(self):
+        self.encoder.rotate(1)
+        self.encoder.rotate(-3)
+        self.assertEqual(self.process(), [('right', False)] + [('left', False)] * 3)
+
+    def test_absolute_axis_reports_position_changes(self):
+        self.encoder.rotate(2, relative=False) # First report only sets the origin
+        self.assertEqual(self.process(), [])
+        self.encoder.rotate(1, relative=False)
+        self.encoder.rotate(-2, relative=False)
+        self.assertEqual(self.process(), [('right', False)] + [('left', False)] * 2)
+
+    def test_event_split_across_reads(self):
+        record = struct.pack(EVENT_FORMAT, 1, 0, evdev_input.EV_REL, 0, 1)
+        os.write(self.encoder.write_fd, record[:5])
+        self.assertEqual(self.process(), [])
+        os.write(self.encoder.write_fd, record[5:])
+        self.assertEqual(self.process(), [('right', False)])
+
+    def test_click_is_select(self):
+        self.button.click()
+        self.assertEqual(self.process(), [('select', False)])
+
+    def test_back_key(self):
+        self.button.press(KEY_ESC)
+        self.button.release(KEY_ESC)
+        self.assertEqual(self.process(), [('back', False)])
+
+    def test_kernel_autorepeat_ignored(self):
+        now = time.monotonic()
+        self.button.press(stamp=now)
+        self.button.report(EV_KEY, KEY_ENTER, 2, now + 0.05)
+        self.button.release(stamp=now + 0.1)
+        self.assertEqual(self.process(), [('select', False)])
+
+    def test_release_after_missed_hold_is_back(self):
+        now = time.monotonic() - 5
+        self.button.press(stamp=now)
+        self.button.release(stamp=now + config.LONG_PRESS_TIME + 0.1)
+        self.assertEqual(self.process(), [('back', False)])
+
+    def test_press_and_turn_across_devices(self):
+        # Separate devices, read in any order: kernel stamps decide
+        now = time.monotonic()
+        self.encoder.rotate(2, stamp=now + 0.02)
+        self.button.press(stamp=now)
+        self.button.release(stamp=now + 0.05)
+        self.assertEqual(self.process(), [('right', True)] * 2)
+
+    def test_reader_thread(self):
+        self.reader.start()
+        self.encoder.rotate(1)
+        deadline = time.monotonic() + 1.0
+        while not self.triggers and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.assertEqual(self.triggers, [('right', False)])
+
+    def test_fake_devices_count_as_complete(self):
+        # Pipes can't be asked with EVIOCGBIT
+        self.assertIsNone(evdev_input.capabilities(self.encoder.fileno()))
+        self.assertEqual(self.reader.capabilities, {'encoder', 'select', 'back'})
+
+class FindDevicesTest(unittest.TestCase):
+    def test_matches_names_and_event_handlers(self):
+        with tempfile.NamedTemporaryFile('w', suffix='devices', delete=False) as f:
+            f.write(PROC_DEVICES)
+        try:
+            paths = evdev_input.find_devices(["rotary", "button"], proc_path=f.name)
+        finally:
+            os.unlink(f.name)
+        self.assertEqual(paths, ['/dev/input/event0', '/dev/input/event1'])
+
+    def test_missing_proc_file(self):
+        self.assertEqual(evdev_input.find_devices(proc_path='/nonexistent/devices'), [])
+
+if __name__ == '__main__':
+    unittest.main()
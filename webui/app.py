@@ -98,5 +98,14 @@ def fetch_entities():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+@app.route('/latency')
+def latency():
+    # Live input-to-photon latency per view (only when running inside the OS process)
+    try:
+        from core.latency import tracker
+    except ImportError:
+        return jsonify({'success': False, 'error': 'Not running inside the OS'})
+    return jsonify({'success': True, 'views': tracker.get_stats()})
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=80, debug=True)